@@ -2,7 +2,11 @@
 Unstructured Document Loader Adapter
 """
 
+import os
+import re
+import tempfile
 import uuid
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
@@ -10,15 +14,60 @@ from core.ports.document_loader import DocumentLoaderPort
 from core.entities.document import Document
 
 
+# 텍스트 정리용 정규식
+_SPACES_RE = re.compile(r' +')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# Unstructured 요소 클래스 이름 -> 텍스트 포맷
+_ELEMENT_TYPE_FORMATS = {
+    'Title': '\n# {}\n',
+    'Header': '\n## {}\n',
+    'ListItem': '• {}',
+    'Table': '\n[표]\n{}\n',
+    'TableChunk': '\n[표]\n{}\n',
+    'NarrativeText': '{}',
+    'Text': '{}',
+    'UncategorizedText': '{}',
+    'CompositeElement': '{}',
+    'Footer': '{}',
+    'FigureCaption': '{}',
+    'Address': '{}',
+    'EmailAddress': '{}',
+    'Image': '{}',
+    'Formula': '{}',
+    'CodeSnippet': '{}',
+    'PageNumber': '{}',
+    'PageBreak': '{}',
+}
+
+
+def _resolve_element_format(element_type: str) -> str:
+    """테이블에 없는 요소 타입의 포맷 결정 (이름 포함 규칙 적용 후 캐시)"""
+    if 'Title' in element_type:
+        fmt = _ELEMENT_TYPE_FORMATS['Title']
+    elif 'Header' in element_type:
+        fmt = _ELEMENT_TYPE_FORMATS['Header']
+    elif 'ListItem' in element_type:
+        fmt = _ELEMENT_TYPE_FORMATS['ListItem']
+    elif 'Table' in element_type:
+        fmt = _ELEMENT_TYPE_FORMATS['Table']
+    else:
+        fmt = '{}'
+    _ELEMENT_TYPE_FORMATS[element_type] = fmt
+    return fmt
+
+
 class UnstructuredLoaderAdapter(DocumentLoaderPort):
     """Unstructured 문서 로더 어댑터"""
     
     def __init__(self):
-        self.supported_extensions = [
+        # 순서가 있는 조회용 tuple과 O(1) 포함 검사용 frozenset
+        self.supported_extensions = (
             '.pdf', '.docx', '.doc', '.pptx', '.ppt', '.xlsx', '.xls',
             '.txt', '.md', '.html', '.htm', '.xml', '.csv', '.tsv',
             '.rtf', '.odt', '.odp', '.ods', '.epub'
-        ]
+        )
+        self._supported_set = frozenset(self.supported_extensions)
         self._check_unstructured_availability()
     
     def _check_unstructured_availability(self):
@@ -38,10 +87,13 @@ class UnstructuredLoaderAdapter(DocumentLoaderPort):
         
         path = Path(file_path)
         
-        if not path.exists():
+        # 존재 확인과 크기 조회를 한 번의 stat 호출로 처리
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
         
-        if path.suffix.lower() not in self.supported_extensions:
+        if path.suffix.lower() not in self._supported_set:
             raise ValueError(f"지원하지 않는 파일 형식: {path.suffix}")
         
         try:
@@ -52,7 +104,7 @@ class UnstructuredLoaderAdapter(DocumentLoaderPort):
             content = self._extract_text_from_elements(elements)
             
             # 메타데이터 생성
-            doc_metadata = self._extract_metadata_from_elements(elements, path)
+            doc_metadata = self._extract_metadata_from_elements(elements, path, st.st_size)
             
             # 사용자 제공 메타데이터 병합
             if metadata:
@@ -78,11 +130,8 @@ class UnstructuredLoaderAdapter(DocumentLoaderPort):
         
         try:
             # 임시 파일로 저장 후 처리
-            import tempfile
-            import os
-            
             file_path = Path(filename)
-            if file_path.suffix.lower() not in self.supported_extensions:
+            if file_path.suffix.lower() not in self._supported_set:
                 raise ValueError(f"지원하지 않는 파일 형식: {file_path.suffix}")
             
             # 임시 파일 생성
@@ -153,11 +202,11 @@ class UnstructuredLoaderAdapter(DocumentLoaderPort):
     
     def get_supported_formats(self) -> List[str]:
         """지원하는 파일 형식 반환"""
-        return self.supported_extensions.copy()
+        return list(self.supported_extensions)
     
     def is_format_supported(self, file_extension: str) -> bool:
         """파일 형식 지원 여부 확인"""
-        return file_extension.lower() in self.supported_extensions
+        return file_extension.lower() in self._supported_set
     
     def _parse_with_unstructured(self, file_path: str) -> List:
         """Unstructured로 문서 파싱"""
@@ -194,32 +243,17 @@ class UnstructuredLoaderAdapter(DocumentLoaderPort):
         text_parts = []
         
         for element in elements:
-            # 요소 타입별 처리
-            element_type = str(type(element).__name__)
             text = str(element).strip()
             
             if not text:
                 continue
             
-            # 제목 요소 처리
-            if 'Title' in element_type:
-                text_parts.append(f"\n# {text}\n")
-            
-            # 부제목 요소 처리
-            elif 'Header' in element_type:
-                text_parts.append(f"\n## {text}\n")
-            
-            # 리스트 요소 처리
-            elif 'ListItem' in element_type:
-                text_parts.append(f"• {text}")
-            
-            # 표 요소 처리
-            elif 'Table' in element_type:
-                text_parts.append(f"\n[표]\n{text}\n")
-            
-            # 일반 텍스트 요소
-            else:
-                text_parts.append(text)
+            # 요소 타입별 포맷 적용 (클래스 이름 기준 O(1) 조회)
+            element_type = type(element).__name__
+            fmt = _ELEMENT_TYPE_FORMATS.get(element_type)
+            if fmt is None:
+                fmt = _resolve_element_format(element_type)
+            text_parts.append(fmt.format(text))
         
         # 텍스트 결합 및 정리
         content = '\n\n'.join(text_parts)
@@ -227,12 +261,20 @@ class UnstructuredLoaderAdapter(DocumentLoaderPort):
         
         return content
     
-    def _extract_metadata_from_elements(self, elements: List, file_path: Path) -> Dict[str, Any]:
+    def _extract_metadata_from_elements(
+        self,
+        elements: List,
+        file_path: Path,
+        file_size: Optional[int] = None
+    ) -> Dict[str, Any]:
         """Unstructured 요소들에서 메타데이터 추출"""
+        if file_size is None:
+            file_size = file_path.stat().st_size
+        
         metadata = {
             'file_path': str(file_path.absolute()),
             'file_name': file_path.name,
-            'file_size': file_path.stat().st_size,
+            'file_size': file_size,
             'file_extension': file_path.suffix,
             'loader_type': 'unstructured',
             'created_at': datetime.utcnow().isoformat(),
@@ -249,33 +291,41 @@ class UnstructuredLoaderAdapter(DocumentLoaderPort):
         """요소들에서 메타데이터 추출"""
         metadata = {}
         
-        # 요소 타입별 통계
-        element_types = {}
+        # 요소 타입별 통계, 페이지 번호, 제목, 텍스트 길이를 한 번의 순회로 수집
+        element_types = Counter()
         page_numbers = set()
+        titles = []
+        text_lengths = []
         
         for element in elements:
-            element_type = str(type(element).__name__)
-            element_types[element_type] = element_types.get(element_type, 0) + 1
+            element_type = type(element).__name__
+            element_types[element_type] += 1
             
             # 페이지 번호 추출 (가능한 경우)
-            if hasattr(element, 'metadata') and element.metadata:
-                if hasattr(element.metadata, 'page_number'):
-                    page_numbers.add(element.metadata.page_number)
+            element_meta = getattr(element, 'metadata', None)
+            if element_meta:
+                page_number = getattr(element_meta, 'page_number', None)
+                if page_number is not None:
+                    page_numbers.add(page_number)
+            
+            text = str(element)
+            if 'Title' in element_type:
+                titles.append(text)
+            if text.strip():
+                text_lengths.append(len(text))
         
-        metadata['element_types'] = element_types
+        metadata['element_types'] = dict(element_types)
         
         if page_numbers:
             metadata['total_pages'] = len(page_numbers)
-            metadata['page_numbers'] = sorted(list(page_numbers))
+            metadata['page_numbers'] = sorted(page_numbers)
         
         # 문서 구조 분석
-        titles = [str(e) for e in elements if 'Title' in str(type(e).__name__)]
         if titles:
             metadata['titles'] = titles[:5]  # 처음 5개 제목만
             metadata['title_count'] = len(titles)
         
         # 텍스트 길이 통계
-        text_lengths = [len(str(e)) for e in elements if str(e).strip()]
         if text_lengths:
             metadata['avg_element_length'] = sum(text_lengths) / len(text_lengths)
             metadata['max_element_length'] = max(text_lengths)
@@ -285,13 +335,11 @@ class UnstructuredLoaderAdapter(DocumentLoaderPort):
     
     def _clean_text(self, text: str) -> str:
         """텍스트 정리"""
-        import re
-        
         # 연속된 공백 제거
-        text = re.sub(r' +', ' ', text)
+        text = _SPACES_RE.sub(' ', text)
         
         # 연속된 줄바꿈 제거 (최대 2개까지)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _EXCESS_NEWLINES_RE.sub('\n\n', text)
         
         # 탭 문자를 공백으로 변경
         text = text.replace('\t', ' ')
@@ -352,16 +400,17 @@ class UnstructuredLoaderAdapter(DocumentLoaderPort):
         try:
             path = Path(file_path)
             
-            # 파일 존재 확인
-            if not path.exists():
-                return False
-            
             # 확장자 확인
             if not self.is_format_supported(path.suffix):
                 return False
             
-            # 파일 크기 확인 (100MB 제한)
-            if path.stat().st_size > 100 * 1024 * 1024:
+            # 파일 존재 및 크기 확인 (100MB 제한, stat 한 번으로 처리)
+            try:
+                st = os.stat(path)
+            except OSError:
+                return False
+            
+            if st.st_size > 100 * 1024 * 1024:
                 return False
             
             # Unstructured로 파싱 테스트 (첫 번째 요소만)
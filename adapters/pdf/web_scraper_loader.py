@@ -2,17 +2,87 @@
 Web Scraper Document Loader Adapter
 """
 
+import re
 import uuid
+import codecs
+import random
+import hashlib
 import asyncio
 import aiohttp
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 from core.ports.document_loader import DocumentLoaderPort
 from core.entities.document import Document
 
 
+# 텍스트 추출 시 태그 이름 -> 처리 방식 매핑
+_TEXT_TAG_KINDS = {
+    'h1': 'heading', 'h2': 'heading', 'h3': 'heading',
+    'h4': 'heading', 'h5': 'heading', 'h6': 'heading',
+    'p': 'para', 'div': 'para', 'section': 'para',
+    'li': 'bullet',
+}
+
+# 본문 추출 전에 제거할 태그
+_STRIP_TAGS = ('script', 'style', 'nav', 'header', 'footer', 'aside')
+
+# 일반적인 메인 콘텐츠 선택자들 (한 번의 트리 순회로 찾도록 복합 선택자로 결합,
+# 여러 개가 일치하면 문서 순서상 가장 앞선 요소가 선택됨)
+_MAIN_SELECTOR = ', '.join((
+    'main',
+    'article',
+    '[role="main"]',
+    '.main-content',
+    '.content',
+    '#main',
+    '#content'
+))
+
+# 텍스트 정리용 정규식
+_WHITESPACE_RE = re.compile(r'\s+')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# 응답 본문 스트리밍 읽기 단위 (64KB)
+_READ_CHUNK_SIZE = 64 * 1024
+
+# 재시도 백오프 설정 (초)
+_RETRY_INITIAL_DELAY = 0.5
+_RETRY_MAX_DELAY = 8.0
+
+# URL 유효성 검사(HEAD 요청) 타임아웃
+_VALIDATE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+def _retry_delay(attempt: int) -> float:
+    """재시도 대기 시간 (지터가 포함된 지수 백오프, 상한 적용)"""
+    delay = min(_RETRY_MAX_DELAY, _RETRY_INITIAL_DELAY * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _is_transient_error(error: aiohttp.ClientError) -> bool:
+    """재시도할 가치가 있는 일시적 HTTP 오류인지 확인"""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500 or error.status == 429
+    return isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError))
+
+
+def _normalize_encoding(encoding: Optional[str]) -> str:
+    """charset 이름을 정규화 (알 수 없거나 없으면 UTF-8)"""
+    try:
+        return codecs.lookup(encoding or 'utf-8').name
+    except LookupError:
+        return 'utf-8'
+
+
 class WebScraperLoaderAdapter(DocumentLoaderPort):
     """웹 스크래퍼 문서 로더 어댑터"""
     
@@ -21,13 +91,69 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
         timeout: int = 30,
         max_retries: int = 3,
         user_agent: str = "Mozilla/5.0 (compatible; DocumentLoader/1.0)",
-        max_content_length: int = 10 * 1024 * 1024  # 10MB
+        max_content_length: int = 10 * 1024 * 1024,  # 10MB
+        concurrency: int = 20,
+        content_addressed_ids: bool = False
     ):
         self.timeout = timeout
         self.max_retries = max_retries
         self.user_agent = user_agent
         self.max_content_length = max_content_length
-        self.supported_schemes = ['http', 'https']
+        self.concurrency = max(1, concurrency)
+        self.content_addressed_ids = content_addressed_ids
+        self.supported_schemes = ('http', 'https')
+        self._supported_set = frozenset(self.supported_schemes)
+        self._timeout_obj = aiohttp.ClientTimeout(total=self.timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        # 세션을 만든 이벤트 루프 (세션은 그 루프에서만 사용할 수 있음)
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def __aenter__(self) -> "WebScraperLoaderAdapter":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        공유 HTTP 세션 반환 (최초 호출 시 생성, 커넥션 풀 재사용)
+        
+        다른 이벤트 루프(예: CLI의 다음 asyncio.run)에서 호출되면 새 세션을 만듦
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is not loop:
+            # 이전 루프의 세션은 이 루프에서 닫을 수 없으므로 커넥터를 분리해 버림
+            # (닫힌 세션으로 표시되어 "Unclosed client session" 경고가 나지 않음)
+            self._session.detach()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout_obj,
+                connector=connector,
+                headers={
+                    'User-Agent': self.user_agent,
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'Accept-Language': 'en-US,en;q=0.5',
+                    'Accept-Encoding': 'gzip, deflate',
+                }
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self) -> None:
+        """공유 HTTP 세션 종료 (async with로 사용하면 블록을 나갈 때 호출됨)"""
+        if self._session is not None:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+            elif not self._session.closed:
+                self._session.detach()
+            self._session = None
+            self._session_loop = None
     
     async def load_from_file(self, file_path: str, metadata: Optional[Dict[str, Any]] = None) -> Document:
         """파일에서 로드 (구현하지 않음)"""
@@ -36,14 +162,8 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
     async def load_from_bytes(self, content: bytes, filename: str, metadata: Optional[Dict[str, Any]] = None) -> Document:
         """바이트 데이터에서 HTML 문서 로드"""
         try:
-            # 바이트를 문자열로 변환
-            html_content = content.decode('utf-8')
-            
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # 텍스트 추출 및 메타데이터 생성
-            text_content = self._extract_text_content(soup)
+            # 파싱 및 텍스트/HTML 메타데이터 추출 (UTF-8 바이트 그대로 전달)
+            text_content, html_metadata = self._parse_html(content, 'utf-8')
             
             # 메타데이터 생성
             doc_metadata = {
@@ -54,8 +174,7 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
                 'source': 'bytes'
             }
             
-            # HTML에서 메타데이터 추출
-            html_metadata = self._extract_html_metadata(soup)
+            # HTML 메타데이터 병합
             doc_metadata.update(html_metadata)
             
             # 사용자 제공 메타데이터 병합
@@ -67,13 +186,11 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
                 title=doc_metadata.get('title', filename),
                 content=text_content,
                 metadata=doc_metadata,
-                document_id=str(uuid.uuid4())
+                document_id=self._new_document_id(text_content)
             )
             
             return document
             
-        except UnicodeDecodeError as e:
-            raise ValueError(f"HTML 디코딩 오류: {e}")
         except Exception as e:
             raise RuntimeError(f"바이트 데이터 로드 중 오류 발생: {e}")
     
@@ -94,7 +211,7 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
                 title=doc_metadata.get('title', self._extract_title_from_url(url)),
                 content=content,
                 metadata=doc_metadata,
-                document_id=str(uuid.uuid4())
+                document_id=self._new_document_id(content)
             )
             
             return document
@@ -103,11 +220,17 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
             raise RuntimeError(f"웹 페이지 로드 중 오류 발생 ({url}): {e}")
     
     async def load_multiple_files(self, file_paths: List[str], metadata: Optional[Dict[str, Any]] = None) -> List[Document]:
-        """여러 URL에서 웹 페이지 로드"""
-        documents = []
-        
-        # 동시 요청 제한 (최대 5개)
-        semaphore = asyncio.Semaphore(5)
+        """여러 URL에서 웹 페이지 로드 (완료 순서대로 수집)"""
+        return [document async for document in self.iter_multiple_files(file_paths, metadata)]
+    
+    async def iter_multiple_files(
+        self,
+        file_paths: List[str],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Document]:
+        """여러 URL을 동시에 로드하며 완료되는 순서대로 문서 반환"""
+        # 전체 동시 요청 수 제한 (호스트별 제한은 공유 커넥터의 limit_per_host가 담당)
+        semaphore = asyncio.Semaphore(self.concurrency)
         
         async def load_single_url(url: str) -> Optional[Document]:
             async with semaphore:
@@ -117,129 +240,126 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
                     print(f"URL 로드 실패 ({url}): {e}")
                     return None
         
-        # 모든 URL을 동시에 처리
-        tasks = [load_single_url(url) for url in file_paths]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 성공한 결과만 수집
-        for result in results:
-            if isinstance(result, Document):
-                documents.append(result)
-        
-        return documents
+        # 성공한 결과만 완료 순서대로 반환
+        tasks = [asyncio.create_task(load_single_url(url)) for url in file_paths]
+        try:
+            for future in asyncio.as_completed(tasks):
+                document = await future
+                if document is not None:
+                    yield document
+        finally:
+            # 소비자가 중간에 멈추면(break, 예외, aclose) 남은 요청 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
     
     def get_supported_formats(self) -> List[str]:
         """지원하는 파일 형식 반환 (웹 스크래퍼는 URL 스키마)"""
-        return self.supported_schemes.copy()
+        return list(self.supported_schemes)
     
     def is_format_supported(self, file_extension: str) -> bool:
         """파일 형식 지원 여부 확인 (URL 스키마 확인)"""
-        return file_extension.lower() in self.supported_schemes
+        return file_extension.lower() in self._supported_set
     
     async def _scrape_url(self, url: str) -> tuple[str, Dict[str, Any]]:
         """URL에서 콘텐츠 스크래핑"""
-        headers = {
-            'User-Agent': self.user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
-        
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        session = self._get_session()
         
         for attempt in range(self.max_retries):
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(url, headers=headers) as response:
-                        # 응답 상태 확인
-                        response.raise_for_status()
-                        
-                        # 콘텐츠 크기 확인
-                        content_length = response.headers.get('content-length')
-                        if content_length and int(content_length) > self.max_content_length:
-                            raise ValueError(f"콘텐츠가 너무 큽니다: {content_length} bytes")
-                        
-                        # HTML 콘텐츠 읽기
-                        html_content = await response.text()
-                        
-                        # BeautifulSoup으로 파싱
-                        soup = BeautifulSoup(html_content, 'html.parser')
-                        
-                        # 텍스트 추출 및 메타데이터 생성
-                        content = self._extract_text_content(soup)
-                        metadata = self._extract_metadata(soup, url, response)
-                        
-                        return content, metadata
-                        
+                async with session.get(url, timeout=self._timeout_obj) as response:
+                    # 응답 상태 확인
+                    response.raise_for_status()
+                    
+                    # 콘텐츠 크기 확인
+                    content_length = response.headers.get('content-length')
+                    if content_length and int(content_length) > self.max_content_length:
+                        raise ValueError(f"콘텐츠가 너무 큽니다: {content_length} bytes")
+                    
+                    # HTML 콘텐츠를 청크 단위로 읽기 (content-length 헤더가 없어도 크기 제한 적용)
+                    buf = bytearray()
+                    async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+                        buf.extend(chunk)
+                        if len(buf) > self.max_content_length:
+                            raise ValueError(f"콘텐츠가 너무 큽니다: {self.max_content_length} bytes 초과")
+                    
+                    # 파싱 후 텍스트 추출 및 메타데이터 생성 (HTTP charset으로 디코딩)
+                    content, html_metadata = self._parse_html(bytes(buf), response.charset)
+                    metadata = self._extract_metadata(html_metadata, url, response)
+                    
+                    return content, metadata
+                    
             except asyncio.TimeoutError:
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # 지수 백오프
+                    await asyncio.sleep(_retry_delay(attempt))
                     continue
                 raise TimeoutError(f"URL 요청 시간 초과: {url}")
             
             except aiohttp.ClientError as e:
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                # 일시적 오류(연결 실패, 5xx, 429)만 재시도하고 4xx 등은 즉시 실패
+                if attempt < self.max_retries - 1 and _is_transient_error(e):
+                    await asyncio.sleep(_retry_delay(attempt))
                     continue
                 raise ConnectionError(f"HTTP 요청 실패: {e}")
         
         raise RuntimeError(f"최대 재시도 횟수 초과: {url}")
     
+    def _new_document_id(self, content: str) -> str:
+        """문서 ID 생성 (content_addressed_ids 설정 시 본문 해시 기반 UUID)"""
+        if self.content_addressed_ids:
+            digest = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+            return str(uuid.UUID(bytes=digest))
+        return str(uuid.uuid4())
+    
+    def _parse_html(self, html: bytes, encoding: Optional[str] = None) -> tuple[str, Dict[str, Any]]:
+        """HTML 파싱 후 (텍스트 콘텐츠, HTML 메타데이터) 반환
+
+        selectolax가 설치되어 있으면 C 파서(lexbor)를 사용하고,
+        없으면 BeautifulSoup으로 처리합니다. 인코딩은 주어진 charset을 그대로
+        사용하며(기본 UTF-8) 별도의 인코딩 추정은 하지 않습니다.
+        """
+        encoding = _normalize_encoding(encoding)
+        
+        if SELECTOLAX_AVAILABLE:
+            # lexbor는 UTF-8 바이트를 직접 처리하므로 이 경우 디코딩 생략
+            source = html if encoding == 'utf-8' else html.decode(encoding, errors='replace')
+            tree = LexborHTMLParser(source)
+            html_metadata = self._extract_html_metadata_fast(tree)
+            return self._extract_text_content_fast(tree), html_metadata
+        
+        # 문자열로 전달하면 BeautifulSoup의 인코딩 추정(UnicodeDammit)이 생략됨
+        soup = BeautifulSoup(html.decode(encoding, errors='replace'), 'html.parser')
+        html_metadata = self._extract_html_metadata(soup)
+        return self._extract_text_content(soup), html_metadata
+    
     def _extract_text_content(self, soup: BeautifulSoup) -> str:
         """HTML에서 텍스트 콘텐츠 추출"""
         # 불필요한 태그 제거
-        for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+        for tag in soup(list(_STRIP_TAGS)):
             tag.decompose()
         
-        # 주요 콘텐츠 영역 찾기
-        main_content = None
-        
-        # 일반적인 메인 콘텐츠 선택자들
-        main_selectors = [
-            'main',
-            'article',
-            '[role="main"]',
-            '.main-content',
-            '.content',
-            '#main',
-            '#content'
-        ]
-        
-        for selector in main_selectors:
-            main_content = soup.select_one(selector)
-            if main_content:
-                break
-        
-        # 메인 콘텐츠를 찾지 못하면 body 사용
-        if not main_content:
-            main_content = soup.find('body') or soup
-        
-        # 텍스트 추출
+        # 주요 콘텐츠 영역 찾기 (찾지 못하면 body 사용)
+        main_content = soup.select_one(_MAIN_SELECTOR) or soup.find('body') or soup
+        
+        # 텍스트 추출 (단일 트리 순회로 제목/단락/리스트 항목 처리)
         text_parts = []
         
-        # 제목 추출
-        title_tags = main_content.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        for tag in title_tags:
-            text = tag.get_text(strip=True)
-            if text:
+        for element in main_content.descendants:
+            kind = _TEXT_TAG_KINDS.get(element.name)
+            if kind is None:
+                continue
+            
+            text = element.get_text(strip=True)
+            if not text:
+                continue
+            
+            if kind == 'heading':
                 text_parts.append(f"\n{text}\n")
-        
-        # 단락 추출
-        paragraph_tags = main_content.find_all(['p', 'div', 'section'])
-        for tag in paragraph_tags:
-            text = tag.get_text(strip=True)
-            if text and len(text) > 20:  # 너무 짧은 텍스트 제외
-                text_parts.append(text)
-        
-        # 리스트 추출
-        list_tags = main_content.find_all(['ul', 'ol'])
-        for tag in list_tags:
-            items = tag.find_all('li')
-            for item in items:
-                text = item.get_text(strip=True)
-                if text:
-                    text_parts.append(f"• {text}")
+            elif kind == 'para':
+                if len(text) > 20:  # 너무 짧은 텍스트 제외
+                    text_parts.append(text)
+            else:
+                text_parts.append(f"• {text}")
         
         # 텍스트 정리 및 결합
         content = '\n\n'.join(text_parts)
@@ -247,7 +367,43 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
         
         return content
     
-    def _extract_metadata(self, soup: BeautifulSoup, url: str, response) -> Dict[str, Any]:
+    def _extract_text_content_fast(self, tree: "LexborHTMLParser") -> str:
+        """selectolax 트리에서 텍스트 콘텐츠 추출 (_extract_text_content와 동일한 규칙)"""
+        # 불필요한 태그 제거
+        for node in tree.css(', '.join(_STRIP_TAGS)):
+            node.decompose()
+        
+        # 주요 콘텐츠 영역 찾기 (찾지 못하면 body 사용)
+        main_content = tree.css_first(_MAIN_SELECTOR) or tree.body or tree.root
+        
+        text_parts = []
+        
+        # traverse()는 기준 노드 자신부터 반환하므로 첫 항목은 건너뜀
+        nodes = main_content.traverse()
+        next(nodes, None)
+        for node in nodes:
+            kind = _TEXT_TAG_KINDS.get(node.tag)
+            if kind is None:
+                continue
+            
+            text = node.text(strip=True)
+            if not text:
+                continue
+            
+            if kind == 'heading':
+                text_parts.append(f"\n{text}\n")
+            elif kind == 'para':
+                if len(text) > 20:  # 너무 짧은 텍스트 제외
+                    text_parts.append(text)
+            else:
+                text_parts.append(f"• {text}")
+        
+        content = '\n\n'.join(text_parts)
+        content = self._clean_text(content)
+        
+        return content
+    
+    def _extract_metadata(self, html_metadata: Dict[str, Any], url: str, response) -> Dict[str, Any]:
         """HTML에서 메타데이터 추출"""
         metadata = {
             'url': url,
@@ -257,8 +413,7 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
             'content_type': response.headers.get('content-type', ''),
         }
         
-        # HTML 메타데이터 추출
-        html_metadata = self._extract_html_metadata(soup)
+        # HTML 메타데이터 병합
         metadata.update(html_metadata)
         
         # 도메인 정보
@@ -284,16 +439,7 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
             content = tag.get('content')
             
             if name and content:
-                if name.lower() in ['description', 'og:description']:
-                    metadata['description'] = content
-                elif name.lower() in ['keywords', 'og:keywords']:
-                    metadata['keywords'] = content
-                elif name.lower() in ['author', 'og:author']:
-                    metadata['author'] = content
-                elif name.lower() == 'og:title':
-                    metadata['og_title'] = content
-                elif name.lower() == 'og:url':
-                    metadata['og_url'] = content
+                self._apply_meta_tag(metadata, name, content)
         
         # 언어 정보
         html_tag = soup.find('html')
@@ -302,14 +448,52 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
         
         return metadata
     
+    def _extract_html_metadata_fast(self, tree: "LexborHTMLParser") -> Dict[str, Any]:
+        """selectolax 트리에서 메타데이터만 추출"""
+        metadata = {}
+        
+        # 제목 추출
+        title_tag = tree.css_first('title')
+        if title_tag is not None:
+            metadata['title'] = title_tag.text(strip=True)
+        
+        # 메타 태그 정보 추출
+        for tag in tree.css('meta'):
+            attrs = tag.attributes
+            name = attrs.get('name') or attrs.get('property')
+            content = attrs.get('content')
+            
+            if name and content:
+                self._apply_meta_tag(metadata, name, content)
+        
+        # 언어 정보
+        html_tag = tree.css_first('html')
+        if html_tag is not None and html_tag.attributes.get('lang'):
+            metadata['language'] = html_tag.attributes.get('lang')
+        
+        return metadata
+    
+    def _apply_meta_tag(self, metadata: Dict[str, Any], name: str, content: str) -> None:
+        """메타 태그(name/property, content)를 메타데이터 키로 매핑"""
+        name = name.lower()
+        if name in ('description', 'og:description'):
+            metadata['description'] = content
+        elif name in ('keywords', 'og:keywords'):
+            metadata['keywords'] = content
+        elif name in ('author', 'og:author'):
+            metadata['author'] = content
+        elif name == 'og:title':
+            metadata['og_title'] = content
+        elif name == 'og:url':
+            metadata['og_url'] = content
+    
     def _clean_text(self, text: str) -> str:
         """텍스트 정리"""
         # 연속된 공백 제거
-        import re
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # 연속된 줄바꿈 제거 (최대 2개까지)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _EXCESS_NEWLINES_RE.sub('\n\n', text)
         
         # 앞뒤 공백 제거
         text = text.strip()
@@ -321,7 +505,7 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
         try:
             parsed = urlparse(url)
             return (
-                parsed.scheme in self.supported_schemes and
+                parsed.scheme in self._supported_set and
                 parsed.netloc and
                 len(url) < 2048  # URL 길이 제한
             )
@@ -364,12 +548,13 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
         """로더 정보 반환 (호환성)"""
         return {
             "type": self.get_loader_type(),
-            "supported_schemes": self.supported_schemes,
+            "supported_schemes": list(self.supported_schemes),
             "features": [
                 "html_parsing",
                 "content_extraction",
                 "metadata_extraction",
                 "concurrent_scraping",
+                "connection_pooling",
                 "retry_mechanism",
                 "timeout_handling",
                 "content_size_limiting"
@@ -379,6 +564,8 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
                 "timeout": self.timeout,
                 "max_retries": self.max_retries,
                 "max_content_length": self.max_content_length,
+                "concurrency": self.concurrency,
+                "content_addressed_ids": self.content_addressed_ids,
                 "user_agent": self.user_agent
             }
         }
@@ -390,12 +577,9 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
         
         try:
             # HEAD 요청으로 URL 접근 가능성 확인
-            timeout = aiohttp.ClientTimeout(total=10)
-            headers = {'User-Agent': self.user_agent}
-            
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.head(url, headers=headers) as response:
-                    return response.status < 400
+            session = self._get_session()
+            async with session.head(url, timeout=_VALIDATE_TIMEOUT) as response:
+                return response.status < 400
                     
         except Exception:
             return False
@@ -403,6 +587,7 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
     def set_timeout(self, timeout: int) -> None:
         """타임아웃 설정"""
         self.timeout = max(1, timeout)
+        self._timeout_obj = aiohttp.ClientTimeout(total=self.timeout)
     
     def set_max_retries(self, max_retries: int) -> None:
         """최대 재시도 횟수 설정"""
@@ -411,7 +596,13 @@ class WebScraperLoaderAdapter(DocumentLoaderPort):
     def set_user_agent(self, user_agent: str) -> None:
         """User-Agent 설정"""
         self.user_agent = user_agent
+        if self._session is not None:
+            self._session.headers['User-Agent'] = user_agent
     
     def set_max_content_length(self, max_length: int) -> None:
         """최대 콘텐츠 크기 설정"""
         self.max_content_length = max(1024, max_length)
+    
+    def set_concurrency(self, concurrency: int) -> None:
+        """동시 요청 수 설정"""
+        self.concurrency = max(1, concurrency)
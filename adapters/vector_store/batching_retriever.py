@@ -0,0 +1,208 @@
+"""
+Batching retriever proxy that groups concurrent queries into batch calls.
+"""
+
+from typing import List, Optional, Dict, Any, Set
+from dataclasses import dataclass, field
+import asyncio
+from core.entities.document import Query, RetrievalResult
+from core.ports.retriever import RetrieverPort
+from adapters.vector_store.result_cache import filter_key
+
+
+@dataclass
+class _PendingBatch:
+    """Queries collected for one (top_k, score_threshold, filter) combination."""
+    top_k: int
+    score_threshold: Optional[float]
+    filter_metadata: Optional[Dict[str, Any]]
+    queries: List[Query] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class BatchingRetrieverProxy(RetrieverPort):
+    """
+    Retriever wrapper that micro-batches concurrent retrieve() calls.
+    
+    Calls with the same parameters that arrive within max_delay_ms of each
+    other (up to max_batch_size) are sent to the wrapped retriever as one
+    retrieve_batch() call, and each caller receives its own result list.
+    All other operations are delegated unchanged.
+    """
+    
+    def __init__(
+        self,
+        retriever: RetrieverPort,
+        max_batch_size: int = 32,
+        max_delay_ms: float = 2.0
+    ):
+        """
+        Initialize batching proxy.
+        
+        Args:
+            retriever: Retriever to wrap
+            max_batch_size: Flush a batch as soon as it holds this many queries
+            max_delay_ms: Maximum time the first query of a batch waits for others
+        """
+        self._retriever = retriever
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_delay = max_delay_ms / 1000
+        self._pending: Dict[tuple, _PendingBatch] = {}
+        self._running: Set[asyncio.Task] = set()
+    
+    @property
+    def retriever(self) -> RetrieverPort:
+        """Get the wrapped retriever."""
+        return self._retriever
+    
+    def set_collection_name(self, collection_name: str) -> None:
+        """Set the collection name for retrieval."""
+        self._retriever.set_collection_name(collection_name)
+    
+    def get_collection_name(self) -> str:
+        """Get the current collection name."""
+        return self._retriever.get_collection_name()
+    
+    def get_retriever_type(self) -> str:
+        """Get the type of the wrapped retriever."""
+        return self._retriever.get_retriever_type()
+    
+    async def retrieve(
+        self,
+        query: Query,
+        top_k: int = 10,
+        score_threshold: Optional[float] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[RetrievalResult]:
+        """Queue the query into the current batch and wait for its results."""
+        loop = asyncio.get_running_loop()
+        key = self._batch_key(top_k, score_threshold, filter_metadata)
+        
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(top_k, score_threshold, filter_metadata)
+            batch.timer = loop.call_later(self._max_delay, self._flush, key)
+            self._pending[key] = batch
+        
+        future = loop.create_future()
+        batch.queries.append(query)
+        batch.futures.append(future)
+        
+        if len(batch.queries) >= self._max_batch_size:
+            batch.timer.cancel()
+            self._flush(key)
+        
+        return await future
+    
+    async def retrieve_batch(
+        self,
+        queries: List[Query],
+        top_k: int = 10,
+        score_threshold: Optional[float] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[RetrievalResult]]:
+        """Explicit batches go straight to the wrapped retriever."""
+        return await self._retriever.retrieve_batch(queries, top_k, score_threshold, filter_metadata)
+    
+    async def retrieve_by_text(
+        self,
+        query_text: str,
+        top_k: int = 10,
+        score_threshold: Optional[float] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[RetrievalResult]:
+        """Retrieve relevant documents for a text query (batched)."""
+        return await self.retrieve(
+            query=Query.create(query_text),
+            top_k=top_k,
+            score_threshold=score_threshold,
+            filter_metadata=filter_metadata
+        )
+    
+    async def retrieve_similar_documents(
+        self,
+        document_id: str,
+        top_k: int = 10,
+        score_threshold: Optional[float] = None
+    ) -> List[RetrievalResult]:
+        """Find documents similar to a given document."""
+        return await self._retriever.retrieve_similar_documents(document_id, top_k, score_threshold)
+    
+    async def retrieve_with_reranking(
+        self,
+        query: Query,
+        top_k: int = 10,
+        rerank_top_k: int = 100,
+        score_threshold: Optional[float] = None
+    ) -> List[RetrievalResult]:
+        """Retrieve with reranking."""
+        return await self._retriever.retrieve_with_reranking(query, top_k, rerank_top_k, score_threshold)
+    
+    async def get_retriever_info(self) -> Dict[str, Any]:
+        """Get information about the wrapped retriever and batching settings."""
+        info = await self._retriever.get_retriever_info()
+        info["batching"] = {
+            "max_batch_size": self._max_batch_size,
+            "max_delay_ms": self._max_delay * 1000
+        }
+        return info
+    
+    async def health_check(self) -> bool:
+        """Check if the wrapped retriever is healthy."""
+        return await self._retriever.health_check()
+    
+    def _batch_key(
+        self,
+        top_k: int,
+        score_threshold: Optional[float],
+        filter_metadata: Optional[Dict[str, Any]]
+    ) -> tuple:
+        """Only queries with identical parameters can share a batch."""
+        return (top_k, score_threshold, filter_key(filter_metadata))
+    
+    def _flush(self, key: tuple) -> None:
+        """Send the pending batch for key to the wrapped retriever."""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+        task.add_done_callback(lambda _: self._cancel_unresolved(batch))
+    
+    async def _run_batch(self, batch: _PendingBatch) -> None:
+        """Run one batch call and hand each caller its results."""
+        try:
+            all_results = await self._retriever.retrieve_batch(
+                batch.queries,
+                top_k=batch.top_k,
+                score_threshold=batch.score_threshold,
+                filter_metadata=batch.filter_metadata
+            )
+            if len(all_results) != len(batch.queries):
+                raise RuntimeError(
+                    f"retrieve_batch returned {len(all_results)} result lists "
+                    f"for {len(batch.queries)} queries"
+                )
+            
+            for future, results in zip(batch.futures, all_results):
+                if not future.done():
+                    future.set_result(results)
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+    
+    @staticmethod
+    def _cancel_unresolved(batch: _PendingBatch) -> None:
+        """
+        Cancel callers the finished batch task left unresolved.
+        
+        Runs as a done callback rather than a finally block so it also covers a
+        task cancelled before it started, whose body never executes.
+        """
+        for future in batch.futures:
+            if not future.done():
+                future.cancel()
@@ -2,12 +2,24 @@
 Ensemble retriever adapter that combines multiple retrievers for better results.
 """
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Tuple, Union, Callable, Awaitable, NamedTuple
 from enum import Enum
 import asyncio
-from collections import defaultdict
+import logging
+from operator import methodcaller
+import numpy as np
 from core.entities.document import Query, RetrievalResult
 from core.ports.retriever import RetrieverPort
+from adapters.vector_store.batching_retriever import BatchingRetrieverProxy
+from adapters.vector_store.result_cache import ResultCache, filter_key
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 
 class FusionStrategy(Enum):
@@ -18,6 +30,174 @@ class FusionStrategy(Enum):
     VOTING = "voting"
 
 
+def _fusion_aggregates_numpy(
+    idx: np.ndarray,
+    scores: np.ndarray,
+    ranks: np.ndarray,
+    weights: np.ndarray,
+    num_docs: int,
+    rrf_k: float
+) -> tuple:
+    """Accumulate (score_sum, count, rrf_sum, weighted_sum) per document index."""
+    return (
+        np.bincount(idx, weights=scores, minlength=num_docs),
+        np.bincount(idx, minlength=num_docs),
+        # RRF formula: 1 / (k + rank)
+        np.bincount(idx, weights=1.0 / (rrf_k + ranks), minlength=num_docs),
+        np.bincount(idx, weights=scores * weights, minlength=num_docs)
+    )
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _fusion_aggregates_numba(idx, scores, ranks, weights, num_docs, rrf_k):
+        """Numba version of _fusion_aggregates_numpy: all sums in one loop."""
+        score_sum = np.zeros(num_docs)
+        count = np.zeros(num_docs, dtype=np.int64)
+        rrf_sum = np.zeros(num_docs)
+        weighted_sum = np.zeros(num_docs)
+        for j in range(idx.shape[0]):
+            pos = idx[j]
+            score_sum[pos] += scores[j]
+            count[pos] += 1
+            rrf_sum[pos] += 1.0 / (rrf_k + ranks[j])
+            weighted_sum[pos] += scores[j] * weights[j]
+        return score_sum, count, rrf_sum, weighted_sum
+    
+    _fusion_aggregates = _fusion_aggregates_numba
+else:
+    _fusion_aggregates = _fusion_aggregates_numpy
+
+_fusion_kernel_warmed_up = False
+
+
+def _warm_up_fusion_kernel() -> None:
+    """Compile the Numba fusion kernel once so the first query does not pay for it."""
+    global _fusion_kernel_warmed_up
+    if NUMBA_AVAILABLE and not _fusion_kernel_warmed_up:
+        _fusion_aggregates(
+            np.zeros(1, dtype=np.int64),
+            np.zeros(1),
+            np.ones(1),
+            np.ones(1),
+            1,
+            60.0
+        )
+        _fusion_kernel_warmed_up = True
+
+
+class _FusionAggregates(NamedTuple):
+    """Per-document aggregates shared by all fusion strategies."""
+    representatives: List[RetrievalResult]
+    score_sum: np.ndarray
+    count: np.ndarray
+    rrf_sum: np.ndarray
+    weighted_sum: np.ndarray
+
+
+def _aggregate(
+    all_results: List[List[RetrievalResult]],
+    weights: np.ndarray,
+    rrf_k: float
+) -> _FusionAggregates:
+    """
+    Compute every fusion aggregate in a single pass over the results.
+    
+    Each unique (document, chunk) gets a dense index; the representative
+    result for an index is the last one seen. Sums are then accumulated
+    per index by the Numba kernel, or np.bincount without Numba.
+    """
+    key_to_idx: Dict[tuple, int] = {}
+    representatives: List[RetrievalResult] = []
+    idx_list: List[int] = []
+    score_list: List[float] = []
+    rank_list: List[int] = []
+    
+    for results in all_results:
+        for result in results:
+            key = result.get_key()
+            pos = key_to_idx.get(key)
+            if pos is None:
+                pos = key_to_idx[key] = len(representatives)
+                representatives.append(result)
+            else:
+                representatives[pos] = result
+            idx_list.append(pos)
+            score_list.append(result.score)
+            rank_list.append(result.rank)
+    
+    # Each result carries its retriever's weight
+    result_weights = np.repeat(weights, [len(results) for results in all_results])
+    
+    score_sum, count, rrf_sum, weighted_sum = _fusion_aggregates(
+        np.array(idx_list, dtype=np.int64),
+        np.array(score_list, dtype=np.float64),
+        np.array(rank_list, dtype=np.float64),
+        result_weights,
+        len(representatives),
+        float(rrf_k)
+    )
+    
+    return _FusionAggregates(
+        representatives=representatives,
+        score_sum=score_sum,
+        count=count,
+        rrf_sum=rrf_sum,
+        weighted_sum=weighted_sum
+    )
+
+
+def _select_fused_results(
+    scores: np.ndarray,
+    representatives: List[RetrievalResult],
+    top_k: int
+) -> List[RetrievalResult]:
+    """Build ranked results for the top_k highest fused scores."""
+    num_docs = len(scores)
+    if top_k <= 0 or num_docs == 0:
+        return []
+    
+    # Partial selection of the top_k, then order only that slice.
+    # Ties at the cut-off keep first-seen order, like a stable full sort.
+    if top_k < num_docs:
+        kth_score = -np.partition(-scores, top_k - 1)[top_k - 1]
+        above = np.flatnonzero(scores > kth_score)
+        ties = np.flatnonzero(scores == kth_score)[:top_k - len(above)]
+        top_idx = np.sort(np.concatenate((above, ties)))
+    else:
+        top_idx = np.arange(num_docs)
+    top_idx = top_idx[np.argsort(-scores[top_idx], kind="stable")]
+    
+    fused_results = []
+    for rank, i in enumerate(top_idx.tolist(), start=1):
+        result = representatives[i]
+        fused_results.append(RetrievalResult(
+            document_id=result.document_id,
+            chunk_id=result.chunk_id,
+            content=result.content,
+            score=float(scores[i]),
+            rank=rank,
+            metadata=result.metadata
+        ))
+    
+    return fused_results
+
+
+def reciprocal_rank_fusion(
+    all_results: List[List[RetrievalResult]],
+    top_k: int,
+    rrf_k: float = 60
+) -> List[RetrievalResult]:
+    """
+    Combine ranked result lists using Reciprocal Rank Fusion (RRF).
+    
+    Results are keyed by (document, chunk) and must carry their 1-based rank
+    in their own list; the returned scores are the RRF sums.
+    """
+    agg = _aggregate(all_results, np.ones(len(all_results)), rrf_k)
+    return _select_fused_results(agg.rrf_sum, agg.representatives, top_k)
+
+
 class EnsembleRetrieverAdapter(RetrieverPort):
     """Ensemble retriever that combines results from multiple retrievers."""
     
@@ -26,7 +206,13 @@ class EnsembleRetrieverAdapter(RetrieverPort):
         retrievers: List[RetrieverPort],
         fusion_strategy: FusionStrategy = FusionStrategy.RANK_FUSION,
         weights: Optional[List[float]] = None,
-        rrf_k: int = 60  # RRF parameter
+        rrf_k: int = 60,  # RRF parameter
+        retrieve_deadline_ms: Optional[int] = None,
+        batch: bool = False,
+        batch_max_size: int = 32,
+        batch_max_delay_ms: float = 2.0,
+        cache_max_size: int = 0,
+        cache_ttl_seconds: Optional[float] = None
     ):
         """
         Initialize ensemble retriever.
@@ -36,14 +222,28 @@ class EnsembleRetrieverAdapter(RetrieverPort):
             fusion_strategy: Strategy for combining results
             weights: Weights for each retriever (if using weighted strategies)
             rrf_k: Parameter for Reciprocal Rank Fusion
+            retrieve_deadline_ms: Optional time budget for a fan-out; retrievers
+                still running at the deadline are cancelled and contribute no results
+            batch: Wrap each retriever in a BatchingRetrieverProxy so concurrent
+                retrieve() calls are grouped into retrieve_batch() calls
+            batch_max_size: Maximum queries per batch (when batch is enabled)
+            batch_max_delay_ms: Maximum wait for a batch to fill (when batch is enabled)
+            cache_max_size: Number of retrieve() results kept in an LRU cache
+                (0 disables caching)
+            cache_ttl_seconds: Optional expiry for cached results
         """
         if not retrievers:
             raise ValueError("At least one retriever must be provided")
         
-        self._retrievers = retrievers
-        self._fusion_strategy = fusion_strategy
+        self._batch = batch
+        self._batch_max_size = batch_max_size
+        self._batch_max_delay_ms = batch_max_delay_ms
+        self._retrievers = [self._wrap_retriever(retriever) for retriever in retrievers]
+        self._bind_fusion_strategy(fusion_strategy)
         self._rrf_k = rrf_k
+        self._retrieve_deadline_ms = retrieve_deadline_ms
         self._collection_name = "documents"
+        self._cache: ResultCache[RetrievalResult] = ResultCache(cache_max_size, cache_ttl_seconds)
         
         # Set weights
         if weights is None:
@@ -54,9 +254,41 @@ class EnsembleRetrieverAdapter(RetrieverPort):
             # Normalize weights
             total_weight = sum(weights)
             self._weights = [w / total_weight for w in weights]
+        self._sync_weights_array()
+        
+        _warm_up_fusion_kernel()
+    
+    def _bind_fusion_strategy(self, strategy: FusionStrategy) -> None:
+        """Resolve the fusion method once, so _fuse_results needs no per-call dispatch."""
+        fusion_methods = {
+            FusionStrategy.SCORE_FUSION: self._score_fusion,
+            FusionStrategy.RANK_FUSION: self._rank_fusion,
+            FusionStrategy.WEIGHTED_SCORE: self._weighted_score_fusion,
+            FusionStrategy.VOTING: self._voting_fusion,
+        }
+        if strategy not in fusion_methods:
+            raise ValueError(f"Unknown fusion strategy: {strategy}")
+        self._fusion_strategy = strategy
+        self._fuse_impl = fusion_methods[strategy]
+        self._retriever_type = f"ensemble_retriever_{strategy.value}"
+    
+    def _sync_weights_array(self) -> None:
+        """Mirror self._weights into the array used by fusion."""
+        self._weights_arr = np.array(self._weights, dtype=np.float64)
+    
+    def _wrap_retriever(self, retriever: RetrieverPort) -> RetrieverPort:
+        """Wrap a retriever in a batching proxy when batching is enabled."""
+        if not self._batch or isinstance(retriever, BatchingRetrieverProxy):
+            return retriever
+        return BatchingRetrieverProxy(
+            retriever,
+            max_batch_size=self._batch_max_size,
+            max_delay_ms=self._batch_max_delay_ms
+        )
     
     def set_collection_name(self, collection_name: str) -> None:
         """Set the collection name for all retrievers."""
+        self.clear_cache()
         self._collection_name = collection_name
         for retriever in self._retrievers:
             retriever.set_collection_name(collection_name)
@@ -67,7 +299,7 @@ class EnsembleRetrieverAdapter(RetrieverPort):
     
     def get_retriever_type(self) -> str:
         """Get the type of this retriever."""
-        return f"ensemble_retriever_{self._fusion_strategy.value}"
+        return self._retriever_type
     
     async def retrieve(
         self,
@@ -77,40 +309,48 @@ class EnsembleRetrieverAdapter(RetrieverPort):
         filter_metadata: Optional[Dict[str, Any]] = None
     ) -> List[RetrievalResult]:
         """Retrieve documents using ensemble of retrievers."""
+        cache_key = None
+        if self._cache:
+            cache_key = self._cache_key(query, top_k, score_threshold, filter_metadata)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            # Get results from all retrievers concurrently
-            tasks = []
-            for retriever in self._retrievers:
-                task = retriever.retrieve(
+            combined_results, complete = await self._fan_out_and_fuse(
+                methodcaller(
+                    "retrieve",
                     query=query,
                     top_k=top_k * 2,  # Get more results for better fusion
                     score_threshold=score_threshold,
                     filter_metadata=filter_metadata
-                )
-                tasks.append(task)
-            
-            all_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Filter out exceptions and get valid results
-            valid_results = []
-            for i, result in enumerate(all_results):
-                if isinstance(result, Exception):
-                    print(f"Warning: Retriever {i} failed: {result}")
-                    valid_results.append([])
-                else:
-                    valid_results.append(result)
-            
-            if not any(valid_results):
-                return []
+                ),
+                top_k
+            )
             
-            # Combine results using selected fusion strategy
-            combined_results = self._fuse_results(valid_results, top_k)
+            # Partial fusions (a retriever failed or missed the deadline) are not cached
+            if combined_results and complete and cache_key is not None:
+                self._cache.put(cache_key, combined_results)
             
             return combined_results
             
         except Exception as e:
             raise Exception(f"Ensemble retrieval failed: {str(e)}")
     
+    def _cache_key(
+        self,
+        query: Query,
+        top_k: int,
+        score_threshold: Optional[float],
+        filter_metadata: Optional[Dict[str, Any]]
+    ) -> tuple:
+        """Build the result-cache key for a retrieve() call."""
+        return (query.text, top_k, score_threshold, self._fusion_strategy, filter_key(filter_metadata))
+    
+    def clear_cache(self) -> None:
+        """Drop all cached retrieval results (e.g. after new documents are indexed)."""
+        self._cache.clear()
+    
     async def retrieve_by_text(
         self,
         query_text: str,
@@ -142,34 +382,16 @@ class EnsembleRetrieverAdapter(RetrieverPort):
     ) -> List[RetrievalResult]:
         """Find documents similar to a given document using ensemble."""
         try:
-            # Get results from all retrievers concurrently
-            tasks = []
-            for retriever in self._retrievers:
-                task = retriever.retrieve_similar_documents(
+            results, _ = await self._fan_out_and_fuse(
+                methodcaller(
+                    "retrieve_similar_documents",
                     document_id=document_id,
                     top_k=top_k * 2,
                     score_threshold=score_threshold
-                )
-                tasks.append(task)
-            
-            all_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Filter out exceptions and get valid results
-            valid_results = []
-            for i, result in enumerate(all_results):
-                if isinstance(result, Exception):
-                    print(f"Warning: Retriever {i} failed: {result}")
-                    valid_results.append([])
-                else:
-                    valid_results.append(result)
-            
-            if not any(valid_results):
-                return []
-            
-            # Combine results using selected fusion strategy
-            combined_results = self._fuse_results(valid_results, top_k)
-            
-            return combined_results
+                ),
+                top_k
+            )
+            return results
             
         except Exception as e:
             raise Exception(f"Similar document retrieval failed: {str(e)}")
@@ -183,221 +405,176 @@ class EnsembleRetrieverAdapter(RetrieverPort):
     ) -> List[RetrievalResult]:
         """Retrieve with reranking using ensemble."""
         try:
-            # Get results from all retrievers with reranking
-            tasks = []
-            for retriever in self._retrievers:
-                task = retriever.retrieve_with_reranking(
+            # Each retriever reranks its own candidates before fusion
+            results, _ = await self._fan_out_and_fuse(
+                methodcaller(
+                    "retrieve_with_reranking",
                     query=query,
                     top_k=top_k,
                     rerank_top_k=rerank_top_k,
                     score_threshold=score_threshold
-                )
-                tasks.append(task)
-            
-            all_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Filter out exceptions and get valid results
-            valid_results = []
-            for i, result in enumerate(all_results):
-                if isinstance(result, Exception):
-                    print(f"Warning: Retriever {i} failed: {result}")
-                    valid_results.append([])
-                else:
-                    valid_results.append(result)
-            
-            if not any(valid_results):
-                return []
-            
-            # Combine results using selected fusion strategy
-            combined_results = self._fuse_results(valid_results, top_k)
-            
-            return combined_results
+                ),
+                top_k
+            )
+            return results
             
         except Exception as e:
             raise Exception(f"Reranking retrieval failed: {str(e)}")
     
+    async def _fan_out_and_fuse(
+        self,
+        make_coro: Callable[[RetrieverPort], Awaitable[List[RetrievalResult]]],
+        top_k: int
+    ) -> Tuple[List[RetrievalResult], bool]:
+        """
+        Run make_coro against every retriever and fuse whatever came back.
+        
+        Returns the fused results and whether every retriever answered
+        (False when one failed or missed the deadline).
+        """
+        # Get results from all retrievers concurrently
+        gathered = await self._gather_retrievers(make_coro)
+        complete = all(results is not None for results in gathered)
+        valid_results = [results or [] for results in gathered]
+        
+        if not any(valid_results):
+            return [], complete
+        
+        # Combine results using selected fusion strategy
+        return self._fuse_results(valid_results, top_k), complete
+    
+    async def _gather_retrievers(
+        self,
+        make_coro: Callable[[RetrieverPort], Awaitable[List[RetrievalResult]]]
+    ) -> List[Optional[List[RetrievalResult]]]:
+        """
+        Run a retrieval call against every retriever concurrently.
+        
+        A failing retriever, or one still running when the configured
+        deadline passes, contributes None instead of a result list. With a single
+        retriever the call is awaited directly, without creating a task.
+        """
+        deadline = None
+        if self._retrieve_deadline_ms is not None:
+            deadline = asyncio.get_running_loop().time() + self._retrieve_deadline_ms / 1000
+        
+        if len(self._retrievers) == 1:
+            return [await self._run_retriever(0, self._retrievers[0], make_coro, deadline)]
+        
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(self._run_retriever(i, retriever, make_coro, deadline))
+                for i, retriever in enumerate(self._retrievers)
+            ]
+        
+        return [task.result() for task in tasks]
+    
+    async def _run_retriever(
+        self,
+        index: int,
+        retriever: RetrieverPort,
+        make_coro: Callable[[RetrieverPort], Awaitable[List[RetrievalResult]]],
+        deadline: Optional[float] = None
+    ) -> Optional[List[RetrievalResult]]:
+        """Run one retriever call, turning failures and timeouts into None."""
+        timeout = asyncio.timeout_at(deadline)
+        try:
+            async with timeout:
+                return await make_coro(retriever)
+        except Exception as e:
+            if timeout.expired():
+                logger.warning("Retriever %d missed the %sms deadline", index, self._retrieve_deadline_ms)
+            else:
+                logger.warning("Retriever %d failed: %s", index, e)
+            return None
+    
     def _fuse_results(self, all_results: List[List[RetrievalResult]], top_k: int) -> List[RetrievalResult]:
         """Fuse results from multiple retrievers."""
-        if self._fusion_strategy == FusionStrategy.SCORE_FUSION:
-            return self._score_fusion(all_results, top_k)
-        elif self._fusion_strategy == FusionStrategy.RANK_FUSION:
-            return self._rank_fusion(all_results, top_k)
+        non_empty = [i for i, results in enumerate(all_results) if results]
+        if len(non_empty) == 1:
+            fused_results = self._fuse_single(non_empty[0], all_results[non_empty[0]], top_k)
+            if fused_results is not None:
+                return fused_results
+        return self._fuse_impl(all_results, top_k)
+    
+    def _fuse_single(
+        self,
+        index: int,
+        results: List[RetrievalResult],
+        top_k: int
+    ) -> Optional[List[RetrievalResult]]:
+        """
+        Fuse the results of a single retriever without the aggregation pass.
+        
+        Each result is its own aggregate, so the strategy score is computed
+        directly. Returns None when the list repeats a (document, chunk) key
+        and needs real fusion.
+        """
+        if len({result.get_key() for result in results}) != len(results):
+            return None
+        
+        if self._fusion_strategy == FusionStrategy.RANK_FUSION:
+            rrf_k = float(self._rrf_k)
+            scores = [1.0 / (rrf_k + result.rank) for result in results]
         elif self._fusion_strategy == FusionStrategy.WEIGHTED_SCORE:
-            return self._weighted_score_fusion(all_results, top_k)
+            weight = self._weights[index]
+            scores = [result.score * weight for result in results]
         elif self._fusion_strategy == FusionStrategy.VOTING:
-            return self._voting_fusion(all_results, top_k)
+            scores = [1 + result.score * 0.1 for result in results]
         else:
-            raise ValueError(f"Unknown fusion strategy: {self._fusion_strategy}")
+            scores = [result.score for result in results]
+        
+        return _select_fused_results(np.array(scores, dtype=np.float64), results, top_k)
     
     def _score_fusion(self, all_results: List[List[RetrievalResult]], top_k: int) -> List[RetrievalResult]:
         """Combine results using average score fusion."""
-        document_scores = defaultdict(list)
-        document_results = {}
-        
-        # Collect scores for each document
-        for results in all_results:
-            for result in results:
-                key = f"{result.document_id}_{result.chunk_id}"
-                document_scores[key].append(result.score)
-                document_results[key] = result
-        
-        # Calculate average scores
-        fused_results = []
-        for doc_key, scores in document_scores.items():
-            avg_score = sum(scores) / len(scores)
-            result = document_results[doc_key]
-            
-            # Create new result with fused score
-            fused_result = RetrievalResult(
-                document_id=result.document_id,
-                chunk_id=result.chunk_id,
-                content=result.content,
-                score=avg_score,
-                rank=0,  # Will be set later
-                metadata=result.metadata
-            )
-            fused_results.append(fused_result)
-        
-        # Sort by score and assign ranks
-        fused_results.sort(key=lambda x: x.score, reverse=True)
-        for i, result in enumerate(fused_results[:top_k]):
-            result.rank = i + 1
-        
-        return fused_results[:top_k]
+        agg = _aggregate(all_results, self._weights_arr, self._rrf_k)
+        return _select_fused_results(agg.score_sum / agg.count, agg.representatives, top_k)
     
     def _rank_fusion(self, all_results: List[List[RetrievalResult]], top_k: int) -> List[RetrievalResult]:
         """Combine results using Reciprocal Rank Fusion (RRF)."""
-        document_scores = defaultdict(float)
-        document_results = {}
-        
-        # Calculate RRF scores
-        for results in all_results:
-            for result in results:
-                key = f"{result.document_id}_{result.chunk_id}"
-                # RRF formula: 1 / (k + rank)
-                rrf_score = 1.0 / (self._rrf_k + result.rank)
-                document_scores[key] += rrf_score
-                document_results[key] = result
-        
-        # Create fused results
-        fused_results = []
-        for doc_key, rrf_score in document_scores.items():
-            result = document_results[doc_key]
-            
-            fused_result = RetrievalResult(
-                document_id=result.document_id,
-                chunk_id=result.chunk_id,
-                content=result.content,
-                score=rrf_score,
-                rank=0,  # Will be set later
-                metadata=result.metadata
-            )
-            fused_results.append(fused_result)
-        
-        # Sort by RRF score and assign ranks
-        fused_results.sort(key=lambda x: x.score, reverse=True)
-        for i, result in enumerate(fused_results[:top_k]):
-            result.rank = i + 1
-        
-        return fused_results[:top_k]
+        return reciprocal_rank_fusion(all_results, top_k, self._rrf_k)
     
     def _weighted_score_fusion(self, all_results: List[List[RetrievalResult]], top_k: int) -> List[RetrievalResult]:
         """Combine results using weighted score fusion."""
-        document_scores = defaultdict(float)
-        document_counts = defaultdict(int)
-        document_results = {}
-        
-        # Calculate weighted scores
-        for i, results in enumerate(all_results):
-            weight = self._weights[i]
-            for result in results:
-                key = f"{result.document_id}_{result.chunk_id}"
-                document_scores[key] += result.score * weight
-                document_counts[key] += 1
-                document_results[key] = result
-        
-        # Create fused results
-        fused_results = []
-        for doc_key, weighted_score in document_scores.items():
-            result = document_results[doc_key]
-            
-            fused_result = RetrievalResult(
-                document_id=result.document_id,
-                chunk_id=result.chunk_id,
-                content=result.content,
-                score=weighted_score,
-                rank=0,  # Will be set later
-                metadata=result.metadata
-            )
-            fused_results.append(fused_result)
-        
-        # Sort by weighted score and assign ranks
-        fused_results.sort(key=lambda x: x.score, reverse=True)
-        for i, result in enumerate(fused_results[:top_k]):
-            result.rank = i + 1
-        
-        return fused_results[:top_k]
+        agg = _aggregate(all_results, self._weights_arr, self._rrf_k)
+        return _select_fused_results(agg.weighted_sum, agg.representatives, top_k)
     
     def _voting_fusion(self, all_results: List[List[RetrievalResult]], top_k: int) -> List[RetrievalResult]:
         """Combine results using voting (frequency-based) fusion."""
-        document_votes = defaultdict(int)
-        document_scores = defaultdict(list)
-        document_results = {}
-        
-        # Count votes and collect scores
-        for results in all_results:
-            for result in results:
-                key = f"{result.document_id}_{result.chunk_id}"
-                document_votes[key] += 1
-                document_scores[key].append(result.score)
-                document_results[key] = result
-        
-        # Create fused results
-        fused_results = []
-        for doc_key, votes in document_votes.items():
-            result = document_results[doc_key]
-            avg_score = sum(document_scores[doc_key]) / len(document_scores[doc_key])
-            
-            # Combine votes and average score
-            combined_score = votes + avg_score * 0.1  # Vote weight is higher
-            
-            fused_result = RetrievalResult(
-                document_id=result.document_id,
-                chunk_id=result.chunk_id,
-                content=result.content,
-                score=combined_score,
-                rank=0,  # Will be set later
-                metadata=result.metadata
-            )
-            fused_results.append(fused_result)
-        
-        # Sort by combined score and assign ranks
-        fused_results.sort(key=lambda x: x.score, reverse=True)
-        for i, result in enumerate(fused_results[:top_k]):
-            result.rank = i + 1
-        
-        return fused_results[:top_k]
+        agg = _aggregate(all_results, self._weights_arr, self._rrf_k)
+        # Combine votes and average score (vote weight is higher)
+        combined_scores = agg.count + (agg.score_sum / agg.count) * 0.1
+        return _select_fused_results(combined_scores, agg.representatives, top_k)
     
     async def get_retriever_info(self) -> Dict[str, Any]:
         """Get information about this ensemble retriever."""
+        infos = await asyncio.gather(
+            *(retriever.get_retriever_info() for retriever in self._retrievers),
+            return_exceptions=True
+        )
+        
         retriever_infos = []
-        for i, retriever in enumerate(self._retrievers):
-            try:
-                info = await retriever.get_retriever_info()
-                info["weight"] = self._weights[i]
-                retriever_infos.append(info)
-            except Exception as e:
+        for i, info in enumerate(infos):
+            if isinstance(info, Exception):
                 retriever_infos.append({
-                    "type": retriever.get_retriever_type(),
+                    "type": self._retrievers[i].get_retriever_type(),
                     "weight": self._weights[i],
-                    "error": str(e)
+                    "error": str(info)
                 })
+            else:
+                info["weight"] = self._weights[i]
+                retriever_infos.append(info)
         
         return {
             "type": self.get_retriever_type(),
             "collection_name": self._collection_name,
             "fusion_strategy": self._fusion_strategy.value,
             "rrf_k": self._rrf_k,
+            "retrieve_deadline_ms": self._retrieve_deadline_ms,
+            "batching": self._batch,
+            "cache_max_size": self._cache.max_size,
+            "cache_ttl_seconds": self._cache.ttl_seconds,
             "num_retrievers": len(self._retrievers),
             "retrievers": retriever_infos,
             "capabilities": [
@@ -412,38 +589,42 @@ class EnsembleRetrieverAdapter(RetrieverPort):
     async def health_check(self) -> bool:
         """Check if the ensemble retriever is healthy."""
         try:
-            # Check if at least one retriever is healthy
-            health_checks = []
-            for retriever in self._retrievers:
-                try:
-                    health = await retriever.health_check()
-                    health_checks.append(health)
-                except Exception:
-                    health_checks.append(False)
+            # Check all retrievers concurrently; a failing check counts as unhealthy
+            health_checks = await asyncio.gather(
+                *(retriever.health_check() for retriever in self._retrievers),
+                return_exceptions=True
+            )
             
             # Return True if at least one retriever is healthy
-            return any(health_checks)
+            return any(
+                health for health in health_checks
+                if not isinstance(health, BaseException)
+            )
             
         except Exception:
             return False
     
     def add_retriever(self, retriever: RetrieverPort, weight: float = 1.0) -> None:
         """Add a new retriever to the ensemble."""
+        self.clear_cache()
+        retriever = self._wrap_retriever(retriever)
         self._retrievers.append(retriever)
         
-        # Recalculate weights
-        current_total = sum(self._weights)
-        new_total = current_total + weight
-        
-        # Normalize all weights
-        self._weights = [w * current_total / new_total for w in self._weights]
-        self._weights.append(weight / new_total)
+        # Existing weights are normalized (sum to 1), so the new total is 1 + weight
+        if self._weights:
+            scale = 1.0 / (1.0 + weight)
+            self._weights = [w * scale for w in self._weights]
+            self._weights.append(weight * scale)
+        else:
+            self._weights = [1.0]
+        self._sync_weights_array()
         
         # Set collection name for new retriever
         retriever.set_collection_name(self._collection_name)
     
     def remove_retriever(self, index: int) -> None:
         """Remove a retriever from the ensemble."""
+        self.clear_cache()
         if 0 <= index < len(self._retrievers):
             self._retrievers.pop(index)
             removed_weight = self._weights.pop(index)
@@ -452,16 +633,19 @@ class EnsembleRetrieverAdapter(RetrieverPort):
             if self._weights:
                 remaining_total = sum(self._weights)
                 self._weights = [w / remaining_total for w in self._weights]
+            self._sync_weights_array()
     
     def set_fusion_strategy(self, strategy: FusionStrategy) -> None:
         """Change the fusion strategy."""
-        self._fusion_strategy = strategy
+        self._bind_fusion_strategy(strategy)
     
     def set_weights(self, weights: List[float]) -> None:
         """Set new weights for retrievers."""
+        self.clear_cache()
         if len(weights) != len(self._retrievers):
             raise ValueError("Number of weights must match number of retrievers")
         
         # Normalize weights
         total_weight = sum(weights)
         self._weights = [w / total_weight for w in weights]
+        self._sync_weights_array()
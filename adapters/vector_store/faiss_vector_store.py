@@ -4,45 +4,451 @@ FAISS Vector Store Adapter - 완전한 구현
 
 import asyncio
 import faiss
+import functools
+import hashlib
+import logging
 import numpy as np
 import pickle
 import os
+import tempfile
+from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from core.ports.vector_store import VectorStorePort
 from core.entities.document import DocumentChunk, RetrievalResult, Embedding
 
+logger = logging.getLogger(__name__)
+
+
+def _faiss_id(str_id: str) -> int:
+    """문자열 ID를 FAISS용 안정적인 int64 ID로 변환 (음수/-1 방지를 위해 63비트 사용)"""
+    digest = hashlib.blake2b(str_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") >> 1
+
+
+# 벡터 저장 방식 -> ScalarQuantizer 타입 (fp32는 양자화 없는 IndexHNSWFlat)
+_QUANTIZER_TYPES = {
+    "fp16": faiss.ScalarQuantizer.QT_fp16,
+    "int8": faiss.ScalarQuantizer.QT_8bit,
+}
+
+# 거리 측정 방식 ("ip"는 L2 정규화한 벡터의 내적 = 코사인 유사도)
+_METRIC_TYPES = {
+    "ip": faiss.METRIC_INNER_PRODUCT,
+    "l2": faiss.METRIC_L2,
+}
+
+
+# 인덱스 구조 ("auto"는 HNSW로 시작해 벡터 수가 임계값을 넘으면 IVF-PQ로 전환)
+_INDEX_TYPES = ("hnsw", "ivfpq", "auto")
+
+# IVF-PQ로 전환하는 벡터 수 ("ivfpq"는 8비트 PQ 학습에 권장되는 최소 개수(256 * 39)부터)
+_IVFPQ_THRESHOLDS = {
+    "ivfpq": 256 * 39,
+    "auto": 1_000_000,
+}
+
+# IVF-PQ 전환 시 벡터를 복원해 옮기는 단위 (전체를 한 번에 메모리에 올리지 않도록)
+_IVFPQ_COPY_BATCH = 65536
+
+
+def _pq_subquantizers(dimension: int) -> int:
+    """PQ 서브 양자화기 수 (dimension/4 이하에서 dimension의 약수 중 최대값)"""
+    return next(m for m in range(max(1, dimension // 4), 0, -1) if dimension % m == 0)
+
+
+def _build_ivfpq_index(index: Any, live_ids: np.ndarray, dimension: int, metric: str) -> Any:
+    """
+    기존 인덱스의 살아있는 벡터로 IVF-PQ 인덱스 생성
+    
+    nlist=sqrt(N), m=D/4, nbits=8, nprobe=sqrt(nlist). 삭제 표시된 벡터는 옮기지 않음.
+    """
+    n = len(live_ids)
+    nlist = max(1, int(np.sqrt(n)))
+    metric_type = _METRIC_TYPES[metric]
+    
+    quantizer = faiss.IndexFlat(dimension, metric_type)
+    ivf = faiss.IndexIVFPQ(quantizer, dimension, nlist, _pq_subquantizers(dimension), 8, metric_type)
+    
+    # 학습 샘플: 중심점(nlist개, PQ 256개)당 39개
+    train_size = min(n, max(nlist, 256) * 39)
+    sample_ids = np.random.default_rng(0).choice(live_ids, train_size, replace=False) if train_size < n else live_ids
+    ivf.train(index.reconstruct_batch(sample_ids))
+    ivf.nprobe = max(1, int(np.sqrt(nlist)))
+    # IDMap2의 reconstruct(get_embedding 등)를 위해 직접 매핑 유지 (PQ 복원이므로 근사값)
+    ivf.make_direct_map()
+    
+    new_index = faiss.IndexIDMap2(ivf)
+    for start in range(0, n, _IVFPQ_COPY_BATCH):
+        batch_ids = live_ids[start:start + _IVFPQ_COPY_BATCH]
+        new_index.add_with_ids(index.reconstruct_batch(batch_ids), batch_ids)
+    return new_index
+
+
+def _attach_shards(collection: Dict[str, Any], shards: List[Any]) -> None:
+    """
+    샤드 인덱스들을 컬렉션의 검색용 인덱스로 연결
+    
+    샤드가 여러 개면 IndexShards로 묶어 샤드별 검색을 C++ 스레드에서 병렬 실행하고 병합
+    """
+    collection['shards'] = shards
+    if len(shards) == 1:
+        collection['index'] = shards[0]
+    else:
+        index = faiss.IndexShards(shards[0].d, True, False)
+        for shard in shards:
+            index.add_shard(shard)
+        index.syncWithSubIndexes()
+        collection['index'] = index
+    # 샤드들은 같은 구조이므로 첫 샤드로 검색 파라미터(efSearch/nprobe) 확인
+    collection['base_index'] = faiss.downcast_index(shards[0].index)
+
+
+def _reconstruct_batch(shards: List[Any], ids: np.ndarray, dimension: int) -> np.ndarray:
+    """ID가 속한 샤드(ID % 샤드 수)에서 벡터 복원"""
+    if len(shards) == 1:
+        return shards[0].reconstruct_batch(ids)
+    
+    vectors = np.empty((len(ids), dimension), dtype=np.float32)
+    shard_of = ids % len(shards)
+    for i, shard in enumerate(shards):
+        mask = shard_of == i
+        if mask.any():
+            vectors[mask] = shard.reconstruct_batch(ids[mask])
+    return vectors
+
+
+def _is_hashable(value: Any) -> bool:
+    """역색인 키로 쓸 수 있는 값인지 확인"""
+    try:
+        hash(value)
+        return True
+    except TypeError:
+        return False
+
+
+def _reserve_capacity(index: Any, base_index: Any, capacity: int) -> None:
+    """
+    HNSW 레벨/오프셋, 벡터 코드, ID 맵 배열을 미리 예약해 대량 추가 중 재할당 방지
+    
+    SWIG 바인딩 버전에 따라 std::vector의 reserve가 노출되지 않을 수 있으며,
+    그 경우 예약 없이 기존처럼 필요할 때마다 늘어남
+    """
+    storage = faiss.downcast_index(base_index.storage)
+    targets = [
+        (base_index.hnsw.levels, capacity),
+        (base_index.hnsw.offsets, capacity + 1),
+        (getattr(storage, 'codes', None), capacity * storage.code_size),
+        (index.id_map, capacity),
+    ]
+    for vector, size in targets:
+        reserve = getattr(vector, 'reserve', None)
+        if reserve is not None:
+            reserve(size)
+
+
+@dataclass(slots=True)
+class _StoredChunk:
+    """저장된 청크 정보 (인스턴스 dict 없이 보관, 메타데이터는 직렬화된 bytes로 보관)"""
+    document_id: str
+    chunk_id: Optional[str]
+    content: str
+    metadata_bytes: bytes
+    model: str = ''
+    # 메타데이터의 'content'가 content와 같으면 직렬화에서 빼고 읽을 때 다시 채움 (본문 이중 저장 방지)
+    content_in_metadata: bool = False
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """메타데이터 dict (필요한 행만 역직렬화)"""
+        metadata = pickle.loads(self.metadata_bytes)
+        if self.content_in_metadata:
+            metadata['content'] = self.content
+        return metadata
+
 
 class FaissVectorStoreAdapter(VectorStorePort):
     """FAISS를 사용한 벡터 저장소 어댑터"""
     
-    def __init__(self, storage_path: str = "./faiss_storage"):
+    def __init__(
+        self,
+        storage_path: str = "./faiss_storage",
+        persist: bool = False,
+        search_batch_window_ms: Optional[float] = None,
+        search_batch_max_size: int = 32,
+        persist_delay_ms: float = 200,
+        omp_threads: Optional[int] = None
+    ):
+        """
+        persist=True이면 변경 후 인덱스(.faiss)와 메타데이터(.meta.pkl)를
+        storage_path에 저장하고, load_collection으로 다시 열 수 있음.
+        저장은 쓰기마다 하지 않고 persist_delay_ms 동안 모인 변경을 백그라운드에서
+        한 번에 저장하며, flush()로 대기 중인 저장을 즉시 끝낼 수 있음
+        
+        search_batch_window_ms를 지정하면 그 시간 안에 들어온 동시 검색(필터 없는)을
+        최대 search_batch_max_size개까지 모아 index.search 한 번으로 처리
+        
+        omp_threads를 지정하면 FAISS OpenMP 스레드 수를 설정함. 프로세스 전체에 적용되므로
+        (다른 FAISS 사용처의 대량 추가/배치 검색에도 영향) 기본값 None은 설정을 바꾸지 않음.
+        검색을 asyncio.to_thread로 요청마다 동시에 실행하는 서버라면 1로 두면 코어 과다 사용을 막을 수 있음
+        """
         self.storage_path = storage_path
+        self.persist = persist
+        self.persist_delay_ms = persist_delay_ms
+        self.search_batch_window_ms = search_batch_window_ms
+        self.search_batch_max_size = max(1, search_batch_max_size)
+        self._pending_searches = {}  # (collection_name, top_k) -> 모으는 중인 검색 배치
+        self._search_batch_tasks = set()
+        # 반복되는 쿼리 벡터의 변환/정규화 결과 캐시 (인스턴스별, LRU로 크기 제한)
+        self._normalized_query = functools.lru_cache(maxsize=1024)(self._normalize_query)
         self.collections = {}  # collection_name -> index 매핑
         self.metadata_storage = {}  # collection_name -> metadata 매핑
-        self.id_mappings = {}  # collection_name -> id 매핑
+        self.id_mappings = {}  # collection_name -> (int64 FAISS ID -> 문자열 ID) 매핑
+        self.metadata_index = {}  # collection_name -> (필터 키 -> 값 -> FAISS ID 집합) 역색인
+        self.doc_index = {}  # collection_name -> (document_id -> 임베딩 ID들, 삽입 순서 유지) 역색인
         
         # 저장소 디렉토리 생성
         os.makedirs(storage_path, exist_ok=True)
+        
+        if omp_threads is not None:
+            faiss.omp_set_num_threads(omp_threads)
     
-    async def create_collection(self, collection_name: str, vector_dimension: int) -> bool:
-        """컬렉션(인덱스) 생성"""
+    async def create_collection(
+        self,
+        collection_name: str,
+        vector_dimension: int,
+        quantization: str = "fp16",
+        metric: str = "ip",
+        initial_capacity: int = 0,
+        index_type: str = "auto",
+        shards: int = 1
+    ) -> bool:
+        """
+        컬렉션(인덱스) 생성
+        
+        quantization: "fp16"(기본, 메모리/대역폭 절반), "int8"(첫 배치로 학습), "fp32"(양자화 없음)
+        metric: "ip"(기본, 코사인 유사도), "l2"(유클리드 거리)
+        initial_capacity: 저장할 벡터 수를 미리 알 때 내부 배열을 예약하기 위한 힌트
+        index_type: "auto"(기본, 100만 개를 넘으면 IVF-PQ로 전환), "hnsw"(항상 HNSW),
+                    "ivfpq"(PQ 학습에 충분한 벡터가 쌓이면 바로 IVF-PQ로 전환)
+                    전환 기준은 샤드당 벡터 수
+        shards: 1보다 크면 벡터를 ID % shards로 나눠 저장하고 한 쿼리를 모든 샤드에서 병렬 검색
+                (단일 쿼리 지연 감소, 대신 샤드 수만큼 후보 탐색)
+        """
         try:
-            # HNSW 인덱스 생성 (Qdrant와 유사한 성능)
-            index = faiss.IndexHNSWFlat(vector_dimension, 32)
-            index.hnsw.efConstruction = 200
-            index.hnsw.efSearch = 50
-            
-            self.collections[collection_name] = {
-                'index': index,
-                'dimension': vector_dimension,
-                'next_id': 0
-            }
-            self.metadata_storage[collection_name] = {}
-            self.id_mappings[collection_name] = {}
+            if metric not in _METRIC_TYPES:
+                raise ValueError(f"지원하지 않는 metric: {metric}")
+            if index_type not in _INDEX_TYPES:
+                raise ValueError(f"지원하지 않는 index_type: {index_type}")
+            if quantization != "fp32" and quantization not in _QUANTIZER_TYPES:
+                raise ValueError(f"지원하지 않는 quantization: {quantization}")
+            if shards < 1:
+                raise ValueError(f"shards는 1 이상이어야 함: {shards}")
+            metric_type = _METRIC_TYPES[metric]
             
+            shard_indexes = []
+            for _ in range(shards):
+                # HNSW 인덱스 생성 (Qdrant와 유사한 성능)
+                if quantization == "fp32":
+                    base_index = faiss.IndexHNSWFlat(vector_dimension, 32, metric_type)
+                else:
+                    base_index = faiss.IndexHNSWSQ(
+                        vector_dimension, _QUANTIZER_TYPES[quantization], 32, metric_type
+                    )
+                base_index.hnsw.efConstruction = 200
+                base_index.hnsw.efSearch = 50
+                
+                # IDMap2로 감싸서 사용자 ID를 그대로 FAISS ID로 사용 (reconstruct 지원)
+                index = faiss.IndexIDMap2(base_index)
+                if initial_capacity > 0:
+                    _reserve_capacity(index, base_index, -(-initial_capacity // shards))
+                shard_indexes.append(index)
+            
+            self._register_collection(
+                collection_name, shard_indexes, vector_dimension, quantization, metric, index_type
+            )
             return True
-        except Exception as e:
-            print(f"FAISS 인덱스 생성 실패: {e}")
+        except Exception:
+            logger.exception("FAISS 인덱스 생성 실패: %s", collection_name)
+            return False
+    
+    def _register_collection(
+        self,
+        collection_name: str,
+        shards: List[Any],
+        dimension: int,
+        quantization: str,
+        metric: str,
+        index_type: str,
+        read_only: bool = False,
+        metadata_storage: Optional[Dict[str, Any]] = None,
+        id_mappings: Optional[Dict[int, str]] = None
+    ) -> None:
+        """컬렉션 상태 등록 (새로 만든 인덱스와 디스크에서 읽은 인덱스 공통)"""
+        collection = self.collections[collection_name] = {
+            'dimension': dimension,
+            'quantization': quantization,
+            'metric': metric,
+            'index_type': index_type,
+            # mmap으로 연 읽기 전용 인덱스는 첫 쓰기 때 메모리로 복제
+            'read_only': read_only,
+            # 검색(읽기)은 동시에, 추가(쓰기)는 단독으로 실행하기 위한 상태
+            'lock': asyncio.Lock(),
+            'active_reads': 0,
+            'reads_done': asyncio.Event(),
+            # persist 모드에서 저장되지 않은 변경 여부와 예약된 저장 태스크
+            'dirty': False,
+            'flush_task': None
+        }
+        _attach_shards(collection, shards)
+        self.metadata_storage[collection_name] = metadata_storage or {}
+        self.id_mappings[collection_name] = id_mappings or {}
+        self.metadata_index[collection_name] = {}
+        # 문서 역색인은 저장하지 않고 불러온 메타데이터로 다시 구성
+        self.doc_index[collection_name] = {}
+        for str_id, stored in self.metadata_storage[collection_name].items():
+            self.doc_index[collection_name].setdefault(stored.document_id, {})[str_id] = None
+    
+    def _index_path(self, collection_name: str) -> str:
+        return os.path.join(self.storage_path, f"{collection_name}.faiss")
+    
+    def _index_paths(self, collection_name: str, num_shards: int) -> List[str]:
+        """샤드별 인덱스 파일 경로 (샤드가 하나면 기존처럼 <name>.faiss)"""
+        if num_shards == 1:
+            return [self._index_path(collection_name)]
+        return [
+            os.path.join(self.storage_path, f"{collection_name}.shard{i}.faiss")
+            for i in range(num_shards)
+        ]
+    
+    def _metadata_path(self, collection_name: str) -> str:
+        return os.path.join(self.storage_path, f"{collection_name}.meta.pkl")
+    
+    def _schedule_flush(self, collection_name: str) -> None:
+        """변경을 표시하고 저장 태스크가 없으면 하나 예약 (연속된 쓰기는 한 번의 저장으로 합침)"""
+        collection = self.collections[collection_name]
+        collection['dirty'] = True
+        task = collection['flush_task']
+        if task is None or task.done():
+            collection['flush_task'] = asyncio.get_running_loop().create_task(
+                self._flush_when_idle(collection_name, collection)
+            )
+    
+    async def _flush_when_idle(self, collection_name: str, collection: Dict[str, Any]) -> None:
+        """지연 후 저장하고, 저장 중에 또 변경되었으면 다시 저장"""
+        await asyncio.sleep(self.persist_delay_ms / 1000)
+        # 컬렉션이 삭제되거나 다시 로드되었으면 저장하지 않음
+        while collection['dirty'] and self.collections.get(collection_name) is collection:
+            collection['dirty'] = False
+            try:
+                await self._flush(collection_name)
+            except Exception:
+                logger.exception("FAISS 컬렉션 저장 실패: %s", collection_name)
+                return
+    
+    async def flush(self, collection_name: Optional[str] = None) -> None:
+        """대기 중인 저장이 끝날 때까지 기다림 (collection_name이 없으면 모든 컬렉션)"""
+        names = [collection_name] if collection_name is not None else list(self.collections)
+        for name in names:
+            collection = self.collections.get(name)
+            if collection is None:
+                continue
+            task = collection['flush_task']
+            if task is not None and not task.done():
+                # 호출자가 취소되어도 예약된 저장은 계속 진행
+                await asyncio.shield(task)
+            if collection['dirty']:
+                collection['dirty'] = False
+                await self._flush(name)
+    
+    async def _flush(self, collection_name: str) -> None:
+        """
+        인덱스와 메타데이터를 디스크에 저장
+        
+        추가와 같은 방식으로 컬렉션 잠금을 잡고 진행 중인 읽기가 끝난 뒤 실행하므로,
+        스냅샷과 파일 쓰기 사이에 다른 추가가 끼어들어 인덱스와 메타데이터가 어긋나지 않음
+        """
+        collection = self.collections[collection_name]
+        async with collection['lock']:
+            # 잠금을 기다리는 동안 삭제되거나 다시 로드된 컬렉션은 저장하지 않음
+            if self.collections.get(collection_name) is not collection:
+                return
+            while collection['active_reads']:
+                collection['reads_done'].clear()
+                await collection['reads_done'].wait()
+            await self._write_collection(collection_name, collection)
+    
+    async def _write_collection(self, collection_name: str, collection: Dict[str, Any]) -> None:
+        """컬렉션 스냅샷을 잡고 모든 샤드와 메타데이터를 파일에 씀 (잠금을 잡은 상태에서 호출)"""
+        state = {
+            'dimension': collection['dimension'],
+            'quantization': collection['quantization'],
+            'metric': collection['metric'],
+            'index_type': collection['index_type'],
+            'shards': len(collection['shards']),
+            # 저장 중 이벤트 루프에서 변경되지 않도록 복사본 사용
+            'metadata_storage': dict(self.metadata_storage[collection_name]),
+            'id_mappings': dict(self.id_mappings[collection_name])
+        }
+        
+        # 임시 파일에 쓴 뒤 교체해서, 동시 저장이나 중단 시에도 파일이 깨지지 않도록 함
+        def write_index(index: Any, path: str) -> None:
+            fd, tmp_path = tempfile.mkstemp(dir=self.storage_path, suffix=".faiss.tmp")
+            os.close(fd)
+            faiss.write_index(index, tmp_path)
+            os.replace(tmp_path, path)
+        
+        def write_metadata() -> None:
+            fd, tmp_path = tempfile.mkstemp(dir=self.storage_path, suffix=".meta.tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._metadata_path(collection_name))
+        
+        def write_all() -> None:
+            paths = self._index_paths(collection_name, len(collection['shards']))
+            for shard, path in zip(collection['shards'], paths):
+                write_index(shard, path)
+            write_metadata()
+        
+        await asyncio.to_thread(write_all)
+    
+    async def load_collection(self, collection_name: str, mmap: bool = True) -> bool:
+        """
+        저장된 컬렉션 열기
+        
+        mmap=True이면 인덱스를 읽기 전용 메모리 맵으로 열어 OS 페이지 캐시를 사용
+        (RSS 절약, 여러 워커 간 페이지 공유). 첫 쓰기 때 메모리 복제본으로 전환됨.
+        """
+        try:
+            metadata_path = self._metadata_path(collection_name)
+            if not os.path.exists(metadata_path):
+                return False
+            
+            def read_metadata() -> Dict[str, Any]:
+                with open(metadata_path, "rb") as f:
+                    return pickle.load(f)
+            
+            state = await asyncio.to_thread(read_metadata)
+            
+            io_flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+            shards = [
+                await asyncio.to_thread(faiss.read_index, path, io_flags)
+                for path in self._index_paths(collection_name, state['shards'])
+            ]
+            
+            self._register_collection(
+                collection_name,
+                shards,
+                state['dimension'],
+                state['quantization'],
+                state['metric'],
+                state['index_type'],
+                read_only=mmap,
+                metadata_storage=state['metadata_storage'],
+                id_mappings=state['id_mappings']
+            )
+            return True
+        except Exception:
+            logger.exception("FAISS 컬렉션 로드 실패: %s", collection_name)
             return False
     
     async def collection_exists(self, collection_name: str) -> bool:
@@ -52,15 +458,34 @@ class FaissVectorStoreAdapter(VectorStorePort):
     async def delete_collection(self, collection_name: str) -> bool:
         """컬렉션 삭제"""
         try:
-            if collection_name in self.collections:
-                del self.collections[collection_name]
+            num_shards = 1
+            collection = self.collections.pop(collection_name, None)
+            if collection is not None:
+                num_shards = len(collection['shards'])
                 del self.metadata_storage[collection_name]
                 del self.id_mappings[collection_name]
+                del self.metadata_index[collection_name]
+                del self.doc_index[collection_name]
+            
+            if self.persist:
+                paths = self._index_paths(collection_name, num_shards) + [self._metadata_path(collection_name)]
+                if collection is not None:
+                    # 진행 중인 저장이 끝난 뒤 파일 삭제 (이후 예약된 저장은 삭제된 컬렉션을 건너뜀)
+                    async with collection['lock']:
+                        self._remove_files(paths)
+                else:
+                    self._remove_files(paths)
             return True
-        except Exception as e:
-            print(f"FAISS 컬렉션 삭제 실패: {e}")
+        except Exception:
+            logger.exception("FAISS 컬렉션 삭제 실패: %s", collection_name)
             return False
     
+    @staticmethod
+    def _remove_files(paths: List[str]) -> None:
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+    
     async def list_collections(self) -> List[str]:
         """컬렉션 목록 조회"""
         return list(self.collections.keys())
@@ -75,7 +500,10 @@ class FaissVectorStoreAdapter(VectorStorePort):
             "name": collection_name,
             "vectors_count": collection['index'].ntotal,
             "dimension": collection['dimension'],
-            "index_type": "HNSW",
+            "index_type": "IVFPQ" if isinstance(collection['base_index'], faiss.IndexIVF) else "HNSW",
+            "quantization": collection['quantization'],
+            "metric": collection['metric'],
+            "shards": len(collection['shards']),
             "status": "ready"
         }
     
@@ -85,33 +513,295 @@ class FaissVectorStoreAdapter(VectorStorePort):
             if collection_name not in self.collections:
                 return False
             
-            collection = self.collections[collection_name]
-            index = collection['index']
+            chunks = [chunk for chunk in chunks if chunk.embedding]
+            if not chunks:
+                return False
             
-            vectors = []
-            for chunk in chunks:
-                if chunk.embedding:
-                    vectors.append(chunk.embedding)
-                    
-                    # 메타데이터 저장
-                    chunk_id = chunk.chunk_id
-                    self.metadata_storage[collection_name][chunk_id] = {
-                        'document_id': chunk.document_id,
-                        'content': chunk.content,
-                        'metadata': chunk.metadata
-                    }
-                    self.id_mappings[collection_name][collection['next_id']] = chunk_id
-                    collection['next_id'] += 1
-            
-            if vectors:
-                vectors_array = np.array(vectors, dtype=np.float32)
-                index.add(vectors_array)
-                return True
+            vectors_array, ids = self._build_batch(
+                [chunk.embedding for chunk in chunks],
+                [chunk.chunk_id for chunk in chunks],
+                self.collections[collection_name]['dimension']
+            )
+            await self._add_to_index(collection_name, vectors_array, ids)
+            
+            # 메타데이터 저장 (벡터 추가 성공 후)
+            for chunk, faiss_id in zip(chunks, ids.tolist()):
+                self._store_metadata(
+                    collection_name, chunk.chunk_id, faiss_id,
+                    chunk.document_id, chunk.chunk_id, chunk.content, chunk.metadata
+                )
+            
+            if self.persist:
+                self._schedule_flush(collection_name)
+            return True
+            
+        except Exception:
+            logger.exception("FAISS 저장 실패: %s", collection_name)
             return False
+    
+    def _build_batch(self, vectors: List[Any], str_ids: List[str], dimension: int) -> tuple:
+        """미리 할당한 C-contiguous float32 배열과 int64 ID 배열을 한 번에 채움"""
+        vectors_array = np.empty((len(vectors), dimension), dtype=np.float32)
+        ids = np.empty(len(vectors), dtype=np.int64)
+        for i, (vector, str_id) in enumerate(zip(vectors, str_ids)):
+            # ndarray 벡터는 버퍼 복사, 리스트는 원소 변환 (차원이 다르면 ValueError)
+            vectors_array[i] = vector
+            ids[i] = _faiss_id(str_id)
+        return vectors_array, ids
+    
+    async def _read_index(self, collection: Dict[str, Any], func, *args, **kwargs):
+        """인덱스 읽기 작업을 이벤트 루프 밖 스레드에서 실행 (다른 읽기와 동시 실행 가능)"""
+        # 대기 중인 쓰기가 있으면 그 뒤에 시작
+        async with collection['lock']:
+            collection['active_reads'] += 1
+        try:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        finally:
+            collection['active_reads'] -= 1
+            if collection['active_reads'] == 0:
+                collection['reads_done'].set()
+    
+    async def _add_to_index(self, collection_name: str, vectors_array: np.ndarray, ids: np.ndarray) -> None:
+        """
+        인덱스에 벡터 추가 (진행 중인 읽기가 끝난 뒤 단독 실행, 학습이 필요한 양자화는 첫 배치로 학습)
+        
+        HNSW 컬렉션이 index_type의 전환 임계값을 넘으면 같은 쓰기 구간에서 IVF-PQ로 재구성
+        """
+        collection = self.collections[collection_name]
+        
+        def add() -> None:
+            if collection['read_only']:
+                # mmap 인덱스는 수정할 수 없으므로 메모리 복제본으로 교체
+                # (IVF의 mmap 역리스트는 clone_index를 지원하지 않아 같은 파일을 메모리로 다시 읽음)
+                paths = self._index_paths(collection_name, len(collection['shards']))
+                _attach_shards(collection, [faiss.read_index(path) for path in paths])
+                collection['read_only'] = False
+            
+            if collection['metric'] == "ip":
+                faiss.normalize_L2(vectors_array)
             
+            shards = collection['shards']
+            if len(shards) == 1:
+                parts = [(shards[0], vectors_array, ids)]
+            else:
+                shard_of = ids % len(shards)
+                parts = [
+                    (shard, vectors_array[shard_of == i], ids[shard_of == i])
+                    for i, shard in enumerate(shards)
+                ]
+            
+            for shard, shard_vectors, shard_ids in parts:
+                if not shard.is_trained:
+                    # 샤드에 들어갈 벡터가 적을 수 있으므로 배치 전체로 학습
+                    shard.train(vectors_array)
+                if len(shard_ids):
+                    shard.add_with_ids(shard_vectors, shard_ids)
+            if len(shards) > 1:
+                collection['index'].syncWithSubIndexes()
+        
+        async with collection['lock']:
+            while collection['active_reads']:
+                collection['reads_done'].clear()
+                await collection['reads_done'].wait()
+            await asyncio.to_thread(add)
+            
+            threshold = _IVFPQ_THRESHOLDS.get(collection['index_type'])
+            num_shards = len(collection['shards'])
+            if (
+                threshold is not None
+                and not isinstance(collection['base_index'], faiss.IndexIVF)
+                and collection['index'].ntotal >= threshold * num_shards
+            ):
+                # 살아있는 ID = 기존 매핑 + 이번에 추가한 ID (메타데이터는 추가 후에 저장되므로)
+                live_ids = np.union1d(
+                    np.fromiter(self.id_mappings[collection_name], dtype=np.int64,
+                                count=len(self.id_mappings[collection_name])),
+                    ids
+                )
+                shard_of = live_ids % num_shards
+                shards = [
+                    await asyncio.to_thread(
+                        _build_ivfpq_index, shard, live_ids[shard_of == i],
+                        collection['dimension'], collection['metric']
+                    )
+                    for i, shard in enumerate(collection['shards'])
+                ]
+                _attach_shards(collection, shards)
+    
+    def _store_metadata(
+        self,
+        collection_name: str,
+        str_id: str,
+        faiss_id: int,
+        document_id: str,
+        chunk_id: Optional[str],
+        content: str,
+        metadata: Dict[str, Any],
+        model: str = ''
+    ) -> None:
+        """메타데이터, ID 매핑, 필터 역색인을 함께 갱신"""
+        previous = self.metadata_storage[collection_name].get(str_id)
+        if previous is not None:
+            if previous.document_id != document_id:
+                self._discard_from_doc_index(collection_name, previous.document_id, str_id)
+            if self.metadata_index[collection_name]:
+                self._update_metadata_index(collection_name, faiss_id, previous.metadata, remove=True)
+        
+        content_in_metadata = 'content' in metadata and metadata['content'] == content
+        serialized = (
+            {key: value for key, value in metadata.items() if key != 'content'}
+            if content_in_metadata else metadata
+        )
+        self.metadata_storage[collection_name][str_id] = _StoredChunk(
+            document_id, chunk_id, content,
+            pickle.dumps(serialized, protocol=pickle.HIGHEST_PROTOCOL), model, content_in_metadata
+        )
+        self.id_mappings[collection_name][faiss_id] = str_id
+        self.doc_index[collection_name].setdefault(document_id, {})[str_id] = None
+        self._update_metadata_index(collection_name, faiss_id, metadata)
+    
+    def _remove_metadata(self, collection_name: str, str_id: str) -> None:
+        """메타데이터, ID 매핑, 필터 역색인에서 제거 (검색 결과에서 제외됨)"""
+        faiss_id = _faiss_id(str_id)
+        stored = self.metadata_storage[collection_name].pop(str_id)
+        self.id_mappings[collection_name].pop(faiss_id, None)
+        self._discard_from_doc_index(collection_name, stored.document_id, str_id)
+        if self.metadata_index[collection_name]:
+            self._update_metadata_index(collection_name, faiss_id, stored.metadata, remove=True)
+    
+    def _discard_from_doc_index(self, collection_name: str, document_id: str, str_id: str) -> None:
+        """문서 역색인에서 임베딩 ID 제거 (비면 문서 키도 제거)"""
+        emb_ids = self.doc_index[collection_name].get(document_id)
+        if emb_ids is not None:
+            emb_ids.pop(str_id, None)
+            if not emb_ids:
+                del self.doc_index[collection_name][document_id]
+    
+    def _update_metadata_index(
+        self,
+        collection_name: str,
+        faiss_id: int,
+        metadata: Dict[str, Any],
+        remove: bool = False
+    ) -> None:
+        """필터에 한 번이라도 사용된 키의 역색인만 갱신"""
+        for key, postings in self.metadata_index[collection_name].items():
+            if key not in metadata or not _is_hashable(metadata[key]):
+                continue
+            if remove:
+                ids = postings.get(metadata[key])
+                if ids is not None:
+                    ids.discard(faiss_id)
+            else:
+                postings.setdefault(metadata[key], set()).add(faiss_id)
+    
+    def _metadata_postings(self, collection_name: str, key: str) -> Dict[Any, set]:
+        """필터 키의 역색인 (처음 사용될 때 저장된 메타데이터로 생성)"""
+        postings = self.metadata_index[collection_name].get(key)
+        if postings is None:
+            postings = {}
+            for str_id, stored in self.metadata_storage[collection_name].items():
+                metadata = stored.metadata
+                if key in metadata and _is_hashable(metadata[key]):
+                    postings.setdefault(metadata[key], set()).add(_faiss_id(str_id))
+            self.metadata_index[collection_name][key] = postings
+        return postings
+    
+    def _filter_ids(self, collection_name: str, filter_metadata: Dict[str, Any]) -> Optional[np.ndarray]:
+        """필터를 만족하는 FAISS ID 배열 (역색인으로 처리할 수 없는 필터면 None)"""
+        if not all(_is_hashable(value) for value in filter_metadata.values()):
+            return None
+        
+        id_sets = sorted(
+            (self._metadata_postings(collection_name, key).get(value, set())
+             for key, value in filter_metadata.items()),
+            key=len
+        )
+        allowed = id_sets[0].intersection(*id_sets[1:])
+        return np.fromiter(allowed, dtype=np.int64, count=len(allowed))
+    
+    async def _search_index(
+        self,
+        collection_name: str,
+        query_array: np.ndarray,
+        top_k: int,
+        search_params: Any = None
+    ) -> tuple:
+        """단일 쿼리 검색 (배치 모드면 같은 컬렉션/top_k의 동시 검색과 묶어서 실행)"""
+        collection = self.collections[collection_name]
+        
+        # 필터 검색은 쿼리마다 ID 선택자가 달라 묶을 수 없음
+        if not self.search_batch_window_ms or search_params is not None:
+            return await self._read_index(
+                collection, collection['index'].search, query_array, top_k, params=search_params
+            )
+        
+        loop = asyncio.get_running_loop()
+        key = (collection_name, top_k)
+        batch = self._pending_searches.get(key)
+        if batch is None:
+            batch = {'queries': [], 'futures': []}
+            batch['timer'] = loop.call_later(
+                self.search_batch_window_ms / 1000, self._flush_search_batch, key
+            )
+            self._pending_searches[key] = batch
+        
+        future = loop.create_future()
+        batch['queries'].append(query_array[0])
+        batch['futures'].append(future)
+        
+        if len(batch['queries']) >= self.search_batch_max_size:
+            batch['timer'].cancel()
+            self._flush_search_batch(key)
+        
+        return await future
+    
+    def _flush_search_batch(self, key: tuple) -> None:
+        """모은 검색 배치를 실행"""
+        batch = self._pending_searches.pop(key, None)
+        if batch is None:
+            return
+        
+        task = asyncio.get_running_loop().create_task(self._run_search_batch(key, batch))
+        self._search_batch_tasks.add(task)
+        task.add_done_callback(self._search_batch_tasks.discard)
+        task.add_done_callback(lambda _: self._cancel_unresolved(batch['futures']))
+    
+    async def _run_search_batch(self, key: tuple, batch: Dict[str, Any]) -> None:
+        """쿼리들을 (n, d) 행렬로 쌓아 index.search 한 번으로 검색하고 각 요청에 결과 행 전달"""
+        collection_name, top_k = key
+        try:
+            collection = self.collections[collection_name]
+            queries = np.stack(batch['queries'])
+            distances, ids = await self._read_index(collection, collection['index'].search, queries, top_k)
         except Exception as e:
-            print(f"FAISS 저장 실패: {e}")
-            return False
+            for future in batch['futures']:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for row, future in enumerate(batch['futures']):
+            if not future.done():
+                future.set_result((distances[row:row + 1], ids[row:row + 1]))
+    
+    @staticmethod
+    def _cancel_unresolved(futures: List[asyncio.Future]) -> None:
+        """
+        배치 태스크가 결과를 전달하지 못하고 끝나면 남은 요청을 취소
+        
+        태스크의 done 콜백으로 실행되므로 시작 전에 취소된 경우(종료 시 등)도 처리됨
+        """
+        for future in futures:
+            if not future.done():
+                future.cancel()
+    
+    @staticmethod
+    def _normalize_query(query_bytes: bytes) -> np.ndarray:
+        """float32 쿼리 바이트를 L2 정규화한 (1, d) 배열로 변환 (캐시 공유되므로 읽기 전용)"""
+        query_array = np.frombuffer(query_bytes, dtype=np.float32).reshape(1, -1).copy()
+        faiss.normalize_L2(query_array)
+        query_array.flags.writeable = False
+        return query_array
     
     async def search_similar(
         self, 
@@ -132,50 +822,88 @@ class FaissVectorStoreAdapter(VectorStorePort):
             if index.ntotal == 0:
                 return []
             
-            query_array = np.array([query_vector], dtype=np.float32)
+            query_bytes = np.asarray(query_vector, dtype=np.float32).tobytes()
+            if collection['metric'] == "ip":
+                query_array = self._normalized_query(query_bytes)
+            else:
+                query_array = np.frombuffer(query_bytes, dtype=np.float32).reshape(1, -1)
             
-            # FAISS 검색 (거리 기반)
-            distances, indices = index.search(query_array, top_k)
+            # 차원이 다른 쿼리는 배치에 합류하기 전에 거부 (같은 배치의 다른 검색까지 실패하지 않도록)
+            if query_array.shape[1] != collection['dimension']:
+                raise ValueError(
+                    f"쿼리 벡터 차원 불일치: {query_array.shape[1]} != {collection['dimension']}"
+                )
+            
+            # 메타데이터 필터는 역색인으로 허용 ID를 구해 FAISS 검색 안에서 적용
+            # (검색 후 거르면 top_k보다 적게 반환되므로)
+            search_params = None
+            allowed_ids = self._filter_ids(collection_name, filter_metadata) if filter_metadata else None
+            if allowed_ids is not None:
+                if len(allowed_ids) == 0:
+                    return []
+                base_index = collection['base_index']
+                if isinstance(base_index, faiss.IndexIVF):
+                    search_params = faiss.SearchParametersIVF(
+                        sel=faiss.IDSelectorBatch(allowed_ids),
+                        nprobe=base_index.nprobe
+                    )
+                else:
+                    search_params = faiss.SearchParametersHNSW(
+                        sel=faiss.IDSelectorBatch(allowed_ids),
+                        efSearch=max(base_index.hnsw.efSearch, top_k * 4)
+                    )
+            
+            # FAISS 검색 (거리 기반, 반환되는 ID는 add_with_ids로 넣은 int64 ID)
+            distances, ids = await self._search_index(collection_name, query_array, top_k, search_params)
+            
+            # 유효하지 않은 인덱스(-1)와 임계값 미만 결과를 한 번에 제외
+            keep = ids[0] != -1
+            if collection['metric'] == "ip":
+                # 정규화된 벡터의 내적이 곧 코사인 유사도
+                if score_threshold:
+                    keep &= distances[0] >= score_threshold
+                scores = distances[0][keep]
+            else:
+                # 1/(1+d)는 d에 대해 단조 감소하므로 임계값을 거리로 한 번 바꿔서 거르고,
+                # 남은 결과만 유사도 점수로 변환 (0~1 범위)
+                if score_threshold and score_threshold > 0:
+                    keep &= distances[0] <= 1.0 / score_threshold - 1.0
+                scores = 1.0 / (1.0 + distances[0][keep])
             
             results = []
-            for i, (distance, idx) in enumerate(zip(distances[0], indices[0])):
-                if idx == -1:  # 유효하지 않은 인덱스
-                    continue
-                
-                # 거리를 유사도 점수로 변환 (0~1 범위)
-                similarity_score = 1.0 / (1.0 + distance)
-                
-                if score_threshold and similarity_score < score_threshold:
-                    continue
-                
-                chunk_id = self.id_mappings[collection_name].get(idx)
+            for i, faiss_id, similarity_score in zip(
+                np.flatnonzero(keep).tolist(), ids[0][keep].tolist(), scores.tolist()
+            ):
+                chunk_id = self.id_mappings[collection_name].get(faiss_id)
                 if chunk_id and chunk_id in self.metadata_storage[collection_name]:
-                    metadata = self.metadata_storage[collection_name][chunk_id]
+                    stored = self.metadata_storage[collection_name][chunk_id]
+                    # 반환할 행의 메타데이터만 역직렬화
+                    metadata = stored.metadata
                     
-                    # 메타데이터 필터링 (간단한 구현)
-                    if filter_metadata:
+                    # 역색인으로 처리할 수 없는 필터만 검색 후 적용
+                    if filter_metadata and allowed_ids is None:
                         skip = False
                         for key, value in filter_metadata.items():
-                            if key not in metadata['metadata'] or metadata['metadata'][key] != value:
+                            if key not in metadata or metadata[key] != value:
                                 skip = True
                                 break
                         if skip:
                             continue
                     
                     result = RetrievalResult(
-                        chunk_id=chunk_id,
-                        document_id=metadata['document_id'],
-                        content=metadata['content'],
+                        chunk_id=stored.chunk_id,
+                        document_id=stored.document_id,
+                        content=stored.content,
                         score=similarity_score,
                         rank=i + 1,
-                        metadata=metadata['metadata']
+                        metadata=metadata
                     )
                     results.append(result)
             
             return results
             
-        except Exception as e:
-            print(f"FAISS 검색 실패: {e}")
+        except Exception:
+            logger.exception("FAISS 검색 실패: %s", collection_name)
             return []
     
     async def add_embedding(self, embedding: Embedding, collection_name: str) -> bool:
@@ -185,23 +913,23 @@ class FaissVectorStoreAdapter(VectorStorePort):
                 return False
             
             collection = self.collections[collection_name]
-            index = collection['index']
             
+            faiss_id = _faiss_id(embedding.id)
             vector_array = np.array([embedding.vector], dtype=np.float32)
-            index.add(vector_array)
+            await self._add_to_index(collection_name, vector_array, np.array([faiss_id], dtype=np.int64))
             
             # 메타데이터 저장
-            self.metadata_storage[collection_name][embedding.id] = {
-                'document_id': embedding.document_id,
-                'chunk_id': embedding.chunk_id,
-                'metadata': embedding.metadata
-            }
-            self.id_mappings[collection_name][collection['next_id']] = embedding.id
-            collection['next_id'] += 1
+            self._store_metadata(
+                collection_name, embedding.id, faiss_id,
+                embedding.document_id, embedding.chunk_id,
+                embedding.metadata.get('content', ''), embedding.metadata, embedding.model
+            )
             
+            if self.persist:
+                self._schedule_flush(collection_name)
             return True
-        except Exception as e:
-            print(f"FAISS 임베딩 추가 실패: {e}")
+        except Exception:
+            logger.exception("FAISS 임베딩 추가 실패: %s", collection_name)
             return False
     
     async def add_embeddings(self, embeddings: List[Embedding], collection_name: str) -> bool:
@@ -211,58 +939,78 @@ class FaissVectorStoreAdapter(VectorStorePort):
                 return False
             
             collection = self.collections[collection_name]
-            index = collection['index']
             
-            vectors = []
-            for embedding in embeddings:
-                vectors.append(embedding.vector)
-                
-                # 메타데이터 저장
-                self.metadata_storage[collection_name][embedding.id] = {
-                    'document_id': embedding.document_id,
-                    'chunk_id': embedding.chunk_id,
-                    'metadata': embedding.metadata
-                }
-                self.id_mappings[collection_name][collection['next_id']] = embedding.id
-                collection['next_id'] += 1
-            
-            if vectors:
-                vectors_array = np.array(vectors, dtype=np.float32)
-                index.add(vectors_array)
-                return True
-            return False
+            if not embeddings:
+                return False
             
-        except Exception as e:
-            print(f"FAISS 다중 임베딩 추가 실패: {e}")
+            vectors_array, ids = self._build_batch(
+                [embedding.vector for embedding in embeddings],
+                [embedding.id for embedding in embeddings],
+                collection['dimension']
+            )
+            await self._add_to_index(collection_name, vectors_array, ids)
+            
+            # 메타데이터 저장 (벡터 추가 성공 후)
+            for embedding, faiss_id in zip(embeddings, ids.tolist()):
+                self._store_metadata(
+                    collection_name, embedding.id, faiss_id,
+                    embedding.document_id, embedding.chunk_id,
+                    embedding.metadata.get('content', ''), embedding.metadata, embedding.model
+                )
+            
+            if self.persist:
+                self._schedule_flush(collection_name)
+            return True
+            
+        except Exception:
+            logger.exception("FAISS 다중 임베딩 추가 실패: %s", collection_name)
             return False
     
     async def get_embedding(self, embedding_id: str, collection_name: str) -> Optional[Embedding]:
         """임베딩 조회"""
-        # FAISS는 ID 기반 조회가 어려움 - 메타데이터만 반환
         if collection_name in self.metadata_storage:
-            metadata = self.metadata_storage[collection_name].get(embedding_id)
-            if metadata:
-                return Embedding(
-                    id=embedding_id,
-                    document_id=metadata['document_id'],
-                    chunk_id=metadata['chunk_id'],
-                    vector=[],  # 벡터는 FAISS에서 직접 조회 어려움
-                    metadata=metadata['metadata']
-                )
+            stored = self.metadata_storage[collection_name].get(embedding_id)
+            if stored:
+                embeddings = await self._build_embeddings([(embedding_id, stored)], collection_name)
+                return embeddings[0]
         return None
     
+    async def _build_embeddings(self, items: List[tuple], collection_name: str) -> List[Embedding]:
+        """(ID, 저장된 청크) 목록과 IDMap2에서 한 번에 복원한 벡터로 Embedding 생성"""
+        collection = self.collections[collection_name]
+        ids = np.fromiter((_faiss_id(emb_id) for emb_id, _ in items), dtype=np.int64, count=len(items))
+        vectors = await self._read_index(
+            collection, _reconstruct_batch, collection['shards'], ids, collection['dimension']
+        )
+        
+        return [
+            Embedding(
+                id=emb_id,
+                document_id=stored.document_id,
+                chunk_id=stored.chunk_id,
+                vector=vector,
+                model=stored.model,
+                dimension=len(vector),
+                metadata=stored.metadata,
+                created_at=None
+            )
+            for (emb_id, stored), vector in zip(items, vectors.tolist())
+        ]
+    
     async def delete_embedding(self, embedding_id: str, collection_name: str) -> bool:
-        """임베딩 삭제 (FAISS는 개별 삭제 지원 안함)"""
-        # FAISS는 개별 벡터 삭제를 지원하지 않음
-        # 메타데이터만 삭제
-        try:
-            if collection_name in self.metadata_storage:
-                if embedding_id in self.metadata_storage[collection_name]:
-                    del self.metadata_storage[collection_name][embedding_id]
-                    return True
+        """임베딩 삭제 (HNSW는 개별 삭제 지원 안함)"""
+        # HNSW 그래프는 remove_ids를 지원하지 않으므로 ID 매핑을 제거해
+        # 검색 결과에서 제외 (벡터는 인덱스에 남음)
+        if embedding_id not in self.metadata_storage.get(collection_name, {}):
             return False
-        except Exception as e:
-            print(f"FAISS 임베딩 삭제 실패: {e}")
+        
+        try:
+            self._remove_metadata(collection_name, embedding_id)
+            if self.persist:
+                self._schedule_flush(collection_name)
+            return True
+        except Exception:
+            logger.exception("FAISS 임베딩 삭제 실패: %s", collection_name)
             return False
     
     async def delete_embeddings_by_document(self, document_id: str, collection_name: str) -> bool:
@@ -271,19 +1019,18 @@ class FaissVectorStoreAdapter(VectorStorePort):
             if collection_name not in self.metadata_storage:
                 return False
             
-            # 해당 문서의 임베딩 ID들 찾기
-            to_delete = []
-            for emb_id, metadata in self.metadata_storage[collection_name].items():
-                if metadata['document_id'] == document_id:
-                    to_delete.append(emb_id)
+            # 해당 문서의 임베딩 ID들 찾기 (문서 역색인 조회)
+            to_delete = list(self.doc_index[collection_name].get(document_id, ()))
             
-            # 메타데이터에서 삭제
+            # 메타데이터와 ID 매핑에서 삭제
             for emb_id in to_delete:
-                del self.metadata_storage[collection_name][emb_id]
+                self._remove_metadata(collection_name, emb_id)
             
+            if to_delete and self.persist:
+                self._schedule_flush(collection_name)
             return len(to_delete) > 0
-        except Exception as e:
-            print(f"FAISS 문서별 임베딩 삭제 실패: {e}")
+        except Exception:
+            logger.exception("FAISS 문서별 임베딩 삭제 실패: %s", collection_name)
             return False
     
     async def get_embeddings_by_document(self, document_id: str, collection_name: str) -> List[Embedding]:
@@ -292,21 +1039,28 @@ class FaissVectorStoreAdapter(VectorStorePort):
             if collection_name not in self.metadata_storage:
                 return []
             
-            embeddings = []
-            for emb_id, metadata in self.metadata_storage[collection_name].items():
-                if metadata['document_id'] == document_id:
-                    embedding = Embedding(
-                        id=emb_id,
-                        document_id=metadata['document_id'],
-                        chunk_id=metadata['chunk_id'],
-                        vector=[],  # 벡터는 FAISS에서 직접 조회 어려움
-                        metadata=metadata['metadata']
-                    )
-                    embeddings.append(embedding)
+            storage = self.metadata_storage[collection_name]
+            items = [
+                (emb_id, storage[emb_id])
+                for emb_id in self.doc_index[collection_name].get(document_id, ())
+            ]
+            embeddings = await self._build_embeddings(items, collection_name)
             
             return embeddings
-        except Exception as e:
-            print(f"FAISS 문서별 임베딩 조회 실패: {e}")
+        except Exception:
+            logger.exception("FAISS 문서별 임베딩 조회 실패: %s", collection_name)
+            return []
+    
+    async def get_all_embeddings(self, collection_name: str) -> List[Embedding]:
+        """컬렉션의 전체 임베딩 조회"""
+        try:
+            if collection_name not in self.metadata_storage:
+                return []
+            
+            items = list(self.metadata_storage[collection_name].items())
+            return await self._build_embeddings(items, collection_name)
+        except Exception:
+            logger.exception("FAISS 전체 임베딩 조회 실패: %s", collection_name)
             return []
     
     async def count_embeddings(self, collection_name: str) -> int:
@@ -319,18 +1073,20 @@ class FaissVectorStoreAdapter(VectorStorePort):
         """임베딩 업데이트 (FAISS는 업데이트 지원 안함)"""
         # FAISS는 벡터 업데이트를 지원하지 않음
         # 메타데이터만 업데이트
-        try:
-            if collection_name in self.metadata_storage:
-                if embedding.id in self.metadata_storage[collection_name]:
-                    self.metadata_storage[collection_name][embedding.id] = {
-                        'document_id': embedding.document_id,
-                        'chunk_id': embedding.chunk_id,
-                        'metadata': embedding.metadata
-                    }
-                    return True
+        if embedding.id not in self.metadata_storage.get(collection_name, {}):
             return False
-        except Exception as e:
-            print(f"FAISS 임베딩 업데이트 실패: {e}")
+        
+        try:
+            self._store_metadata(
+                collection_name, embedding.id, _faiss_id(embedding.id),
+                embedding.document_id, embedding.chunk_id,
+                embedding.metadata.get('content', ''), embedding.metadata, embedding.model
+            )
+            if self.persist:
+                self._schedule_flush(collection_name)
+            return True
+        except Exception:
+            logger.exception("FAISS 임베딩 업데이트 실패: %s", collection_name)
             return False
     
     async def health_check(self) -> bool:
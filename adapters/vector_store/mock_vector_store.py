@@ -2,10 +2,53 @@
 Mock vector store adapter for testing purposes.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+import numpy as np
 from core.entities.document import Embedding, RetrievalResult
 from core.ports.vector_store import VectorStorePort
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many candidate rows the NumPy path is faster than starting Numba threads
+_NUMBA_MIN_ROWS = 4096
+
+
+def _candidate_scores_numpy(matrix: np.ndarray, candidates: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Dot product of each candidate row with the (normalized) query."""
+    return matrix[candidates] @ query
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _candidate_scores_numba(matrix, candidates, query):
+        """Numba version of _candidate_scores_numpy that reads rows in place instead of gathering a copy."""
+        scores = np.empty(candidates.shape[0], dtype=np.float32)
+        for i in prange(candidates.shape[0]):
+            row = matrix[candidates[i]]
+            acc = np.float32(0.0)
+            for j in range(row.shape[0]):
+                acc += row[j] * query[j]
+            scores[i] = acc
+        return scores
+
+_scoring_kernel_warmed_up = False
+
+
+def _warm_up_scoring_kernel() -> None:
+    """Compile the Numba scoring kernel once so the first large search does not pay for it."""
+    global _scoring_kernel_warmed_up
+    if NUMBA_AVAILABLE and not _scoring_kernel_warmed_up:
+        _candidate_scores_numba(
+            np.zeros((1, 8), dtype=np.float32),
+            np.zeros(1, dtype=np.int64),
+            np.zeros(8, dtype=np.float32)
+        )
+        _scoring_kernel_warmed_up = True
+
 
 class MockVectorStoreAdapter(VectorStorePort):
     """Mock vector store adapter for testing without external dependencies."""
@@ -13,12 +56,71 @@ class MockVectorStoreAdapter(VectorStorePort):
     # Shared storage across all instances (singleton pattern)
     _shared_collections: Dict[str, Dict[str, Any]] = {}
     _shared_embeddings: Dict[str, Dict[str, Embedding]] = {}
+    # Embeddings plus normalized (N, D) matrices keyed by dimension per collection, rebuilt lazily after changes
+    _shared_search_matrices: Dict[str, Tuple[List[Embedding], Dict[int, Tuple[np.ndarray, np.ndarray]]]] = {}
+    # document_id -> embedding IDs (dict keys keep insertion order) per collection
+    _shared_doc_index: Dict[str, Dict[str, Dict[str, None]]] = {}
     
     def __init__(self):
         """Initialize mock vector store."""
         # Use shared storage to maintain data across instances
         self.collections = MockVectorStoreAdapter._shared_collections
         self.embeddings = MockVectorStoreAdapter._shared_embeddings
+        self.search_matrices = MockVectorStoreAdapter._shared_search_matrices
+        self.doc_index = MockVectorStoreAdapter._shared_doc_index
+        _warm_up_scoring_kernel()
+    
+    def _get_search_matrix(
+        self,
+        collection_name: str,
+        dimension: int
+    ) -> Tuple[List[Embedding], np.ndarray, np.ndarray]:
+        """Get the collection's embeddings plus the rows of the given dimension, L2-normalized and stacked."""
+        cached = self.search_matrices.get(collection_name)
+        if cached is None:
+            cached = self.search_matrices[collection_name] = (
+                list(self.embeddings[collection_name].values()), {}
+            )
+        entries, matrices = cached
+        if dimension not in matrices:
+            # 차원이 다른(빈 벡터 포함) 행은 제외해 한 건 때문에 검색 전체가 실패하지 않게 함
+            rows = np.fromiter(
+                (len(embedding.vector) == dimension for embedding in entries),
+                dtype=bool,
+                count=len(entries)
+            ).nonzero()[0]
+            matrix = np.array(
+                [entries[row].vector for row in rows.tolist()], dtype=np.float32
+            ).reshape(len(rows), dimension)
+            if len(rows):
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                matrix /= norms
+            matrices[dimension] = (rows, matrix)
+        rows, matrix = matrices[dimension]
+        return entries, rows, matrix
+    
+    def _invalidate_search_matrix(self, collection_name: str) -> None:
+        """Drop the cached search matrix after the collection changes."""
+        self.search_matrices.pop(collection_name, None)
+    
+    def _put_embedding(self, embedding: Embedding, collection_name: str) -> None:
+        """Store an embedding and keep the document index in sync."""
+        doc_index = self.doc_index[collection_name]
+        previous = self.embeddings[collection_name].get(embedding.id)
+        if previous is not None and previous.document_id != embedding.document_id:
+            self._discard_from_doc_index(collection_name, previous.document_id, embedding.id)
+        
+        self.embeddings[collection_name][embedding.id] = embedding
+        doc_index.setdefault(embedding.document_id, {})[embedding.id] = None
+    
+    def _discard_from_doc_index(self, collection_name: str, document_id: str, embedding_id: str) -> None:
+        """Remove an embedding ID from the document index, dropping empty documents."""
+        emb_ids = self.doc_index[collection_name].get(document_id)
+        if emb_ids is not None:
+            emb_ids.pop(embedding_id, None)
+            if not emb_ids:
+                del self.doc_index[collection_name][document_id]
     
     async def create_collection(self, collection_name: str, dimension: int, metadata: Optional[Dict[str, Any]] = None) -> bool:
         """Create a new collection in the vector store."""
@@ -28,6 +130,8 @@ class MockVectorStoreAdapter(VectorStorePort):
             "created_at": "2024-01-01T00:00:00Z"
         }
         self.embeddings[collection_name] = {}
+        self.doc_index[collection_name] = {}
+        self._invalidate_search_matrix(collection_name)
         return True
     
     async def delete_collection(self, collection_name: str) -> bool:
@@ -35,6 +139,8 @@ class MockVectorStoreAdapter(VectorStorePort):
         if collection_name in self.collections:
             del self.collections[collection_name]
             del self.embeddings[collection_name]
+            del self.doc_index[collection_name]
+            self._invalidate_search_matrix(collection_name)
             return True
         return False
     
@@ -47,7 +153,8 @@ class MockVectorStoreAdapter(VectorStorePort):
         if collection_name not in self.collections:
             return False
         
-        self.embeddings[collection_name][embedding.id] = embedding
+        self._put_embedding(embedding, collection_name)
+        self._invalidate_search_matrix(collection_name)
         return True
     
     async def add_embeddings(self, embeddings: List[Embedding], collection_name: str) -> bool:
@@ -56,7 +163,8 @@ class MockVectorStoreAdapter(VectorStorePort):
             return False
         
         for embedding in embeddings:
-            self.embeddings[collection_name][embedding.id] = embedding
+            self._put_embedding(embedding, collection_name)
+        self._invalidate_search_matrix(collection_name)
         return True
     
     async def update_embedding(self, embedding: Embedding, collection_name: str) -> bool:
@@ -65,7 +173,8 @@ class MockVectorStoreAdapter(VectorStorePort):
             return False
         
         if embedding.id in self.embeddings[collection_name]:
-            self.embeddings[collection_name][embedding.id] = embedding
+            self._put_embedding(embedding, collection_name)
+            self._invalidate_search_matrix(collection_name)
             return True
         return False
     
@@ -75,7 +184,9 @@ class MockVectorStoreAdapter(VectorStorePort):
             return False
         
         if embedding_id in self.embeddings[collection_name]:
-            del self.embeddings[collection_name][embedding_id]
+            embedding = self.embeddings[collection_name].pop(embedding_id)
+            self._discard_from_doc_index(collection_name, embedding.document_id, embedding_id)
+            self._invalidate_search_matrix(collection_name)
             return True
         return False
     
@@ -84,13 +195,11 @@ class MockVectorStoreAdapter(VectorStorePort):
         if collection_name not in self.collections:
             return False
         
-        to_delete = []
-        for emb_id, embedding in self.embeddings[collection_name].items():
-            if embedding.document_id == document_id:
-                to_delete.append(emb_id)
-        
+        to_delete = self.doc_index[collection_name].pop(document_id, {})
         for emb_id in to_delete:
             del self.embeddings[collection_name][emb_id]
+        if to_delete:
+            self._invalidate_search_matrix(collection_name)
         
         return len(to_delete) > 0
     
@@ -102,31 +211,52 @@ class MockVectorStoreAdapter(VectorStorePort):
         score_threshold: Optional[float] = None,
         filter_metadata: Optional[Dict[str, Any]] = None
     ) -> List[RetrievalResult]:
-        """Search for similar vectors (mock implementation)."""
+        """Search for similar vectors by brute-force cosine similarity."""
         if collection_name not in self.collections:
             return []
         
-        # Mock similarity search - return embeddings with mock scores
-        results = []
-        embeddings_list = list(self.embeddings[collection_name].values())
+        query = np.asarray(query_vector, dtype=np.float32).ravel()
+        if not query.size or top_k <= 0:
+            return []
+        entries, rows, matrix = self._get_search_matrix(collection_name, query.size)
+        if not len(rows):
+            return []
         
-        # 메타데이터 필터링 적용
+        # 메타데이터 필터링 적용 (후보 행만 남김)
         if filter_metadata:
-            filtered_embeddings = []
-            for embedding in embeddings_list:
-                match = True
-                for key, value in filter_metadata.items():
-                    if embedding.metadata.get(key) != value:
-                        match = False
-                        break
-                if match:
-                    filtered_embeddings.append(embedding)
-            embeddings_list = filtered_embeddings
+            candidates = np.fromiter(
+                (
+                    all(entries[row].metadata.get(key) == value for key, value in filter_metadata.items())
+                    for row in rows.tolist()
+                ),
+                dtype=bool,
+                count=len(rows)
+            ).nonzero()[0]
+        else:
+            candidates = np.arange(len(rows))
+        
+        # 한 번의 행렬-벡터 곱으로 코사인 유사도 계산
+        # (후보가 많으면 Numba 커널로 행 복사 없이 병렬 계산)
+        query_norm = np.linalg.norm(query)
+        if query_norm:
+            query = query / query_norm
+        if NUMBA_AVAILABLE and len(candidates) >= _NUMBA_MIN_ROWS:
+            scores = _candidate_scores_numba(matrix, candidates, query)
+        else:
+            scores = _candidate_scores_numpy(matrix, candidates, query)
+        
+        # 상위 top_k만 선형 시간에 골라낸 뒤 그 안에서만 정렬
+        # (np.sort로 삽입 순서를 복원해 선택된 결과 안의 동점은 삽입 순서 유지)
+        if top_k < len(scores):
+            order = np.sort(np.argpartition(-scores, top_k - 1)[:top_k])
+            order = order[np.argsort(-scores[order], kind="stable")]
+        else:
+            order = np.argsort(-scores, kind="stable")
         
         # top_k만큼 결과 생성
-        for i, embedding in enumerate(embeddings_list[:top_k]):
-            # Mock similarity score (높은 점수부터 낮은 점수로)
-            score = 0.95 - (i * 0.05)  # 0.95, 0.90, 0.85, ...
+        results = []
+        for i, (row, score) in enumerate(zip(rows[candidates[order]].tolist(), scores[order].tolist())):
+            embedding = entries[row]
             
             # 점수 임계값 필터링
             if score_threshold is not None and score < score_threshold:
@@ -161,12 +291,8 @@ class MockVectorStoreAdapter(VectorStorePort):
         if collection_name not in self.collections:
             return []
         
-        results = []
-        for embedding in self.embeddings[collection_name].values():
-            if embedding.document_id == document_id:
-                results.append(embedding)
-        
-        return results
+        embeddings = self.embeddings[collection_name]
+        return [embeddings[emb_id] for emb_id in self.doc_index[collection_name].get(document_id, ())]
     
     async def count_embeddings(self, collection_name: str) -> int:
         """Count total number of embeddings in the collection."""
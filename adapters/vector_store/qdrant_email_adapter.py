@@ -5,13 +5,15 @@ This module extends the QdrantVectorStoreAdapter to properly handle email metada
 by flattening email-specific fields to the top level for easier access.
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from qdrant_client.http.models import PointStruct
+import asyncio
+import logging
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 
 from .qdrant_vector_store import QdrantVectorStoreAdapter
 from core.entities.document import Embedding
 
+logger = logging.getLogger(__name__)
+
 
 class QdrantEmailVectorStoreAdapter(QdrantVectorStoreAdapter):
     """
@@ -21,25 +23,29 @@ class QdrantEmailVectorStoreAdapter(QdrantVectorStoreAdapter):
     sender_address, etc. are stored at the top level of the payload for easier access.
     """
     
-    def _create_email_payload(self, embedding: Embedding) -> Dict[str, Any]:
-        """Create payload with flattened email metadata."""
-        
-        # Start with base fields
-        payload = {
+    # Points per scroll request when get_all_embeddings walks keyset pages
+    SCROLL_PAGE_SIZE = 1000
+    
+    def __init__(self, *args, **kwargs):
+        # Email ingestion uploads larger slices with more of them in flight
+        kwargs.setdefault("upsert_batch_size", 256)
+        kwargs.setdefault("upsert_concurrency", 8)
+        super().__init__(*args, **kwargs)
+    
+    def _build_payload(self, embedding: Embedding, created_at: Optional[str] = None) -> Dict[str, Any]:
+        """Create payload with flattened email metadata (created_at: pre-formatted ISO timestamp)."""
+        # Base fields first, then all metadata fields flattened to top level in the same
+        # literal (metadata values win on collisions, and supply "content" when present)
+        return {
             "document_id": embedding.document_id,
             "chunk_id": embedding.chunk_id,
             "original_embedding_id": embedding.id,
             "model": embedding.model,
             "dimension": embedding.dimension,
-            "created_at": embedding.created_at.isoformat(),
-            "content": embedding.metadata.get("content", ""),
+            "created_at": created_at or embedding.created_at.isoformat(),
+            "content": "",
+            **embedding.metadata
         }
-        
-        # Flatten all metadata fields to top level
-        if embedding.metadata:
-            payload.update(embedding.metadata)
-        
-        return payload
     
     async def add_embedding(self, embedding: Embedding, collection_name: str) -> bool:
         """Add a single embedding with flattened email metadata."""
@@ -48,32 +54,29 @@ class QdrantEmailVectorStoreAdapter(QdrantVectorStoreAdapter):
             if not await self.collection_exists(collection_name):
                 await self.create_collection(collection_name, len(embedding.vector))
             
-            # Create flattened payload
-            payload = self._create_email_payload(embedding)
-            
-            # Ensure valid point ID for Qdrant
-            valid_point_id = self._ensure_valid_point_id(embedding.id)
-            
-            # Create point for Qdrant
-            point = PointStruct(
-                id=valid_point_id,
-                vector=embedding.vector,
-                payload=payload
-            )
+            # Create point with flattened payload
+            point = self._create_point(embedding)
             
             # Store point in Qdrant
-            operation_info = self.client.upsert(
+            operation_info = await self.client.upsert(
                 collection_name=collection_name,
                 points=[point]
             )
             
             return operation_info.status.name == "COMPLETED"
             
-        except Exception as e:
-            print(f"❌ Failed to add email embedding: {e}")
+        except Exception:
+            logger.exception("Failed to add email embedding to %s", collection_name)
             return False
+        finally:
+            self._invalidate_search_cache(collection_name)
     
-    async def add_embeddings(self, embeddings: List[Embedding], collection_name: str) -> bool:
+    async def add_embeddings(
+        self,
+        embeddings: List[Embedding],
+        collection_name: str,
+        wait: bool = True
+    ) -> bool:
         """Add multiple embeddings with flattened email metadata."""
         try:
             if not embeddings:
@@ -83,93 +86,140 @@ class QdrantEmailVectorStoreAdapter(QdrantVectorStoreAdapter):
             if not await self.collection_exists(collection_name):
                 await self.create_collection(collection_name, len(embeddings[0].vector))
             
-            points = []
-            for embedding in embeddings:
-                # Create flattened payload
-                payload = self._create_email_payload(embedding)
-                
-                # Ensure valid point ID for Qdrant
-                valid_point_id = self._ensure_valid_point_id(embedding.id)
-                
-                # Create point for Qdrant
-                point = PointStruct(
-                    id=valid_point_id,
-                    vector=embedding.vector,
-                    payload=payload
-                )
-                points.append(point)
-            
-            # Store points in Qdrant
-            operation_info = self.client.upsert(
-                collection_name=collection_name,
-                points=points
-            )
+            # Split into fixed-size sub-batches; very large single upserts stall or time out
+            if len(embeddings) > self.upsert_batch_size:
+                # Several sub-batches: hold off indexing until they have all landed
+                async with self.bulk_load_mode(collection_name):
+                    stored = await self._upsert_in_batches(embeddings, collection_name, wait)
+            else:
+                stored = await self._upsert_in_batches(embeddings, collection_name, wait)
+            if not stored:
+                return False
             
-            print(f"✅ Stored {len(points)} email embeddings in Qdrant with flattened metadata")
-            return operation_info.status.name == "COMPLETED"
+            logger.debug("Stored %d email embeddings in %s", len(embeddings), collection_name)
+            return True
             
-        except Exception as e:
-            print(f"❌ Failed to add email embeddings: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Failed to add email embeddings to %s", collection_name)
             return False
+        finally:
+            self._invalidate_search_cache(collection_name)
     
-    async def get_all_embeddings(self, collection_name: str, limit: int = 1000, offset: int = 0) -> List[Embedding]:
-        """Get all embeddings with properly reconstructed metadata."""
-        try:
-            # Use scroll to get all points
-            search_results = self.client.scroll(
+    async def get_embeddings_page(
+        self,
+        collection_name: str,
+        page_size: int = 1000,
+        page_token: Optional[Any] = None,
+        with_vectors: bool = True
+    ) -> Tuple[List[Embedding], Optional[Any]]:
+        """
+        Get one page of embeddings using keyset paging.
+        
+        Pass the returned next_page_offset back as page_token to continue; it is
+        None once the collection is exhausted. Each page resumes from the last
+        point ID instead of skipping over an OFFSET, so late pages cost the same
+        as the first one.
+        """
+        points, next_page_offset = await self.client.scroll(
+            collection_name=collection_name,
+            limit=page_size,
+            offset=page_token,
+            with_payload=True,
+            with_vectors=with_vectors
+        )
+        return [self._point_to_embedding(point) for point in points], next_page_offset
+    
+    async def _scroll_pages(
+        self,
+        collection_name: str,
+        page_size: int,
+        page_token: Optional[Any] = None,
+        with_vectors: bool = True,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Yield raw scroll pages, prefetching the next page while one is consumed.
+        
+        As soon as page N arrives the request for page N+1 is started, so its
+        network round-trip overlaps with the caller converting page N. At most
+        one page is in flight; limit caps the total number of points fetched.
+        """
+        remaining = limit
+        
+        def fetch(token: Optional[Any]) -> "asyncio.Task":
+            size = page_size if remaining is None else min(page_size, remaining)
+            return asyncio.create_task(self.client.scroll(
                 collection_name=collection_name,
-                limit=limit,
-                offset=offset,
+                limit=size,
+                offset=token,
                 with_payload=True,
-                with_vectors=True
-            )
-            
-            embeddings = []
-            points = search_results[0] if search_results else []
-            
+                with_vectors=with_vectors
+            ))
+        
+        if remaining is not None and remaining <= 0:
+            return
+        
+        task = fetch(page_token)
+        try:
+            while task is not None:
+                points, page_token = await task
+                task = None
+                if remaining is not None:
+                    remaining -= len(points)
+                if page_token is not None and (remaining is None or remaining > 0):
+                    task = fetch(page_token)
+                yield points
+        finally:
+            # Consumer stopped early (or failed): drop the prefetched page
+            if task is not None:
+                task.cancel()
+    
+    async def iter_embeddings(
+        self,
+        collection_name: str,
+        page_size: int = 512,
+        with_vectors: bool = False
+    ) -> AsyncIterator[Embedding]:
+        """
+        Stream every embedding in a collection without materializing it.
+        
+        Embeddings are yielded one at a time while walking keyset pages, so only
+        the current and the prefetched page are held at once. Vectors are skipped
+        unless with_vectors is set, since most callers only need the email metadata.
+        """
+        async for points in self._scroll_pages(collection_name, page_size, with_vectors=with_vectors):
             for point in points:
-                payload = point.payload
-                
-                # Use original embedding ID if available
-                original_id = payload.get("original_embedding_id", str(point.id))
-                
-                # Parse created_at from ISO format
-                created_at_str = payload.get("created_at")
-                created_at = datetime.fromisoformat(created_at_str) if created_at_str else datetime.utcnow()
-                
-                # Reconstruct metadata from flattened payload
-                # Exclude system fields and keep email-specific fields
-                system_fields = {
-                    "document_id", "chunk_id", "original_embedding_id", 
-                    "model", "dimension", "created_at"
-                }
-                
-                metadata = {
-                    key: value for key, value in payload.items() 
-                    if key not in system_fields
-                }
-                
-                embedding = Embedding(
-                    id=original_id,
-                    document_id=payload["document_id"],
-                    chunk_id=payload["chunk_id"],
-                    vector=point.vector,
-                    model=payload.get("model", "unknown"),
-                    dimension=payload.get("dimension", len(point.vector)),
-                    metadata=metadata,
-                    created_at=created_at
-                )
-                embeddings.append(embedding)
+                yield self._point_to_embedding(point)
+    
+    async def get_all_embeddings(
+        self,
+        collection_name: str,
+        limit: Optional[int] = 1000,
+        offset: Optional[Any] = None,
+        with_vectors: bool = False
+    ) -> List[Embedding]:
+        """
+        Get all embeddings with properly reconstructed metadata.
+        
+        Walks keyset pages of SCROLL_PAGE_SIZE points until limit embeddings are
+        collected (limit=None reads the whole collection), converting each page
+        while the next one is fetched. offset is the point ID to start from, as
+        with Qdrant's scroll. Vectors are only fetched with with_vectors=True;
+        otherwise embeddings carry an empty vector and the stored dimension.
+        """
+        try:
+            embeddings = []
+            async for points in self._scroll_pages(
+                collection_name, self.SCROLL_PAGE_SIZE, page_token=offset,
+                with_vectors=with_vectors, limit=limit
+            ):
+                embeddings.extend(self._point_to_embedding(point) for point in points)
             
-            print(f"✅ Retrieved {len(embeddings)} email embeddings from {collection_name}")
+            logger.debug("Retrieved %d email embeddings from %s", len(embeddings), collection_name)
             return embeddings
             
-        except Exception as e:
-            print(f"❌ Failed to get email embeddings from {collection_name}: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Failed to get email embeddings from %s", collection_name)
             return []
     
     def get_store_type(self) -> str:
@@ -182,7 +232,11 @@ def create_qdrant_email_adapter(
     host: str = "localhost",
     port: int = 6333,
     vector_dimension: int = 1536,
-    distance_metric: str = "cosine"
+    distance_metric: str = "cosine",
+    prefer_grpc: bool = True,
+    grpc_port: int = 6334,
+    pool_size: Optional[int] = None,
+    timeout: Optional[int] = 60
 ) -> QdrantEmailVectorStoreAdapter:
     """
     Factory function to create an email-optimized Qdrant vector store adapter.
@@ -192,6 +246,11 @@ def create_qdrant_email_adapter(
         port: Qdrant server port  
         vector_dimension: Dimension of vectors
         distance_metric: Distance metric for similarity
+        prefer_grpc: Use the gRPC transport (binary payloads, HTTP/2 multiplexing)
+        grpc_port: Qdrant gRPC port
+        pool_size: Connection pool size (client default if None); when set, keep it at
+                   least the number of coroutines expected to upsert/scroll concurrently
+        timeout: Request timeout in seconds
         
     Returns:
         Configured QdrantEmailVectorStoreAdapter instance
@@ -200,5 +259,9 @@ def create_qdrant_email_adapter(
         host=host,
         port=port,
         vector_dimension=vector_dimension,
-        distance_metric=distance_metric
+        distance_metric=distance_metric,
+        grpc_port=grpc_port,
+        prefer_grpc=prefer_grpc,
+        timeout=timeout,
+        pool_size=pool_size
     )
@@ -7,15 +7,46 @@ Qdrant is a vector similarity search engine with extended filtering support.
 
 import uuid
 import hashlib
-from typing import List, Optional, Dict, Any
+import functools
+import logging
+import re
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, Dict, Any, Set, Tuple, Union
 import asyncio
 from datetime import datetime
-from qdrant_client import QdrantClient
+import numpy as np
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
-from qdrant_client.http.models import Distance, VectorParams, PointStruct
+from qdrant_client.http.models import Batch, Distance, VectorParams, PointStruct
 
 from core.ports.vector_store import VectorStorePort
 from core.entities.document import Embedding, RetrievalResult
+from adapters.vector_store.result_cache import ResultCache, filter_key
+
+logger = logging.getLogger(__name__)
+
+# Canonical hyphenated UUIDs are used as point IDs unchanged
+_UUID_RE = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+# Characters uuid.UUID tolerates in its other spellings (braces, urn:uuid:, no hyphens);
+# IDs with anything else cannot be UUIDs and skip the parse attempt
+_UUID_LIKE_RE = re.compile(r"[0-9a-fA-F{}:_+\s\-urnid]+")
+
+# Vectors may be passed as Python lists or NumPy arrays (float32 avoids a copy)
+VectorLike = Union[List[float], np.ndarray]
+
+
+# Payload keys written by the adapter itself; everything else is embedding metadata
+# ("content" stays in metadata so it survives a read/write round trip)
+_SYSTEM_FIELDS = frozenset({
+    "document_id", "chunk_id", "original_embedding_id",
+    "model", "dimension", "created_at"
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(created_at: str) -> datetime:
+    """Parse a stored created_at; embeddings written together share the timestamp."""
+    return datetime.fromisoformat(created_at)
 
 
 class QdrantVectorStoreAdapter(VectorStorePort):
@@ -26,12 +57,47 @@ class QdrantVectorStoreAdapter(VectorStorePort):
     a high-performance vector database with HNSW indexing.
     """
     
+    # Quantized vector storage for new collections: int8 ("scalar"), 1-bit ("binary")
+    # or full float32 ("none"); quantized searches rescore candidates against the originals
+    QUANTIZATION_CONFIGS: Dict[str, Optional[models.QuantizationConfig]] = {
+        "scalar": models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True
+            )
+        ),
+        "binary": models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=True)
+        ),
+        "none": None
+    }
+    
+    # Candidates fetched from the quantized index per requested hit before rescoring
+    QUANTIZATION_OVERSAMPLING = 2.0
+    
+    # Indexing threshold (KB of vectors) restored after bulk ingestion; Qdrant's default
+    INDEXING_THRESHOLD = 20000
+    
+    # Payload fields matched by document lookups/deletes; indexed on collection creation
+    DEFAULT_INDEX_FIELDS = ("document_id", "chunk_id")
+    
     def __init__(
         self,
         host: str = "localhost",
         port: int = 6333,
         vector_dimension: int = 1536,
-        distance_metric: str = "cosine"
+        distance_metric: str = "cosine",
+        grpc_port: int = 6334,
+        prefer_grpc: bool = True,
+        timeout: Optional[int] = 60,
+        pool_size: Optional[int] = None,
+        upsert_batch_size: int = 128,
+        upsert_concurrency: int = 4,
+        search_cache_max_size: int = 2048,
+        search_cache_ttl_seconds: Optional[float] = 300,
+        index_fields: Optional[List[str]] = None,
+        quantization: Optional[str] = "scalar"
     ):
         """
         Initialize Qdrant vector store adapter.
@@ -41,14 +107,62 @@ class QdrantVectorStoreAdapter(VectorStorePort):
             port: Qdrant server port
             vector_dimension: Dimension of the vectors (default: 1536 for OpenAI)
             distance_metric: Distance metric for similarity search (cosine, dot, euclidean)
+            grpc_port: Qdrant gRPC port (used when prefer_grpc is True)
+            prefer_grpc: Use the gRPC transport instead of REST/JSON
+            timeout: Request timeout in seconds (client default if None)
+            pool_size: Connection pool size (client default if None); when set, keep it
+                       at least the number of coroutines expected to hit Qdrant concurrently
+            upsert_batch_size: Points per upsert request in add_embeddings
+            upsert_concurrency: Maximum upsert requests in flight per add_embeddings call
+            search_cache_max_size: Number of search_similar results kept in an LRU cache
+                (0 disables caching); writes through this adapter invalidate them
+            search_cache_ttl_seconds: Optional expiry for cached search results, which
+                bounds staleness from writes made by other processes
+            index_fields: Payload fields given a keyword index when a collection is
+                created (default: document_id and chunk_id). Keys used in
+                filter_metadata should be listed here as well, otherwise Qdrant
+                scans every point to apply the filter
+            quantization: Vector quantization for created collections: "scalar" (int8),
+                "binary" or "none"/None for full float32 storage
         """
+        if quantization is None:
+            quantization = "none"
+        if quantization not in self.QUANTIZATION_CONFIGS:
+            raise ValueError(
+                f"Unsupported quantization: {quantization} "
+                f"(expected one of {', '.join(self.QUANTIZATION_CONFIGS)})"
+            )
+        
         self.host = host
         self.port = port
         self.vector_dimension = vector_dimension
         self.distance_metric = distance_metric
+        self.upsert_batch_size = upsert_batch_size
+        self.upsert_concurrency = upsert_concurrency
+        self.quantization = quantization
+        self.index_fields = list(index_fields) if index_fields is not None else list(self.DEFAULT_INDEX_FIELDS)
+        # Nesting depth of begin_bulk_load per collection
+        self._bulk_depth: Dict[str, int] = {}
+        self._search_cache: ResultCache[RetrievalResult] = ResultCache(
+            search_cache_max_size, search_cache_ttl_seconds
+        )
+        # Bumped on every write so cached searches of a collection stop matching
+        self._collection_generation: Dict[str, int] = {}
+        # Collections known to exist, so inserts skip the existence round-trip
+        self._known_collections: Set[str] = set()
+        
+        client_kwargs: Dict[str, Any] = {
+            "host": host,
+            "port": port,
+            "grpc_port": grpc_port,
+            "prefer_grpc": prefer_grpc,
+            "timeout": timeout
+        }
+        if pool_size is not None:
+            client_kwargs["pool_size"] = pool_size
         
-        # Initialize Qdrant client
-        self.client = QdrantClient(host=host, port=port)
+        # Initialize the async Qdrant client (one per adapter, reused for every call)
+        self.client = AsyncQdrantClient(**client_kwargs)
         
         # Distance mapping
         self._distance_map = {
@@ -56,6 +170,16 @@ class QdrantVectorStoreAdapter(VectorStorePort):
             "dot": Distance.DOT,
             "euclidean": Distance.EUCLID
         }
+        
+        # Quantized collections are searched with oversampling + rescoring to keep recall
+        self._search_params: Optional[models.SearchParams] = None
+        if self.QUANTIZATION_CONFIGS[quantization] is not None:
+            self._search_params = models.SearchParams(
+                quantization=models.QuantizationSearchParams(
+                    rescore=True,
+                    oversampling=self.QUANTIZATION_OVERSAMPLING
+                )
+            )
     
     def _string_to_uuid(self, text: str) -> str:
         """Convert a string to a valid UUID using hash."""
@@ -68,50 +192,162 @@ class QdrantVectorStoreAdapter(VectorStorePort):
     
     def _ensure_valid_point_id(self, point_id: str) -> str:
         """Ensure point ID is valid for Qdrant (UUID format)."""
-        try:
-            # Try to parse as UUID
-            uuid.UUID(point_id)
+        if _UUID_RE.fullmatch(point_id):
             return point_id
-        except ValueError:
-            # If not valid UUID, convert string to UUID
-            return self._string_to_uuid(point_id)
+        if _UUID_LIKE_RE.fullmatch(point_id):
+            try:
+                # Other spellings uuid.UUID accepts are kept as before
+                uuid.UUID(point_id)
+                return point_id
+            except ValueError:
+                pass
+        # If not valid UUID, convert string to UUID
+        return self._string_to_uuid(point_id)
     
     async def create_collection(self, collection_name: str, dimension: int, metadata: Optional[Dict[str, Any]] = None) -> bool:
         """Create a new collection in the vector store."""
         try:
-            self.client.create_collection(
+            await self.client.create_collection(
                 collection_name=collection_name,
                 vectors_config=VectorParams(
                     size=dimension,
-                    distance=self._distance_map.get(self.distance_metric, Distance.COSINE)
-                )
+                    distance=self._collection_distance()
+                ),
+                quantization_config=self.QUANTIZATION_CONFIGS[self.quantization]
             )
-            print(f"✅ Created Qdrant collection: {collection_name}")
+            self._known_collections.add(collection_name)
+            await self._create_payload_indexes(collection_name)
+            logger.debug("Created Qdrant collection: %s", collection_name)
             return True
-        except Exception as e:
-            print(f"❌ Failed to create collection {collection_name}: {e}")
+        except Exception:
+            logger.exception("Failed to create collection %s", collection_name)
             return False
     
+    async def _create_payload_indexes(self, collection_name: str) -> None:
+        """Create keyword indexes for index_fields so payload filters avoid full scans."""
+        for field_name in self.index_fields:
+            try:
+                await self.client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=models.PayloadSchemaType.KEYWORD
+                )
+            except Exception as e:
+                # Filtering still works without the index, just slower
+                logger.warning("Failed to index payload field %s in %s: %s", field_name, collection_name, e)
+    
+    def _collection_distance(self) -> Distance:
+        """Distance for new collections; cosine is served as DOT over unit vectors."""
+        if self.distance_metric == "cosine":
+            # Vectors are normalized client-side (see _prepare_vectors), so the
+            # dot product equals cosine similarity without a server-side norm
+            return Distance.DOT
+        return self._distance_map.get(self.distance_metric, Distance.COSINE)
+    
     async def delete_collection(self, collection_name: str) -> bool:
         """Delete a collection from the vector store."""
+        self._known_collections.discard(collection_name)
         try:
-            self.client.delete_collection(collection_name)
-            print(f"✅ Deleted Qdrant collection: {collection_name}")
+            await self.client.delete_collection(collection_name)
+            logger.debug("Deleted Qdrant collection: %s", collection_name)
             return True
-        except Exception as e:
-            print(f"❌ Failed to delete collection {collection_name}: {e}")
+        except Exception:
+            logger.exception("Failed to delete collection %s", collection_name)
             return False
+        finally:
+            self._invalidate_search_cache(collection_name)
     
     async def collection_exists(self, collection_name: str) -> bool:
-        """Check if a collection exists."""
+        """Check if a collection exists (positive answers are remembered)."""
+        if collection_name in self._known_collections:
+            return True
         try:
-            collections = self.client.get_collections()
+            collections = await self.client.get_collections()
             collection_names = [col.name for col in collections.collections]
+            self._known_collections.update(collection_names)
             return collection_name in collection_names
-        except Exception as e:
-            print(f"❌ Failed to check collection existence: {e}")
+        except Exception:
+            logger.exception("Failed to check collection existence")
             return False
     
+    def _build_payload(self, embedding: Embedding, created_at: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the flattened payload in one pass, never storing None values.
+        
+        Base fields come first and metadata fields are flattened to the top level
+        for easy filtering; a None metadata value removes the field entirely.
+        created_at may be passed pre-formatted (see _format_timestamps).
+        """
+        payload = {"document_id": embedding.document_id}
+        if embedding.chunk_id is not None:
+            payload["chunk_id"] = embedding.chunk_id
+        payload["original_embedding_id"] = embedding.id  # Store original ID
+        if embedding.model is not None:
+            payload["model"] = embedding.model  # Store model info
+        payload["dimension"] = embedding.dimension  # Store dimension
+        payload["created_at"] = created_at or embedding.created_at.isoformat()  # Store creation time
+        payload["content"] = ""  # Chunk content, overridden by metadata["content"]
+        
+        for key, value in embedding.metadata.items():
+            if value is not None:
+                payload[key] = value
+            elif key in payload:
+                del payload[key]
+        
+        return payload
+    
+    @staticmethod
+    def _format_timestamps(embeddings: Iterable[Embedding]) -> List[str]:
+        """ISO-format each created_at, formatting every distinct timestamp once."""
+        # Embeddings created in the same ingestion tick share a timestamp
+        iso_cache: Dict[datetime, str] = {}
+        timestamps = []
+        for embedding in embeddings:
+            created_at = iso_cache.get(embedding.created_at)
+            if created_at is None:
+                created_at = iso_cache[embedding.created_at] = embedding.created_at.isoformat()
+            timestamps.append(created_at)
+        return timestamps
+    
+    def _prepare_vectors(self, vectors: Any) -> List[Any]:
+        """
+        Convert one vector (1-D) or a batch of vectors (2-D) to float32 lists.
+        
+        Lists and arrays are gathered into one contiguous float32 array and only
+        turned back into Python floats at the client boundary. For the cosine
+        metric every vector is scaled to unit length, a batch with a single
+        vectorized norm, so collections can use the cheaper DOT distance.
+        """
+        array = np.asarray(vectors, dtype=np.float32)
+        if self.distance_metric == "cosine":
+            # Out of place: float32 input is not copied by asarray and belongs to the caller
+            array = array / (np.linalg.norm(array, axis=-1, keepdims=True) + 1e-12)
+        return array.tolist()
+    
+    def _create_point(self, embedding: Embedding) -> PointStruct:
+        """Build the Qdrant point (valid ID, vector, flattened payload) for an embedding."""
+        return PointStruct(
+            id=self._ensure_valid_point_id(embedding.id),
+            vector=self._prepare_vectors(embedding.vector),
+            payload=self._build_payload(embedding)
+        )
+    
+    def _to_columns(self, embeddings: List[Embedding]) -> Tuple[List[Any], List[List[float]], List[Dict[str, Any]]]:
+        """Split embeddings into parallel id / vector / payload columns."""
+        ids = [self._ensure_valid_point_id(e.id) for e in embeddings]
+        # Convert (and, for cosine, normalize) the whole slice in one NumPy pass
+        vectors = self._prepare_vectors([e.vector for e in embeddings])
+        payloads = [
+            self._build_payload(e, created_at)
+            for e, created_at in zip(embeddings, self._format_timestamps(embeddings))
+        ]
+        return ids, vectors, payloads
+    
+    def _iter_points(self, embeddings: Iterable[Embedding]) -> Iterator[PointStruct]:
+        """Lazily build Qdrant points for streaming uploads."""
+        for embedding in embeddings:
+            yield self._create_point(embedding)
+    
     async def add_embedding(self, embedding: Embedding, collection_name: str) -> bool:
         """Add a single embedding to the collection."""
         try:
@@ -119,50 +355,84 @@ class QdrantVectorStoreAdapter(VectorStorePort):
             if not await self.collection_exists(collection_name):
                 await self.create_collection(collection_name, len(embedding.vector))
             
-            # Prepare metadata payload - flatten all metadata to top level for easy searching
-            payload = {
-                "document_id": embedding.document_id,
-                "chunk_id": embedding.chunk_id,
-                "original_embedding_id": embedding.id,  # Store original ID
-                "model": embedding.model,  # Store model info
-                "dimension": embedding.dimension,  # Store dimension
-                "created_at": embedding.created_at.isoformat(),  # Store creation time
-                "content": embedding.metadata.get("content", ""),  # Store chunk content
-            }
-            
-            # Flatten all metadata fields to top level for easy filtering
-            if embedding.metadata:
-                payload.update(embedding.metadata)
-            
-            # Remove None values to keep payload clean
-            payload = {k: v for k, v in payload.items() if v is not None}
-            
-            # Ensure valid point ID for Qdrant
-            valid_point_id = self._ensure_valid_point_id(embedding.id)
-            
             # Create point for Qdrant
-            point = PointStruct(
-                id=valid_point_id,
-                vector=embedding.vector,
-                payload=payload
-            )
+            point = self._create_point(embedding)
             
             # Store point in Qdrant
-            operation_info = self.client.upsert(
+            operation_info = await self.client.upsert(
                 collection_name=collection_name,
                 points=[point]
             )
             
             return operation_info.status == models.UpdateStatus.COMPLETED
             
-        except Exception as e:
-            print(f"❌ Failed to add embedding: {e}")
-            print(f"   Raw response content:")
-            print(f"   {e}")
+        except Exception:
+            logger.exception("Failed to add embedding")
+            return False
+        finally:
+            self._invalidate_search_cache(collection_name)
+    
+    def _upsert_succeeded(self, operation_info: models.UpdateResult, wait: bool) -> bool:
+        """Check an upsert result (without wait the server only acknowledges it)."""
+        if operation_info.status == models.UpdateStatus.COMPLETED:
+            return True
+        return not wait and operation_info.status == models.UpdateStatus.ACKNOWLEDGED
+    
+    async def _upsert_chunk(
+        self,
+        embeddings: List[Embedding],
+        collection_name: str,
+        semaphore: asyncio.Semaphore,
+        wait: bool = True
+    ) -> bool:
+        """Upsert one slice of embeddings once a concurrency slot is free."""
+        async with semaphore:
+            ids, vectors, payloads = self._to_columns(embeddings)
+            
+            # Store the slice as one columnar batch rather than a list of points
+            operation_info = await self.client.upsert(
+                collection_name=collection_name,
+                points=Batch(ids=ids, vectors=vectors, payloads=payloads),
+                wait=wait
+            )
+            return self._upsert_succeeded(operation_info, wait)
+    
+    async def _upsert_in_batches(
+        self,
+        embeddings: List[Embedding],
+        collection_name: str,
+        wait: bool = True
+    ) -> bool:
+        """Upsert embeddings in upsert_batch_size slices, upsert_concurrency at a time."""
+        semaphore = asyncio.Semaphore(self.upsert_concurrency)
+        chunks = [
+            embeddings[i:i + self.upsert_batch_size]
+            for i in range(0, len(embeddings), self.upsert_batch_size)
+        ]
+        results = await asyncio.gather(
+            *(self._upsert_chunk(chunk, collection_name, semaphore, wait) for chunk in chunks)
+        )
+        if not all(results):
+            logger.error(
+                "Failed to store %d of %d embedding batches in %s",
+                results.count(False), len(chunks), collection_name
+            )
             return False
+        return True
     
-    async def add_embeddings(self, embeddings: List[Embedding], collection_name: str) -> bool:
-        """Add multiple embeddings to the collection."""
+    async def add_embeddings(
+        self,
+        embeddings: List[Embedding],
+        collection_name: str,
+        wait: bool = True
+    ) -> bool:
+        """
+        Add multiple embeddings to the collection.
+        
+        Large inputs are split into upsert_batch_size slices that are uploaded
+        concurrently. With wait=False the call returns once Qdrant has accepted
+        the points, without waiting for them to be applied.
+        """
         try:
             if not embeddings:
                 return True
@@ -171,51 +441,107 @@ class QdrantVectorStoreAdapter(VectorStorePort):
             if not await self.collection_exists(collection_name):
                 await self.create_collection(collection_name, len(embeddings[0].vector))
             
-            points = []
-            for embedding in embeddings:
-                # Prepare metadata payload - flatten all metadata to top level for easy searching
-                payload = {
-                    "document_id": embedding.document_id,
-                    "chunk_id": embedding.chunk_id,
-                    "original_embedding_id": embedding.id,  # Store original ID
-                    "model": embedding.model,  # Store model info
-                    "dimension": embedding.dimension,  # Store dimension
-                    "created_at": embedding.created_at.isoformat(),  # Store creation time
-                    "content": embedding.metadata.get("content", ""),  # Store chunk content
-                }
-                
-                # Flatten all metadata fields to top level for easy filtering
-                if embedding.metadata:
-                    payload.update(embedding.metadata)
-                
-                # Remove None values to keep payload clean
-                payload = {k: v for k, v in payload.items() if v is not None}
-                
-                # Ensure valid point ID for Qdrant
-                valid_point_id = self._ensure_valid_point_id(embedding.id)
-                
-                # Create point for Qdrant
-                point = PointStruct(
-                    id=valid_point_id,
-                    vector=embedding.vector,
-                    payload=payload
-                )
-                points.append(point)
+            if not await self._upsert_in_batches(embeddings, collection_name, wait):
+                return False
             
-            # Store points in Qdrant
-            operation_info = self.client.upsert(
-                collection_name=collection_name,
-                points=points
+            logger.debug("Stored %d embeddings in Qdrant", len(embeddings))
+            return True
+            
+        except Exception:
+            logger.exception("Failed to add embeddings")
+            return False
+        finally:
+            self._invalidate_search_cache(collection_name)
+    
+    async def begin_bulk_load(self, collection_name: str) -> None:
+        """
+        Pause HNSW indexing on a collection ahead of a bulk load.
+        
+        Calls nest per collection: only the first one disables indexing, and it
+        stays off until the matching number of end_bulk_load calls.
+        """
+        depth = self._bulk_depth.get(collection_name, 0)
+        self._bulk_depth[collection_name] = depth + 1
+        if depth == 0:
+            try:
+                await self.client.update_collection(
+                    collection_name=collection_name,
+                    optimizers_config=models.OptimizersConfigDiff(indexing_threshold=0)
+                )
+            except Exception:
+                del self._bulk_depth[collection_name]
+                raise
+    
+    async def end_bulk_load(self, collection_name: str, threshold: Optional[int] = None) -> None:
+        """
+        Resume indexing once the outermost bulk load on a collection ends.
+        
+        The indexing threshold is restored to threshold (INDEXING_THRESHOLD by
+        default), so the optimizer builds the index once over the loaded data.
+        """
+        depth = self._bulk_depth.get(collection_name, 0)
+        if depth > 1:
+            self._bulk_depth[collection_name] = depth - 1
+            return
+        self._bulk_depth.pop(collection_name, None)
+        await self.client.update_collection(
+            collection_name=collection_name,
+            optimizers_config=models.OptimizersConfigDiff(
+                indexing_threshold=self.INDEXING_THRESHOLD if threshold is None else threshold
             )
+        )
+    
+    @asynccontextmanager
+    async def bulk_load_mode(self, collection_name: str) -> AsyncIterator[None]:
+        """
+        Pause HNSW indexing on a collection while bulk-loading it.
+        
+        Wraps begin_bulk_load/end_bulk_load, so the optimizer builds the index
+        once instead of reshuffling segments mid-ingest. Nested or concurrent
+        uses on the same collection share one toggle; indexing resumes when the
+        outermost block exits.
+        """
+        await self.begin_bulk_load(collection_name)
+        try:
+            yield
+        finally:
+            await self.end_bulk_load(collection_name)
+    
+    async def bulk_load(
+        self,
+        embeddings: Iterable[Embedding],
+        collection_name: str,
+        parallel: int = 8,
+        batch_size: int = 256
+    ) -> bool:
+        """
+        Stream a large one-shot load into an existing collection.
+        
+        Points are built lazily and handed to qdrant-client's uploader, which
+        spreads batches over parallel worker processes. Indexing is paused for
+        the duration, and upserts are not waited on, so the data becomes
+        searchable once Qdrant has indexed it.
+        """
+        try:
+            async with self.bulk_load_mode(collection_name):
+                # upload_points blocks on its workers, so keep it off the event loop
+                await asyncio.to_thread(
+                    self.client.upload_points,
+                    collection_name=collection_name,
+                    points=self._iter_points(embeddings),
+                    batch_size=batch_size,
+                    parallel=parallel,
+                    wait=False
+                )
             
-            print(f"✅ Stored {len(points)} embeddings in Qdrant")
-            return operation_info.status == models.UpdateStatus.COMPLETED
+            logger.debug("Bulk loaded embeddings into %s", collection_name)
+            return True
             
-        except Exception as e:
-            print(f"❌ Failed to add embeddings: {e}")
-            print(f"   Raw response content:")
-            print(f"   {e}")
+        except Exception:
+            logger.exception("Failed to bulk load embeddings into %s", collection_name)
             return False
+        finally:
+            self._invalidate_search_cache(collection_name)
     
     async def update_embedding(self, embedding: Embedding, collection_name: str) -> bool:
         """Update an existing embedding in the collection."""
@@ -228,21 +554,23 @@ class QdrantVectorStoreAdapter(VectorStorePort):
             # Convert to valid point ID
             valid_point_id = self._ensure_valid_point_id(embedding_id)
             
-            operation_info = self.client.delete(
+            operation_info = await self.client.delete(
                 collection_name=collection_name,
                 points_selector=models.PointIdsList(points=[valid_point_id])
             )
             
             return operation_info.status == models.UpdateStatus.COMPLETED
             
-        except Exception as e:
-            print(f"❌ Failed to delete embedding {embedding_id}: {e}")
+        except Exception:
+            logger.exception("Failed to delete embedding %s", embedding_id)
             return False
+        finally:
+            self._invalidate_search_cache(collection_name)
     
     async def delete_embeddings_by_document(self, document_id: str, collection_name: str) -> bool:
         """Delete all embeddings for a specific document."""
         try:
-            operation_info = self.client.delete(
+            operation_info = await self.client.delete(
                 collection_name=collection_name,
                 points_selector=models.FilterSelector(
                     filter=models.Filter(
@@ -258,85 +586,187 @@ class QdrantVectorStoreAdapter(VectorStorePort):
             
             return operation_info.status == models.UpdateStatus.COMPLETED
             
-        except Exception as e:
-            print(f"❌ Failed to delete embeddings for document {document_id}: {e}")
+        except Exception:
+            logger.exception("Failed to delete embeddings for document %s", document_id)
             return False
+        finally:
+            self._invalidate_search_cache(collection_name)
     
     async def search_similar(
         self, 
-        query_vector: List[float], 
+        query_vector: VectorLike, 
         collection_name: str, 
         top_k: int = 10,
         score_threshold: Optional[float] = None,
         filter_metadata: Optional[Dict[str, Any]] = None
     ) -> List[RetrievalResult]:
         """Search for similar vectors."""
+        cache_key = None
+        if self._search_cache:
+            cache_key = self._search_cache_key(
+                query_vector, collection_name, top_k, score_threshold, filter_metadata
+            )
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            # Prepare search filter if provided
-            search_filter = None
-            if filter_metadata:
-                search_filter = models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key=f"metadata.{key}",
-                            match=models.MatchValue(value=value)
-                        )
-                        for key, value in filter_metadata.items()
-                    ]
-                )
-            
             # Perform similarity search
-            search_results = self.client.search(
+            response = await self.client.query_points(
                 collection_name=collection_name,
-                query_vector=query_vector,
+                query=self._prepare_vectors(query_vector),
                 limit=top_k,
                 score_threshold=score_threshold,
-                query_filter=search_filter,
+                query_filter=self._build_search_filter(filter_metadata),
+                search_params=self._search_params,
                 with_payload=True,
-                with_vectors=True
+                with_vectors=False  # RetrievalResult carries no vector
             )
             
-            # Format results
-            results = []
-            for result in search_results:
-                payload = result.payload
-                
-                # Use original embedding ID if available, otherwise use point ID
-                original_id = payload.get("original_embedding_id", str(result.id))
-                
-                # Parse created_at from ISO format
-                created_at_str = payload.get("created_at")
-                created_at = datetime.fromisoformat(created_at_str) if created_at_str else datetime.utcnow()
-                
-                # Create Embedding object with all required fields
-                embedding = Embedding(
-                    id=original_id,
-                    document_id=payload["document_id"],
-                    chunk_id=payload["chunk_id"],
-                    vector=result.vector,
-                    model=payload.get("model", "unknown"),
-                    dimension=payload.get("dimension", len(result.vector)),
-                    metadata=payload.get("metadata", {}),
-                    created_at=created_at
-                )
-                
-                # Create RetrievalResult
-                retrieval_result = RetrievalResult(
-                    document_id=payload["document_id"],
-                    chunk_id=payload["chunk_id"],
-                    content=payload.get("content", ""),  # Get stored content
-                    score=result.score,
-                    metadata=payload.get("metadata", {}),
-                    rank=0  # Will be set by retriever
-                )
-                
-                results.append(retrieval_result)
+            results = self._format_search_results(response.points)
+            
+            if cache_key is not None:
+                self._search_cache.put(cache_key, results)
             
             return results
             
-        except Exception as e:
-            print(f"❌ Failed to search vectors: {e}")
+        except Exception:
+            logger.exception("Failed to search vectors")
+            return []
+    
+    async def search_similar_batch(
+        self,
+        query_vectors: Union[List[VectorLike], np.ndarray],
+        collection_name: str,
+        top_k: int = 10,
+        score_threshold: Optional[float] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[RetrievalResult]]:
+        """Search for several query vectors in a single request."""
+        if len(query_vectors) == 0:
             return []
+        
+        try:
+            search_filter = self._build_search_filter(filter_metadata)
+            # Normalize the whole batch at once (one norm over the stacked queries)
+            requests = [
+                models.QueryRequest(
+                    query=query_vector,
+                    filter=search_filter,
+                    limit=top_k,
+                    score_threshold=score_threshold,
+                    params=self._search_params,
+                    with_payload=True,
+                    with_vector=False
+                )
+                for query_vector in self._prepare_vectors(query_vectors)
+            ]
+            
+            responses = await self.client.query_batch_points(
+                collection_name=collection_name,
+                requests=requests
+            )
+            
+            return [self._format_search_results(response.points) for response in responses]
+            
+        except Exception:
+            logger.exception("Failed to batch search vectors")
+            return [[] for _ in query_vectors]
+    
+    def _build_search_filter(self, filter_metadata: Optional[Dict[str, Any]]) -> Optional[models.Filter]:
+        """
+        Prepare the Qdrant search filter, if any.
+        
+        Metadata is flattened into the top level of the payload, so filter keys
+        match payload fields directly; list them in index_fields to keep the
+        match on a payload index instead of a full scan.
+        """
+        if not filter_metadata:
+            return None
+        return models.Filter(
+            must=[
+                models.FieldCondition(
+                    key=key,
+                    match=models.MatchValue(value=value)
+                )
+                for key, value in filter_metadata.items()
+            ]
+        )
+    
+    def _format_search_results(self, search_results: List[models.ScoredPoint]) -> List[RetrievalResult]:
+        """Convert scored points into RetrievalResults."""
+        results = []
+        for result in search_results:
+            payload = result.payload
+            
+            # Create RetrievalResult
+            retrieval_result = RetrievalResult(
+                document_id=payload["document_id"],
+                chunk_id=payload["chunk_id"],
+                content=payload.get("content", ""),  # Get stored content
+                score=result.score,
+                # Metadata fields are stored at top level next to the system fields
+                metadata={key: value for key, value in payload.items() if key not in _SYSTEM_FIELDS},
+                rank=0  # Will be set by retriever
+            )
+            
+            results.append(retrieval_result)
+        
+        return results
+    
+    def _search_cache_key(
+        self,
+        query_vector: VectorLike,
+        collection_name: str,
+        top_k: int,
+        score_threshold: Optional[float],
+        filter_metadata: Optional[Dict[str, Any]]
+    ) -> tuple:
+        """Build the result-cache key for a search_similar() call."""
+        vector_digest = hashlib.blake2b(
+            np.asarray(query_vector, dtype=np.float32).tobytes(), digest_size=16
+        ).digest()
+        generation = self._collection_generation.get(collection_name, 0)
+        return (
+            collection_name, generation, vector_digest, top_k, score_threshold, filter_key(filter_metadata)
+        )
+    
+    def _invalidate_search_cache(self, collection_name: str) -> None:
+        """Make cached searches of a collection unreachable (they age out of the LRU)."""
+        self._collection_generation[collection_name] = (
+            self._collection_generation.get(collection_name, 0) + 1
+        )
+    
+    def clear_search_cache(self) -> None:
+        """Drop all cached search results (e.g. after another process wrote to Qdrant)."""
+        self._search_cache.clear()
+    
+    def _point_to_embedding(self, point) -> Embedding:
+        """Rebuild an Embedding from a Qdrant point with a flattened payload."""
+        payload = point.payload
+        # Points read with with_vectors=False come back without a vector
+        vector = point.vector if point.vector is not None else []
+        
+        # Use original embedding ID if available
+        original_id = payload.get("original_embedding_id", str(point.id))
+        
+        # Parse created_at from ISO format
+        created_at_str = payload.get("created_at")
+        created_at = _parse_iso(created_at_str) if created_at_str else datetime.utcnow()
+        
+        # Metadata fields are stored at top level next to the system fields
+        metadata = {key: value for key, value in payload.items() if key not in _SYSTEM_FIELDS}
+        
+        return Embedding(
+            id=original_id,
+            document_id=payload["document_id"],
+            chunk_id=payload.get("chunk_id"),
+            vector=vector,
+            model=payload.get("model", "unknown"),
+            dimension=payload.get("dimension", len(vector)),
+            metadata=metadata,
+            created_at=created_at
+        )
     
     async def get_embedding(self, embedding_id: str, collection_name: str) -> Optional[Embedding]:
         """Get a specific embedding by ID."""
@@ -344,7 +774,7 @@ class QdrantVectorStoreAdapter(VectorStorePort):
             # Convert to valid point ID
             valid_point_id = self._ensure_valid_point_id(embedding_id)
             
-            points = self.client.retrieve(
+            points = await self.client.retrieve(
                 collection_name=collection_name,
                 ids=[valid_point_id],
                 with_payload=True,
@@ -354,36 +784,17 @@ class QdrantVectorStoreAdapter(VectorStorePort):
             if not points:
                 return None
             
-            point = points[0]
-            payload = point.payload
-            
-            # Use original embedding ID if available
-            original_id = payload.get("original_embedding_id", str(point.id))
-            
-            # Parse created_at from ISO format
-            created_at_str = payload.get("created_at")
-            created_at = datetime.fromisoformat(created_at_str) if created_at_str else datetime.utcnow()
-            
-            return Embedding(
-                id=original_id,
-                document_id=payload["document_id"],
-                chunk_id=payload["chunk_id"],
-                vector=point.vector,
-                model=payload.get("model", "unknown"),
-                dimension=payload.get("dimension", len(point.vector)),
-                metadata=payload.get("metadata", {}),
-                created_at=created_at
-            )
+            return self._point_to_embedding(points[0])
             
-        except Exception as e:
-            print(f"❌ Failed to get embedding {embedding_id}: {e}")
+        except Exception:
+            logger.exception("Failed to get embedding %s", embedding_id)
             return None
     
     async def get_embeddings_by_document(self, document_id: str, collection_name: str) -> List[Embedding]:
         """Get all embeddings for a specific document."""
         try:
             # Search for all embeddings with the given document_id
-            search_results = self.client.scroll(
+            search_results = await self.client.scroll(
                 collection_name=collection_name,
                 scroll_filter=models.Filter(
                     must=[
@@ -398,132 +809,77 @@ class QdrantVectorStoreAdapter(VectorStorePort):
                 limit=1000  # Adjust as needed
             )
             
-            embeddings = []
-            for point in search_results[0]:  # scroll returns (points, next_page_offset)
-                payload = point.payload
-                
-                # Use original embedding ID if available
-                original_id = payload.get("original_embedding_id", str(point.id))
-                
-                # Parse created_at from ISO format
-                created_at_str = payload.get("created_at")
-                created_at = datetime.fromisoformat(created_at_str) if created_at_str else datetime.utcnow()
-                
-                embedding = Embedding(
-                    id=original_id,
-                    document_id=payload["document_id"],
-                    chunk_id=payload["chunk_id"],
-                    vector=point.vector,
-                    model=payload.get("model", "unknown"),
-                    dimension=payload.get("dimension", len(point.vector)),
-                    metadata=payload.get("metadata", {}),
-                    created_at=created_at
-                )
-                embeddings.append(embedding)
-            
-            return embeddings
+            # scroll returns (points, next_page_offset)
+            return [self._point_to_embedding(point) for point in search_results[0]]
             
-        except Exception as e:
-            print(f"❌ Failed to get embeddings for document {document_id}: {e}")
+        except Exception:
+            logger.exception("Failed to get embeddings for document %s", document_id)
             return []
     
-    async def get_all_embeddings(self, collection_name: str, limit: int = 1000, offset: int = 0) -> List[Embedding]:
-        """Get all embeddings from a collection with pagination."""
-        try:
-            # Use scroll to get all points
-            search_results = self.client.scroll(
+    async def iter_all_embeddings(
+        self,
+        collection_name: str,
+        batch_size: int = 1000,
+        limit: Optional[int] = None,
+        offset: Optional[Any] = None
+    ) -> AsyncIterator[Embedding]:
+        """
+        Stream the embeddings of a collection page by page.
+        
+        Follows scroll's next_page_offset so only one page of points is held at
+        a time; limit caps the number of embeddings yielded (None for all) and
+        offset is the point ID to start from. Errors propagate to the caller.
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            points, offset = await self.client.scroll(
                 collection_name=collection_name,
-                limit=limit,
+                limit=batch_size if remaining is None else min(batch_size, remaining),
                 offset=offset,
                 with_payload=True,
                 with_vectors=True
             )
             
-            embeddings = []
-            points = search_results[0] if search_results else []  # scroll returns (points, next_page_offset)
-            
             for point in points:
-                payload = point.payload
-                
-                # Use original embedding ID if available
-                original_id = payload.get("original_embedding_id", str(point.id))
-                
-                # Parse created_at from ISO format
-                created_at_str = payload.get("created_at")
-                created_at = datetime.fromisoformat(created_at_str) if created_at_str else datetime.utcnow()
-                
-                # Get metadata from payload - all fields are stored at top level
-                metadata = {}
-                
-                # Extract all metadata fields from payload (excluding system fields)
-                system_fields = {"document_id", "chunk_id", "original_embedding_id", "model", "dimension", "created_at"}
-                for key, value in payload.items():
-                    if key not in system_fields:
-                        metadata[key] = value
-                
+                embedding = self._point_to_embedding(point)
                 # Ensure email_id is set
-                if "email_id" not in metadata:
-                    metadata["email_id"] = payload.get("document_id")
-                
-                embedding = Embedding(
-                    id=original_id,
-                    document_id=payload["document_id"],
-                    chunk_id=payload["chunk_id"],
-                    vector=point.vector,
-                    model=payload.get("model", "unknown"),
-                    dimension=payload.get("dimension", len(point.vector)),
-                    metadata=metadata,
-                    created_at=created_at
+                if "email_id" not in embedding.metadata:
+                    embedding.metadata["email_id"] = embedding.document_id
+                yield embedding
+            
+            if remaining is not None:
+                remaining -= len(points)
+            if offset is None:
+                break
+    
+    async def get_all_embeddings(self, collection_name: str, limit: int = 1000, offset: int = 0) -> List[Embedding]:
+        """Get all embeddings from a collection with pagination (see iter_all_embeddings)."""
+        try:
+            embeddings = [
+                embedding async for embedding in self.iter_all_embeddings(
+                    collection_name, batch_size=limit or 1000, limit=limit, offset=offset
                 )
-                embeddings.append(embedding)
+            ]
             
-            print(f"✅ Retrieved {len(embeddings)} embeddings from {collection_name}")
+            logger.debug("Retrieved %d embeddings from %s", len(embeddings), collection_name)
             return embeddings
             
-        except Exception as e:
-            print(f"❌ Failed to get all embeddings from {collection_name}: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Failed to get all embeddings from %s", collection_name)
             return []
     
-    async def count_embeddings(self, collection_name: str) -> int:
-        """Count total number of embeddings in the collection."""
+    async def count_embeddings(self, collection_name: str, exact: bool = False) -> int:
+        """
+        Count total number of embeddings in the collection.
+        
+        By default Qdrant answers from segment metadata, which is fast but may
+        briefly lag recent deletes; pass exact=True for a precise count.
+        """
         try:
-            # Use scroll with proper next_page_offset handling (Qdrant official way)
-            count = 0
-            next_page_offset = None
-            batch_size = 100
-            max_iterations = 1000  # Safety limit to prevent infinite loops
-            iterations = 0
-            
-            while iterations < max_iterations:
-                iterations += 1
-                
-                # Use scroll API correctly according to Qdrant documentation
-                result = self.client.scroll(
-                    collection_name=collection_name,
-                    limit=batch_size,
-                    offset=next_page_offset,  # Use next_page_offset from previous result
-                    with_payload=False,
-                    with_vectors=False
-                )
-                
-                if not result or len(result) < 2:
-                    break
-                    
-                points, next_page_offset = result[0], result[1]
-                count += len(points)
-                
-                # If no more points or no next page offset, we're done
-                if len(points) == 0 or next_page_offset is None:
-                    break
-            
-            if iterations >= max_iterations:
-                print(f"⚠️ Warning: count_embeddings hit max iterations limit for {collection_name}")
-            
-            return count
-        except Exception as e:
-            print(f"❌ Failed to count embeddings: {e}")
+            result = await self.client.count(collection_name=collection_name, exact=exact)
+            return result.count
+        except Exception:
+            logger.exception("Failed to count embeddings")
             return 0
     
     async def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
@@ -540,17 +896,17 @@ class QdrantVectorStoreAdapter(VectorStorePort):
                 "status": "active"
             }
             
-        except Exception as e:
-            print(f"❌ Failed to get collection info: {e}")
+        except Exception:
+            logger.exception("Failed to get collection info")
             return {}
     
     async def list_collections(self) -> List[str]:
         """List all available collections."""
         try:
-            collections = self.client.get_collections()
+            collections = await self.client.get_collections()
             return [col.name for col in collections.collections]
-        except Exception as e:
-            print(f"❌ Failed to list collections: {e}")
+        except Exception:
+            logger.exception("Failed to list collections")
             return []
     
     def get_store_type(self) -> str:
@@ -561,10 +917,10 @@ class QdrantVectorStoreAdapter(VectorStorePort):
         """Check if the vector store is healthy and accessible."""
         try:
             # Try to get collections list
-            collections = self.client.get_collections()
+            collections = await self.client.get_collections()
             return True
-        except Exception as e:
-            print(f"❌ Qdrant health check failed: {e}")
+        except Exception:
+            logger.exception("Qdrant health check failed")
             return False
     
     async def optimize_collection(self, collection_name: str) -> bool:
@@ -572,10 +928,10 @@ class QdrantVectorStoreAdapter(VectorStorePort):
         try:
             # Qdrant automatically optimizes, but we can trigger it manually
             # This is a placeholder - actual optimization depends on Qdrant version
-            print(f"✅ Collection {collection_name} optimization triggered")
+            logger.debug("Collection %s optimization triggered", collection_name)
             return True
-        except Exception as e:
-            print(f"❌ Failed to optimize collection {collection_name}: {e}")
+        except Exception:
+            logger.exception("Failed to optimize collection %s", collection_name)
             return False
 
 
@@ -584,7 +940,11 @@ def create_qdrant_adapter(
     host: str = "localhost",
     port: int = 6333,
     vector_dimension: int = 1536,
-    distance_metric: str = "cosine"
+    distance_metric: str = "cosine",
+    prefer_grpc: bool = True,
+    grpc_port: int = 6334,
+    pool_size: Optional[int] = None,
+    timeout: Optional[int] = 60
 ) -> QdrantVectorStoreAdapter:
     """
     Factory function to create a Qdrant vector store adapter.
@@ -594,6 +954,11 @@ def create_qdrant_adapter(
         port: Qdrant server port  
         vector_dimension: Dimension of vectors
         distance_metric: Distance metric for similarity
+        prefer_grpc: Use the gRPC transport (binary payloads, HTTP/2 multiplexing)
+        grpc_port: Qdrant gRPC port
+        pool_size: Connection pool size (client default if None); when set, keep it at
+                   least the number of coroutines expected to upsert/search concurrently
+        timeout: Request timeout in seconds
         
     Returns:
         Configured QdrantVectorStoreAdapter instance
@@ -602,5 +967,9 @@ def create_qdrant_adapter(
         host=host,
         port=port,
         vector_dimension=vector_dimension,
-        distance_metric=distance_metric
+        distance_metric=distance_metric,
+        grpc_port=grpc_port,
+        prefer_grpc=prefer_grpc,
+        timeout=timeout,
+        pool_size=pool_size
     )
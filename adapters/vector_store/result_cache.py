@@ -0,0 +1,64 @@
+"""
+Small TTL-bounded LRU cache shared by the retriever and vector store adapters.
+"""
+
+from typing import Any, Dict, Generic, Hashable, List, Optional, TypeVar
+from collections import OrderedDict
+import time
+
+T = TypeVar("T")
+
+
+def filter_key(filter_metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Build a hashable, order-independent key for a metadata filter."""
+    return repr(sorted(filter_metadata.items())) if filter_metadata else None
+
+
+class ResultCache(Generic[T]):
+    """
+    LRU cache of result lists whose entries expire after ttl_seconds.
+    
+    A max_size of 0 disables the cache; a ttl_seconds of None keeps entries
+    until they are evicted. Only the lists are copied on the way in and out:
+    callers can reorder or truncate what they get back, but the result
+    objects themselves are shared with the cache and must not be mutated.
+    """
+    
+    def __init__(self, max_size: int, ttl_seconds: Optional[float] = None):
+        self.max_size = max(0, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, List[T]]]" = OrderedDict()
+    
+    def __bool__(self) -> bool:
+        """True when the cache is enabled."""
+        return self.max_size > 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Hashable) -> Optional[List[T]]:
+        """Get cached results, refreshing LRU order; expired entries are dropped."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, results = entry
+        if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return list(results)
+    
+    def put(self, key: Hashable, results: List[T]) -> None:
+        """Store results, evicting the least recently used entry on overflow."""
+        if not self.max_size:
+            return
+        self._entries[key] = (time.monotonic(), list(results))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
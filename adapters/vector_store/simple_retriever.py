@@ -2,11 +2,14 @@
 Simple retriever adapter that uses vector store directly.
 """
 
-from typing import List, Optional, Dict, Any
+import asyncio
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
 from core.entities.document import Query, RetrievalResult
 from core.ports.retriever import RetrieverPort
 from core.ports.vector_store import VectorStorePort
 from core.ports.embedding_model import EmbeddingModelPort
+from adapters.vector_store.ensemble_retriever import reciprocal_rank_fusion
 
 
 class SimpleRetrieverAdapter(RetrieverPort):
@@ -15,11 +18,30 @@ class SimpleRetrieverAdapter(RetrieverPort):
     def __init__(
         self,
         vector_store: VectorStorePort,
-        embedding_model: EmbeddingModelPort
+        embedding_model: EmbeddingModelPort,
+        rrf_k: int = 60,  # RRF parameter for fusing per-chunk results
+        query_cache_max_size: int = 1024
     ):
+        """
+        Initialize simple retriever.
+        
+        Args:
+            vector_store: Vector store searched for similar chunks
+            embedding_model: Model used to embed query texts
+            rrf_k: Parameter for Reciprocal Rank Fusion in retrieve_similar_documents
+            query_cache_max_size: Number of query embeddings kept in an LRU cache
+                (0 disables caching)
+        """
         self._vector_store = vector_store
         self._embedding_model = embedding_model
         self._collection_name = "documents"
+        self._rrf_k = rrf_k
+        self._query_cache_max_size = max(0, query_cache_max_size)
+        self._query_cache: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        # Embedding requests in flight, shared by concurrent callers of the same query
+        self._query_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
     
     def set_collection_name(self, collection_name: str) -> None:
         """Set the collection name for retrieval."""
@@ -42,8 +64,8 @@ class SimpleRetrieverAdapter(RetrieverPort):
     ) -> List[RetrievalResult]:
         """Retrieve documents based on query."""
         try:
-            # Generate embedding for query
-            query_vector = await self._embedding_model.embed_query(query.text)
+            # Generate embedding for query (cached per model and text)
+            query_vector = await self._embed_query(query.text)
             
             # Search in vector store
             search_results = await self._vector_store.search_similar(
@@ -55,22 +77,186 @@ class SimpleRetrieverAdapter(RetrieverPort):
             )
             
             # Convert to RetrievalResult
-            results = []
-            for i, result in enumerate(search_results):
-                retrieval_result = RetrievalResult(
-                    document_id=result.document_id,
-                    chunk_id=result.chunk_id,
-                    content=result.content,
-                    score=result.score,
-                    rank=i + 1,
-                    metadata=result.metadata
+            return self._to_retrieval_results(search_results)
+            
+        except Exception as e:
+            raise Exception(f"Retrieval failed: {str(e)}")
+    
+    async def _embed_query(self, text: str) -> List[float]:
+        """
+        Embed a query text through the LRU cache.
+        
+        Concurrent misses for the same text share one embedding request, which
+        keeps running (and fills the cache) even if the caller that started it
+        is cancelled.
+        """
+        if not self._query_cache_max_size:
+            return await self._embedding_model.embed_query(text)
+        
+        key = (self._embedding_model.get_model_name(), text)
+        vector = self._query_cache.get(key)
+        if vector is not None:
+            self._query_cache.move_to_end(key)
+            self._query_cache_hits += 1
+            return vector
+        
+        pending = self._query_inflight.get(key)
+        if pending is None:
+            self._query_cache_misses += 1
+            pending = asyncio.ensure_future(self._embedding_model.embed_query(text))
+            self._query_inflight[key] = pending
+            pending.add_done_callback(lambda future: self._finish_query_embedding(key, future))
+        else:
+            self._query_cache_hits += 1
+        
+        return await asyncio.shield(pending)
+    
+    def _finish_query_embedding(self, key: Tuple[str, str], future: asyncio.Future) -> None:
+        """Cache a finished query embedding, evicting the least recently used entry on overflow."""
+        self._query_inflight.pop(key, None)
+        # exception() also marks a failure as retrieved when every caller has gone away
+        if future.cancelled() or future.exception() is not None:
+            return
+        
+        self._query_cache[key] = future.result()
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > self._query_cache_max_size:
+            self._query_cache.popitem(last=False)
+    
+    async def _embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several query texts through the LRU cache with one request for the misses.
+        
+        Misses are registered as in-flight like in _embed_query, so concurrent
+        single or batched lookups of the same text share the request.
+        """
+        if not self._query_cache_max_size:
+            vectors = await self._embedding_model.embed_texts(texts)
+            if len(vectors) != len(texts):
+                # Some texts were dropped (e.g. empty queries); embed them one by one
+                vectors = await asyncio.gather(*(self._embedding_model.embed_query(text) for text in texts))
+            return list(vectors)
+        
+        model_name = self._embedding_model.get_model_name()
+        lookups: Dict[str, Any] = {}
+        misses: List[str] = []
+        for text in dict.fromkeys(texts):
+            key = (model_name, text)
+            vector = self._query_cache.get(key)
+            if vector is not None:
+                self._query_cache.move_to_end(key)
+                self._query_cache_hits += 1
+                lookups[text] = vector
+                continue
+            
+            pending = self._query_inflight.get(key)
+            if pending is None:
+                self._query_cache_misses += 1
+                pending = asyncio.get_running_loop().create_future()
+                self._query_inflight[key] = pending
+                pending.add_done_callback(lambda future, key=key: self._finish_query_embedding(key, future))
+                misses.append(text)
+            else:
+                self._query_cache_hits += 1
+            lookups[text] = pending
+        
+        if misses:
+            futures = [lookups[text] for text in misses]
+            batch = asyncio.ensure_future(self._embedding_model.embed_texts(misses))
+            batch.add_done_callback(lambda done: self._resolve_query_embeddings(misses, futures, done))
+        
+        for text, lookup in lookups.items():
+            if isinstance(lookup, asyncio.Future):
+                lookups[text] = await asyncio.shield(lookup)
+        return [lookups[text] for text in texts]
+    
+    def _resolve_query_embeddings(
+        self,
+        texts: List[str],
+        futures: List[asyncio.Future],
+        batch: asyncio.Future
+    ) -> None:
+        """Hand the vectors of a batched embedding request to the in-flight futures of its texts."""
+        if batch.cancelled() or batch.exception() is not None:
+            for future in futures:
+                self._copy_outcome(batch, future)
+            return
+        
+        vectors = batch.result()
+        if len(vectors) == len(texts):
+            for future, vector in zip(futures, vectors):
+                if not future.done():
+                    future.set_result(vector)
+            return
+        
+        # Some texts were dropped (e.g. empty queries); embed them one by one
+        for text, future in zip(texts, futures):
+            single = asyncio.ensure_future(self._embedding_model.embed_query(text))
+            single.add_done_callback(lambda done, future=future: self._copy_outcome(done, future))
+    
+    @staticmethod
+    def _copy_outcome(source: asyncio.Future, target: asyncio.Future) -> None:
+        """Resolve target with the result, exception or cancellation of source."""
+        if target.done():
+            return
+        if source.cancelled():
+            target.cancel()
+        elif source.exception() is not None:
+            target.set_exception(source.exception())
+        else:
+            target.set_result(source.result())
+    
+    def clear_query_cache(self) -> None:
+        """Drop all cached query embeddings (e.g. after switching embedding models)."""
+        self._query_cache.clear()
+    
+    async def retrieve_batch(
+        self,
+        queries: List[Query],
+        top_k: int = 10,
+        score_threshold: Optional[float] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[RetrievalResult]]:
+        """Retrieve documents for several queries, embedding the uncached ones in a single call."""
+        if not queries:
+            return []
+        
+        try:
+            # Embed all cache misses in one request
+            query_vectors = await self._embed_queries([query.text for query in queries])
+            
+            # Search in vector store concurrently
+            all_search_results = await asyncio.gather(*(
+                self._vector_store.search_similar(
+                    query_vector=query_vector,
+                    collection_name=self._collection_name,
+                    top_k=top_k,
+                    score_threshold=score_threshold,
+                    filter_metadata=filter_metadata
                 )
-                results.append(retrieval_result)
+                for query_vector in query_vectors
+            ))
             
-            return results
+            return [self._to_retrieval_results(search_results) for search_results in all_search_results]
             
         except Exception as e:
-            raise Exception(f"Retrieval failed: {str(e)}")
+            raise Exception(f"Batch retrieval failed: {str(e)}")
+    
+    def _to_retrieval_results(self, search_results: List[RetrievalResult]) -> List[RetrievalResult]:
+        """Convert vector store search results to ranked RetrievalResults."""
+        results = []
+        for i, result in enumerate(search_results):
+            retrieval_result = RetrievalResult(
+                document_id=result.document_id,
+                chunk_id=result.chunk_id,
+                content=result.content,
+                score=result.score,
+                rank=i + 1,
+                metadata=result.metadata
+            )
+            results.append(retrieval_result)
+        
+        return results
     
     async def retrieve_by_text(
         self,
@@ -111,37 +297,37 @@ class SimpleRetrieverAdapter(RetrieverPort):
             if not doc_embeddings:
                 return []
             
-            # Use the first embedding as reference (could be improved)
-            reference_vector = doc_embeddings[0].vector
-            
-            # Search for similar vectors
-            search_results = await self._vector_store.search_similar(
-                query_vector=reference_vector,
+            # Search with every chunk of the reference document in one batched call,
+            # fetching extra hits since the document's own chunks rank near the top
+            all_search_results = await self._vector_store.search_similar_batch(
+                query_vectors=[embedding.vector for embedding in doc_embeddings],
                 collection_name=self._collection_name,
-                top_k=top_k + 10,  # Get more to filter out self-matches
+                top_k=top_k + max(10, len(doc_embeddings)),
                 score_threshold=score_threshold
             )
             
-            # Filter out the reference document and convert to RetrievalResult
-            results = []
-            rank = 1
-            for result in search_results:
-                if result.document_id != document_id:
-                    retrieval_result = RetrievalResult(
-                        document_id=result.document_id,
-                        chunk_id=result.chunk_id,
-                        content=result.content,
-                        score=result.score,
-                        rank=rank,
-                        metadata=result.metadata
-                    )
-                    results.append(retrieval_result)
-                    rank += 1
-                    
-                    if len(results) >= top_k:
-                        break
-            
-            return results
+            # Filter out the reference document
+            candidate_lists = [
+                [result for result in search_results if result.document_id != document_id]
+                for search_results in all_search_results
+            ]
+            
+            if len(candidate_lists) == 1:
+                return self._to_retrieval_results(candidate_lists[0][:top_k])
+            
+            # RRF decides the order across chunks, but each hit reports its best
+            # per-chunk similarity so scores mean the same for one-chunk documents
+            ranked_lists = [self._to_retrieval_results(candidates) for candidates in candidate_lists]
+            best_scores: Dict[Tuple[str, Optional[str]], float] = {}
+            for results in ranked_lists:
+                for result in results:
+                    key = result.get_key()
+                    best_scores[key] = max(best_scores.get(key, result.score), result.score)
+            
+            fused_results = reciprocal_rank_fusion(ranked_lists, top_k, self._rrf_k)
+            for result in fused_results:
+                result.score = best_scores[result.get_key()]
+            return fused_results
             
         except Exception as e:
             raise Exception(f"Similar document retrieval failed: {str(e)}")
@@ -168,6 +354,10 @@ class SimpleRetrieverAdapter(RetrieverPort):
             "collection_name": self._collection_name,
             "embedding_model": self._embedding_model.get_model_name(),
             "vector_dimension": self._embedding_model.get_dimension(),
+            "query_cache_max_size": self._query_cache_max_size,
+            "query_cache_size": len(self._query_cache),
+            "query_cache_hits": self._query_cache_hits,
+            "query_cache_misses": self._query_cache_misses,
             "capabilities": [
                 "similarity_search",
                 "document_similarity",
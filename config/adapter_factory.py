@@ -154,12 +154,14 @@ class AdapterFactory:
                 weights = kwargs.get('weights', None)
             
             rrf_k = kwargs.get('rrf_k', 60)
+            retrieve_deadline_ms = kwargs.get('retrieve_deadline_ms', None)
             
             return EnsembleRetrieverAdapter(
                 retrievers=retrievers,
                 fusion_strategy=fusion_strategy,
                 weights=weights,
-                rrf_k=rrf_k
+                rrf_k=rrf_k,
+                retrieve_deadline_ms=retrieve_deadline_ms
             )
         else:
             raise ValueError(f"지원하지 않는 리트리버 타입: {adapter_type}")
@@ -2,8 +2,8 @@
 Document domain entities for Document Embedding & Retrieval System.
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import uuid
 
@@ -112,7 +112,7 @@ class DocumentChunk:
         return len(self.content)
 
 
-@dataclass
+@dataclass(slots=True)
 class Embedding:
     """Embedding entity for vector representations."""
     
@@ -179,7 +179,7 @@ class Embedding:
         return dot_product / (norm_a * norm_b)
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievalResult:
     """Retrieval result entity."""
     
@@ -189,6 +189,10 @@ class RetrievalResult:
     score: float
     metadata: Dict[str, Any]
     rank: int
+    embedding: Optional[Embedding] = field(default=None, repr=False, compare=False)
+    _key: Optional[Tuple[str, Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     @classmethod
     def create(
@@ -210,6 +214,13 @@ class RetrievalResult:
             rank=rank
         )
     
+    def get_key(self) -> Tuple[str, Optional[str]]:
+        """Get the (document_id, chunk_id) identity key, computed once per result."""
+        key = self._key
+        if key is None:
+            key = self._key = (self.document_id, self.chunk_id)
+        return key
+    
     def is_chunk_result(self) -> bool:
         """Check if this is a chunk-level result."""
         return self.chunk_id is not None
@@ -2,6 +2,7 @@
 Retriever port interface for Document Embedding & Retrieval System.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
 from core.entities.document import Query, RetrievalResult
@@ -21,6 +22,28 @@ class RetrieverPort(ABC):
         """Retrieve relevant documents for a query."""
         pass
     
+    async def retrieve_batch(
+        self,
+        queries: List[Query],
+        top_k: int = 10,
+        score_threshold: Optional[float] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[RetrievalResult]]:
+        """Retrieve results for several queries sharing the same parameters.
+        
+        The default runs retrieve() for each query concurrently; adapters
+        that can embed or search in bulk should override it.
+        """
+        return list(await asyncio.gather(*(
+            self.retrieve(
+                query=query,
+                top_k=top_k,
+                score_threshold=score_threshold,
+                filter_metadata=filter_metadata
+            )
+            for query in queries
+        )))
+    
     @abstractmethod
     async def retrieve_by_text(
         self, 
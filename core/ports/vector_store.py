@@ -2,6 +2,7 @@
 Vector store port interface for Document Embedding & Retrieval System.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any, Tuple
 from core.entities.document import Embedding, RetrievalResult
@@ -62,6 +63,30 @@ class VectorStorePort(ABC):
         """Search for similar vectors."""
         pass
     
+    async def search_similar_batch(
+        self,
+        query_vectors: List[List[float]],
+        collection_name: str,
+        top_k: int = 10,
+        score_threshold: Optional[float] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[RetrievalResult]]:
+        """Search for several query vectors sharing the same parameters.
+        
+        The default runs search_similar() for each vector concurrently; stores
+        with a native multi-query search should override it.
+        """
+        return list(await asyncio.gather(*(
+            self.search_similar(
+                query_vector=query_vector,
+                collection_name=collection_name,
+                top_k=top_k,
+                score_threshold=score_threshold,
+                filter_metadata=filter_metadata
+            )
+            for query_vector in query_vectors
+        )))
+    
     @abstractmethod
     async def get_embedding(self, embedding_id: str, collection_name: str) -> Optional[Embedding]:
         """Get a specific embedding by ID."""
@@ -36,6 +36,7 @@ def process_document(file_path: str, output: Optional[str], chunker: str, embedd
     """Process a single document: load, chunk, and embed."""
     
     async def _process():
+        document_loader = None
         try:
             # Initialize adapter factory
             factory = AdapterFactory()
@@ -63,7 +64,7 @@ def process_document(file_path: str, output: Optional[str], chunker: str, embedd
                 if not is_healthy:
                     click.echo(f"❌ {vector_store.title()} is not accessible. Make sure the server is running.")
                     if vector_store == 'qdrant':
-                        click.echo("   docker run -p 6333:6333 qdrant/qdrant")
+                        click.echo("   docker run -p 6333:6333 -p 6334:6334 qdrant/qdrant")
                     click.echo("   Or use --vector-store mock for testing")
                     return
             
@@ -100,6 +101,11 @@ def process_document(file_path: str, output: Optional[str], chunker: str, embedd
             
         except Exception as e:
             click.echo(f"❌ Unexpected error: {str(e)}")
+        finally:
+            # Loaders holding an HTTP session (e.g. the web scraper) must close it on this loop
+            close = getattr(document_loader, "close", None)
+            if close is not None:
+                await close()
     
     # Run async function
     asyncio.run(_process())
@@ -218,7 +224,7 @@ def search_similar(document_id: str, top_k: int, output: Optional[str]):
             is_healthy = await vector_store.health_check()
             if not is_healthy:
                 click.echo("❌ Qdrant is not accessible. Make sure Qdrant server is running:")
-                click.echo("   docker run -p 6333:6333 qdrant/qdrant")
+                click.echo("   docker run -p 6333:6333 -p 6334:6334 qdrant/qdrant")
                 return
             
             # Initialize retriever
@@ -300,7 +306,7 @@ def collection_stats():
             is_healthy = await vector_store.health_check()
             if not is_healthy:
                 click.echo("❌ Qdrant is not accessible. Make sure Qdrant server is running:")
-                click.echo("   docker run -p 6333:6333 qdrant/qdrant")
+                click.echo("   docker run -p 6333:6333 -p 6334:6334 qdrant/qdrant")
                 return
             
             # Initialize retriever
@@ -498,7 +504,7 @@ def test_qdrant():
             
             if not is_healthy:
                 click.echo("❌ Qdrant is not accessible. Make sure Qdrant server is running.")
-                click.echo("   You can start Qdrant with: docker run -p 6333:6333 qdrant/qdrant")
+                click.echo("   You can start Qdrant with: docker run -p 6333:6333 -p 6334:6334 qdrant/qdrant")
                 return
             
             click.echo("✅ Qdrant is healthy!")
@@ -579,7 +585,7 @@ def test_qdrant():
             click.echo(f"❌ Error testing Qdrant: {str(e)}")
             if "Connection refused" in str(e) or "ConnectError" in str(e):
                 click.echo("   Make sure Qdrant server is running:")
-                click.echo("   docker run -p 6333:6333 qdrant/qdrant")
+                click.echo("   docker run -p 6333:6333 -p 6334:6334 qdrant/qdrant")
     
     # Run async function
     asyncio.run(_test())
@@ -0,0 +1,148 @@
+"""
+Tests for BatchingRetrieverProxy micro-batching and future resolution.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.vector_store.batching_retriever import BatchingRetrieverProxy
+from adapters.vector_store.mock_vector_store import MockVectorStoreAdapter
+from adapters.vector_store.simple_retriever import SimpleRetrieverAdapter
+from core.entities.document import Embedding, Query
+
+
+class MockEmbeddingModel:
+    """Embeds a text as a vector pointing at the document with the same name."""
+
+    def get_model_name(self):
+        return "mock-embedding"
+
+    def get_dimension(self):
+        return 3
+
+    def is_available(self):
+        return True
+
+    async def embed_query(self, text):
+        return self._vector(text)
+
+    async def embed_texts(self, texts):
+        return [self._vector(text) for text in texts]
+
+    @staticmethod
+    def _vector(text):
+        return {"x": [1.0, 0.0, 0.0], "y": [0.0, 1.0, 0.0], "z": [0.0, 0.0, 1.0]}[text]
+
+
+class RecordingRetriever(SimpleRetrieverAdapter):
+    """Simple retriever that records retrieve_batch calls and can misbehave."""
+
+    def __init__(self, vector_store, embedding_model, drop_results=0, block=False):
+        super().__init__(vector_store, embedding_model)
+        self.batches = []
+        self._drop_results = drop_results
+        self._block = block
+
+    async def retrieve_batch(self, queries, top_k=10, score_threshold=None, filter_metadata=None):
+        self.batches.append([query.text for query in queries])
+        if self._block:
+            await asyncio.Event().wait()
+        results = await super().retrieve_batch(queries, top_k, score_threshold, filter_metadata)
+        return results[:len(results) - self._drop_results]
+
+
+async def _retriever(**kwargs) -> RecordingRetriever:
+    vector_store = MockVectorStoreAdapter()
+    await vector_store.create_collection("documents", 3)
+    await vector_store.add_embeddings([
+        Embedding.create(name, MockEmbeddingModel._vector(name), "mock-embedding", chunk_id=f"{name}-0")
+        for name in ("x", "y", "z")
+    ], "documents")
+    return RecordingRetriever(vector_store, MockEmbeddingModel(), **kwargs)
+
+
+async def test_concurrent_retrieves_share_one_batch():
+    """Concurrent calls with equal parameters become one retrieve_batch call."""
+    retriever = await _retriever()
+    proxy = BatchingRetrieverProxy(retriever, max_batch_size=8, max_delay_ms=5)
+
+    results = await asyncio.gather(*(
+        proxy.retrieve(Query.create(text), top_k=1) for text in ("x", "y", "z")
+    ))
+
+    assert retriever.batches == [["x", "y", "z"]]
+    assert [result[0].document_id for result in results] == ["x", "y", "z"]
+
+
+async def test_different_parameters_use_separate_batches():
+    """Only calls with identical top_k, threshold and filter are grouped."""
+    retriever = await _retriever()
+    proxy = BatchingRetrieverProxy(retriever, max_batch_size=8, max_delay_ms=5)
+
+    await asyncio.gather(
+        proxy.retrieve(Query.create("x"), top_k=1),
+        proxy.retrieve(Query.create("y"), top_k=2),
+        proxy.retrieve(Query.create("z"), top_k=1)
+    )
+
+    assert sorted(retriever.batches) == [["x", "z"], ["y"]]
+
+
+async def test_full_batch_flushes_without_waiting():
+    """A batch is sent as soon as it reaches max_batch_size."""
+    retriever = await _retriever()
+    proxy = BatchingRetrieverProxy(retriever, max_batch_size=2, max_delay_ms=10_000)
+
+    await asyncio.wait_for(asyncio.gather(
+        proxy.retrieve(Query.create("x")),
+        proxy.retrieve(Query.create("y"))
+    ), timeout=1)
+
+    assert retriever.batches == [["x", "y"]]
+
+
+async def test_short_batch_result_fails_every_caller():
+    """Callers fail instead of hanging when retrieve_batch returns too few lists."""
+    retriever = await _retriever(drop_results=1)
+    proxy = BatchingRetrieverProxy(retriever, max_batch_size=8, max_delay_ms=5)
+
+    results = await asyncio.wait_for(asyncio.gather(
+        proxy.retrieve(Query.create("x")),
+        proxy.retrieve(Query.create("y")),
+        return_exceptions=True
+    ), timeout=1)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def _cancel_batch(start_first: bool) -> list:
+    """Cancel the flush task of a two-query batch and collect the callers' outcomes."""
+    retriever = await _retriever(block=True)
+    proxy = BatchingRetrieverProxy(retriever, max_batch_size=2, max_delay_ms=5)
+
+    callers = [asyncio.ensure_future(proxy.retrieve(Query.create(text))) for text in ("x", "y")]
+    while not proxy._running:
+        await asyncio.sleep(0)
+    if start_first:
+        while not retriever.batches:
+            await asyncio.sleep(0)
+    for task in list(proxy._running):
+        task.cancel()
+
+    return await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), timeout=1)
+
+
+async def test_cancelled_batch_cancels_every_caller():
+    """Cancelling an in-flight flush task cancels the waiting callers instead of hanging them."""
+    results = await _cancel_batch(start_first=True)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+async def test_batch_cancelled_before_start_cancels_every_caller():
+    """Callers are released even when the flush task is cancelled before it runs."""
+    results = await _cancel_batch(start_first=False)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
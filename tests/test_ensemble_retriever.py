@@ -0,0 +1,172 @@
+"""
+Tests for EnsembleRetrieverAdapter deadlines and result caching.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.vector_store import result_cache
+from adapters.vector_store.ensemble_retriever import EnsembleRetrieverAdapter, FusionStrategy
+from core.entities.document import Query, RetrievalResult
+from core.ports.retriever import RetrieverPort
+
+
+class StubRetriever(RetrieverPort):
+    """Retriever returning fixed documents, optionally after a delay or with an error."""
+
+    def __init__(self, document_ids, delay=0.0, error=None):
+        self.document_ids = document_ids
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    async def retrieve(self, query, top_k=10, score_threshold=None, filter_metadata=None):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return [
+            RetrievalResult.create(document_id, f"content of {document_id}", 1.0 / (rank + 1), rank + 1)
+            for rank, document_id in enumerate(self.document_ids[:top_k])
+        ]
+
+    async def retrieve_by_text(self, text, top_k=10, score_threshold=None, filter_metadata=None):
+        return await self.retrieve(Query.create(text), top_k, score_threshold, filter_metadata)
+
+    async def retrieve_similar_documents(self, document_id, top_k=10, score_threshold=None):
+        return []
+
+    async def retrieve_with_reranking(self, query, top_k=10, rerank_top_k=50, score_threshold=None):
+        return await self.retrieve(query, top_k, score_threshold)
+
+    def get_retriever_type(self):
+        return "stub"
+
+    async def get_retriever_info(self):
+        return {"type": "stub"}
+
+    def set_collection_name(self, collection_name):
+        pass
+
+    def get_collection_name(self):
+        return "documents"
+
+
+def _document_ids(results):
+    return [result.document_id for result in results]
+
+
+async def test_slow_retriever_is_cancelled_at_deadline():
+    """A retriever still running at the deadline is cancelled and contributes nothing."""
+    fast = StubRetriever(["doc-a", "doc-b"])
+    slow = StubRetriever(["doc-c"], delay=10)
+    ensemble = EnsembleRetrieverAdapter([fast, slow], retrieve_deadline_ms=50)
+
+    results = await asyncio.wait_for(ensemble.retrieve(Query.create("query"), top_k=5), timeout=1)
+
+    assert _document_ids(results) == ["doc-a", "doc-b"]
+    assert slow.cancelled
+
+
+async def test_single_retriever_deadline_returns_empty():
+    """With one retriever the deadline still applies to the directly awaited call."""
+    ensemble = EnsembleRetrieverAdapter([StubRetriever(["doc-a"], delay=10)], retrieve_deadline_ms=20)
+
+    assert await asyncio.wait_for(ensemble.retrieve(Query.create("query")), timeout=1) == []
+
+
+async def test_failing_retriever_does_not_fail_the_ensemble():
+    """Errors from one retriever are logged and the others' results are still fused."""
+    ensemble = EnsembleRetrieverAdapter(
+        [StubRetriever(["doc-a"]), StubRetriever(["doc-b"], error=RuntimeError("down"))],
+        fusion_strategy=FusionStrategy.SCORE_FUSION
+    )
+
+    assert _document_ids(await ensemble.retrieve(Query.create("query"))) == ["doc-a"]
+
+
+async def test_repeated_retrieve_is_served_from_cache():
+    """Equal calls hit the cache; a different filter or top_k does not."""
+    retriever = StubRetriever(["doc-a", "doc-b"])
+    ensemble = EnsembleRetrieverAdapter([retriever], cache_max_size=8)
+    query = Query.create("query")
+
+    first = await ensemble.retrieve(query, top_k=2, filter_metadata={"a": 1, "b": 2})
+    second = await ensemble.retrieve(query, top_k=2, filter_metadata={"b": 2, "a": 1})
+    assert retriever.calls == 1
+    assert _document_ids(second) == _document_ids(first)
+
+    await ensemble.retrieve(query, top_k=2, filter_metadata={"a": 2})
+    await ensemble.retrieve(query, top_k=1, filter_metadata={"a": 1, "b": 2})
+    assert retriever.calls == 3
+
+
+async def test_cache_is_cleared_when_the_ensemble_changes():
+    """Changing retrievers or weights, or clear_cache(), drops cached results."""
+    retriever = StubRetriever(["doc-a"])
+    ensemble = EnsembleRetrieverAdapter([retriever], cache_max_size=8)
+    query = Query.create("query")
+
+    await ensemble.retrieve(query)
+    ensemble.clear_cache()
+    await ensemble.retrieve(query)
+    assert retriever.calls == 2
+
+    ensemble.add_retriever(StubRetriever(["doc-b"]))
+    await ensemble.retrieve(query)
+    assert retriever.calls == 3
+
+
+async def test_cached_results_expire_after_ttl(monkeypatch):
+    """Results older than cache_ttl_seconds are fetched again."""
+    now = [100.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+    retriever = StubRetriever(["doc-a"])
+    ensemble = EnsembleRetrieverAdapter([retriever], cache_max_size=8, cache_ttl_seconds=10)
+    query = Query.create("query")
+
+    await ensemble.retrieve(query)
+    now[0] += 5
+    await ensemble.retrieve(query)
+    assert retriever.calls == 1
+
+    now[0] += 6
+    await ensemble.retrieve(query)
+    assert retriever.calls == 2
+
+
+async def test_cache_is_disabled_by_default():
+    """Without cache_max_size every call reaches the retrievers."""
+    retriever = StubRetriever(["doc-a"])
+    ensemble = EnsembleRetrieverAdapter([retriever])
+
+    await ensemble.retrieve(Query.create("query"))
+    await ensemble.retrieve(Query.create("query"))
+
+    assert retriever.calls == 2
+
+
+async def test_partial_results_are_not_cached():
+    """A fusion missing a failed or timed-out retriever is returned but not cached."""
+    fast = StubRetriever(["doc-a"])
+    slow = StubRetriever(["doc-b"], delay=10)
+    ensemble = EnsembleRetrieverAdapter([fast, slow], retrieve_deadline_ms=50, cache_max_size=8)
+    query = Query.create("query")
+
+    assert _document_ids(await ensemble.retrieve(query)) == ["doc-a"]
+    slow.delay = 0
+    results = await ensemble.retrieve(query)
+    assert sorted(_document_ids(results)) == ["doc-a", "doc-b"]
+    assert fast.calls == 2
+
+    await ensemble.retrieve(query)
+    assert fast.calls == 2
@@ -0,0 +1,184 @@
+"""
+Tests for the FAISS vector store adapter: sharding, IVF-PQ conversion, persistence and search batching.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.vector_store import faiss_vector_store
+from adapters.vector_store.faiss_vector_store import FaissVectorStoreAdapter
+from core.entities.document import Embedding
+
+
+COLLECTION = "test_collection"
+DIMENSION = 8
+
+
+def _embeddings(count: int, seed: int = 0) -> list:
+    """Random unit vectors, one embedding per document."""
+    vectors = np.random.default_rng(seed).standard_normal((count, DIMENSION)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return [
+        Embedding.create(
+            document_id=f"doc-{i}",
+            vector=vector.tolist(),
+            model="test-model",
+            chunk_id=f"doc-{i}_chunk_0",
+            metadata={"content": f"content of doc-{i}"}
+        )
+        for i, vector in enumerate(vectors)
+    ]
+
+
+async def test_persisted_collection_reloads_memory_mapped(tmp_path):
+    """A persisted collection reopens read-only via mmap and becomes writable on the first add."""
+    embeddings = _embeddings(20)
+    writer = FaissVectorStoreAdapter(storage_path=str(tmp_path), persist=True)
+    assert await writer.create_collection(COLLECTION, DIMENSION, quantization="fp32", shards=2)
+    assert await writer.add_embeddings(embeddings, COLLECTION)
+    await writer.flush()
+
+    reader = FaissVectorStoreAdapter(storage_path=str(tmp_path), persist=True)
+    assert await reader.load_collection(COLLECTION)
+    assert reader.collections[COLLECTION]['read_only']
+    assert await reader.count_embeddings(COLLECTION) == 20
+    results = await reader.search_similar(embeddings[3].vector, COLLECTION, top_k=1)
+    assert results[0].document_id == "doc-3"
+    stored = await reader.get_embeddings_by_document("doc-5", COLLECTION)
+    assert [embedding.id for embedding in stored] == [embeddings[5].id]
+
+    assert await reader.add_embeddings(_embeddings(1, seed=1), COLLECTION)
+    assert not reader.collections[COLLECTION]['read_only']
+    await reader.flush(COLLECTION)
+
+    reloaded = FaissVectorStoreAdapter(storage_path=str(tmp_path))
+    assert await reloaded.load_collection(COLLECTION, mmap=False)
+    assert await reloaded.count_embeddings(COLLECTION) == 21
+    assert not await reloaded.load_collection("missing")
+
+
+async def test_persist_coalesces_writes_into_one_flush(tmp_path):
+    """Consecutive writes mark the collection dirty and are saved by a single background flush."""
+    adapter = FaissVectorStoreAdapter(storage_path=str(tmp_path), persist=True, persist_delay_ms=50)
+    assert await adapter.create_collection(COLLECTION, DIMENSION, quantization="fp32")
+
+    writes = []
+    write_collection = adapter._write_collection
+
+    async def recording_write_collection(collection_name, collection):
+        writes.append(collection_name)
+        await write_collection(collection_name, collection)
+
+    adapter._write_collection = recording_write_collection
+    for embedding in _embeddings(5):
+        assert await adapter.add_embedding(embedding, COLLECTION)
+    assert writes == []
+
+    await adapter.flush()
+    assert len(writes) == 1
+
+    reloaded = FaissVectorStoreAdapter(storage_path=str(tmp_path))
+    assert await reloaded.load_collection(COLLECTION)
+    assert await reloaded.count_embeddings(COLLECTION) == 5
+    assert len(reloaded.metadata_storage[COLLECTION]) == 5
+
+    assert await adapter.delete_collection(COLLECTION)
+    assert not list(tmp_path.iterdir())
+
+
+async def test_ivfpq_collection_converts_after_threshold(tmp_path, monkeypatch):
+    """An "ivfpq" collection stays HNSW below the threshold and is rebuilt as IVF-PQ above it."""
+    monkeypatch.setitem(faiss_vector_store._IVFPQ_THRESHOLDS, "ivfpq", 300)
+    embeddings = _embeddings(400)
+    adapter = FaissVectorStoreAdapter(storage_path=str(tmp_path))
+    assert await adapter.create_collection(COLLECTION, DIMENSION, index_type="ivfpq")
+
+    assert await adapter.add_embeddings(embeddings[:200], COLLECTION)
+    assert (await adapter.get_collection_info(COLLECTION))["index_type"] == "HNSW"
+
+    assert await adapter.add_embeddings(embeddings[200:], COLLECTION)
+    assert (await adapter.get_collection_info(COLLECTION))["index_type"] == "IVFPQ"
+    assert await adapter.count_embeddings(COLLECTION) == 400
+
+    results = await adapter.search_similar(embeddings[250].vector, COLLECTION, top_k=10)
+    assert "doc-250" in [result.document_id for result in results]
+    stored = await adapter.get_embedding(embeddings[10].id, COLLECTION)
+    assert stored.document_id == "doc-10"
+    assert len(stored.vector) == DIMENSION
+
+
+async def test_sharded_collection_spreads_vectors_across_shards(tmp_path):
+    """Vectors are split by ID over the shards and searches and lookups span all of them."""
+    embeddings = _embeddings(60)
+    adapter = FaissVectorStoreAdapter(storage_path=str(tmp_path))
+    assert await adapter.create_collection(COLLECTION, DIMENSION, quantization="fp32", shards=3)
+    assert await adapter.add_embeddings(embeddings, COLLECTION)
+
+    shard_sizes = [shard.ntotal for shard in adapter.collections[COLLECTION]['shards']]
+    assert len(shard_sizes) == 3
+    assert all(shard_sizes) and sum(shard_sizes) == 60
+    assert (await adapter.get_collection_info(COLLECTION))["shards"] == 3
+
+    for embedding in embeddings[:10]:
+        results = await adapter.search_similar(embedding.vector, COLLECTION, top_k=1)
+        assert results[0].document_id == embedding.document_id
+
+    stored = await adapter.get_embedding(embeddings[7].id, COLLECTION)
+    assert np.allclose(stored.vector, embeddings[7].vector, atol=1e-5)
+    assert not await adapter.create_collection("invalid", DIMENSION, shards=0)
+
+
+async def test_batched_search_rejects_wrong_dimension_alone(tmp_path):
+    """A query with the wrong dimension fails by itself instead of failing its whole batch."""
+    embeddings = _embeddings(10)
+    adapter = FaissVectorStoreAdapter(storage_path=str(tmp_path), search_batch_window_ms=5)
+    assert await adapter.create_collection(COLLECTION, DIMENSION, quantization="fp32")
+    assert await adapter.add_embeddings(embeddings, COLLECTION)
+
+    good, bad = await asyncio.gather(
+        adapter.search_similar(embeddings[2].vector, COLLECTION, top_k=1),
+        adapter.search_similar([1.0, 0.0], COLLECTION, top_k=1)
+    )
+
+    assert [result.document_id for result in good] == ["doc-2"]
+    assert bad == []
+
+
+async def test_cancelled_search_batch_cancels_waiting_searches(tmp_path):
+    """Searches waiting on a batch task that is cancelled are cancelled instead of hanging."""
+    embeddings = _embeddings(10)
+    adapter = FaissVectorStoreAdapter(
+        storage_path=str(tmp_path), search_batch_window_ms=10_000, search_batch_max_size=2
+    )
+    assert await adapter.create_collection(COLLECTION, DIMENSION, quantization="fp32")
+    assert await adapter.add_embeddings(embeddings, COLLECTION)
+
+    searches = [
+        asyncio.ensure_future(adapter.search_similar(embedding.vector, COLLECTION, top_k=1))
+        for embedding in embeddings[:2]
+    ]
+    while not adapter._search_batch_tasks:
+        await asyncio.sleep(0)
+    for task in list(adapter._search_batch_tasks):
+        task.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*searches, return_exceptions=True), timeout=1)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+def test_construction_keeps_process_omp_threads(tmp_path):
+    """The OpenMP thread count is only changed when omp_threads is passed."""
+    threads = faiss.omp_get_max_threads()
+    FaissVectorStoreAdapter(storage_path=str(tmp_path))
+    assert faiss.omp_get_max_threads() == threads
+
+    FaissVectorStoreAdapter(storage_path=str(tmp_path), omp_threads=1)
+    assert faiss.omp_get_max_threads() == 1
+    faiss.omp_set_num_threads(threads)
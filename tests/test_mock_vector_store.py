@@ -0,0 +1,52 @@
+"""
+Tests for MockVectorStoreAdapter brute-force search.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.vector_store.mock_vector_store import MockVectorStoreAdapter
+from core.entities.document import Embedding
+
+
+async def test_search_skips_vectors_with_other_dimensions():
+    """Empty or wrong-sized stored vectors are skipped instead of failing the search."""
+    vector_store = MockVectorStoreAdapter()
+    collection = "mock_store_mixed_dimensions"
+    await vector_store.create_collection(collection, 3)
+    await vector_store.add_embeddings([
+        Embedding.create("good", [1.0, 0.0, 0.0], "mock-embedding", chunk_id="good-0"),
+        Embedding.create("empty", [], "mock-embedding", chunk_id="empty-0"),
+        Embedding.create("short", [1.0, 0.0], "mock-embedding", chunk_id="short-0"),
+        Embedding.create("other", [0.0, 1.0, 0.0], "mock-embedding", chunk_id="other-0"),
+    ], collection)
+
+    results = await vector_store.search_similar([1.0, 0.0, 0.0], collection, top_k=10)
+    assert [result.chunk_id for result in results] == ["good-0", "other-0"]
+    assert results[0].score > 0.99
+
+    results = await vector_store.search_similar([1.0, 0.0], collection, top_k=10)
+    assert [result.chunk_id for result in results] == ["short-0"]
+
+    filtered = await vector_store.search_similar(
+        [1.0, 0.0, 0.0], collection, top_k=10, filter_metadata={"missing": "value"}
+    )
+    assert filtered == []
+
+
+async def test_search_on_empty_store_returns_nothing():
+    """An empty collection, or one without vectors of the query dimension, yields []."""
+    vector_store = MockVectorStoreAdapter()
+    collection = "mock_store_empty"
+    await vector_store.create_collection(collection, 3)
+
+    assert await vector_store.search_similar([1.0, 0.0, 0.0], collection) == []
+    assert await vector_store.search_similar([], collection) == []
+
+    await vector_store.add_embeddings([
+        Embedding.create("empty", [], "mock-embedding", chunk_id="empty-0"),
+    ], collection)
+    assert await vector_store.search_similar([1.0, 0.0, 0.0], collection) == []
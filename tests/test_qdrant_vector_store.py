@@ -0,0 +1,237 @@
+"""
+Tests for the Qdrant vector store adapter against an in-memory Qdrant client.
+"""
+
+import sys
+from pathlib import Path
+
+from qdrant_client import AsyncQdrantClient
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.vector_store.qdrant_vector_store import QdrantVectorStoreAdapter, create_qdrant_adapter
+from adapters.vector_store.qdrant_email_adapter import QdrantEmailVectorStoreAdapter, create_qdrant_email_adapter
+from core.entities.document import Embedding
+
+
+COLLECTION = "test_collection"
+
+
+def _memory_adapter(adapter_class=QdrantVectorStoreAdapter, **kwargs) -> QdrantVectorStoreAdapter:
+    """Create an adapter whose client runs Qdrant in-process."""
+    adapter = adapter_class(**kwargs)
+    adapter.client = AsyncQdrantClient(":memory:")
+    return adapter
+
+
+def _embedding(document_id: str, vector, **metadata) -> Embedding:
+    return Embedding.create(
+        document_id=document_id,
+        vector=vector,
+        model="test-model",
+        chunk_id=f"{document_id}_chunk_0",
+        metadata={"content": f"content of {document_id}", **metadata}
+    )
+
+
+def test_default_construction():
+    """The adapter and its factory can be built with default arguments."""
+    assert isinstance(QdrantVectorStoreAdapter().client, AsyncQdrantClient)
+    assert isinstance(create_qdrant_adapter().client, AsyncQdrantClient)
+
+
+async def test_search_similar_returns_nearest_embedding():
+    """search_similar ranks stored embeddings by similarity to the query."""
+    adapter = _memory_adapter()
+    assert await adapter.add_embeddings([
+        _embedding("doc-x", [1.0, 0.0, 0.0]),
+        _embedding("doc-y", [0.0, 1.0, 0.0]),
+        _embedding("doc-z", [0.0, 0.0, 1.0]),
+    ], COLLECTION)
+
+    results = await adapter.search_similar([0.1, 0.9, 0.0], COLLECTION, top_k=2)
+
+    assert [result.document_id for result in results] == ["doc-y", "doc-x"]
+    assert results[0].content == "content of doc-y"
+    assert results[0].score > results[1].score
+
+
+def test_email_adapter_default_construction():
+    """The email adapter factory works without pool sizing."""
+    adapter = create_qdrant_email_adapter()
+    assert isinstance(adapter, QdrantEmailVectorStoreAdapter)
+    assert adapter.get_store_type() == "qdrant_email"
+
+
+async def test_bulk_load_uploads_through_client():
+    """bulk_load hands every point to the client's uploader with indexing paused."""
+    adapter = _memory_adapter()
+    assert await adapter.create_collection(COLLECTION, 3)
+
+    upload_calls = []
+    threshold_updates = []
+    upload_points = adapter.client.upload_points
+    update_collection = adapter.client.update_collection
+
+    def recording_upload_points(**kwargs):
+        points = list(kwargs.pop("points"))
+        upload_calls.append((points, kwargs))
+        return upload_points(points=points, **kwargs)
+
+    async def recording_update_collection(**kwargs):
+        threshold_updates.append(kwargs["optimizers_config"].indexing_threshold)
+        return await update_collection(**kwargs)
+
+    adapter.client.upload_points = recording_upload_points
+    adapter.client.update_collection = recording_update_collection
+
+    embeddings = [_embedding(f"doc-{i}", [1.0, float(i), 0.5]) for i in range(20)]
+    assert await adapter.bulk_load(embeddings, COLLECTION, parallel=1, batch_size=8)
+
+    assert len(upload_calls) == 1
+    points, kwargs = upload_calls[0]
+    assert len(points) == 20
+    assert kwargs["collection_name"] == COLLECTION
+    assert kwargs["batch_size"] == 8
+    assert threshold_updates == [0, QdrantVectorStoreAdapter.INDEXING_THRESHOLD]
+    assert await adapter.count_embeddings(COLLECTION, exact=True) == 20
+
+
+async def test_search_similar_batch_matches_single_searches():
+    """search_similar_batch returns one result list per query, in query order."""
+    adapter = _memory_adapter(search_cache_max_size=0)
+    assert await adapter.add_embeddings([
+        _embedding("doc-x", [1.0, 0.0, 0.0]),
+        _embedding("doc-y", [0.0, 1.0, 0.0]),
+        _embedding("doc-z", [0.0, 0.0, 1.0]),
+    ], COLLECTION)
+    queries = [[0.0, 0.2, 0.9], [0.9, 0.1, 0.0]]
+
+    batch_results = await adapter.search_similar_batch(queries, COLLECTION, top_k=2)
+    single_results = [await adapter.search_similar(query, COLLECTION, top_k=2) for query in queries]
+
+    assert [[r.document_id for r in results] for results in batch_results] == [["doc-z", "doc-y"], ["doc-x", "doc-y"]]
+    assert [[r.document_id for r in results] for results in batch_results] == \
+        [[r.document_id for r in results] for results in single_results]
+    assert await adapter.search_similar_batch([], COLLECTION) == []
+
+
+async def test_search_cache_is_invalidated_by_writes():
+    """Repeated searches are served from the cache until the collection is written to."""
+    adapter = _memory_adapter()
+    assert await adapter.add_embeddings([
+        _embedding("doc-x", [1.0, 0.0, 0.0]),
+        _embedding("doc-y", [0.0, 1.0, 0.0]),
+    ], COLLECTION)
+
+    query_calls = []
+    query_points = adapter.client.query_points
+
+    async def recording_query_points(**kwargs):
+        query_calls.append(kwargs["collection_name"])
+        return await query_points(**kwargs)
+
+    adapter.client.query_points = recording_query_points
+    query = [0.0, 0.1, 0.9]
+
+    first = await adapter.search_similar(query, COLLECTION, top_k=1)
+    second = await adapter.search_similar(query, COLLECTION, top_k=1)
+    assert len(query_calls) == 1
+    assert [r.document_id for r in first] == [r.document_id for r in second] == ["doc-y"]
+
+    assert await adapter.add_embeddings([_embedding("doc-z", [0.0, 0.0, 1.0])], COLLECTION)
+    results = await adapter.search_similar(query, COLLECTION, top_k=1)
+    assert len(query_calls) == 2
+    assert [r.document_id for r in results] == ["doc-z"]
+
+    adapter.clear_search_cache()
+    await adapter.search_similar(query, COLLECTION, top_k=1)
+    assert len(query_calls) == 3
+
+
+async def test_filtered_search_matches_flattened_metadata():
+    """filter_metadata keys match metadata stored at the top level of the payload."""
+    adapter = _memory_adapter()
+    assert await adapter.add_embeddings([
+        _embedding("doc-x", [1.0, 0.0, 0.0], category="news"),
+        _embedding("doc-y", [0.9, 0.1, 0.0], category="mail"),
+        _embedding("doc-z", [0.8, 0.2, 0.0], category="news"),
+    ], COLLECTION)
+    query = [1.0, 0.0, 0.0]
+
+    news = await adapter.search_similar(query, COLLECTION, filter_metadata={"category": "news"})
+    assert [r.document_id for r in news] == ["doc-x", "doc-z"]
+    assert all(r.metadata["category"] == "news" for r in news)
+
+    by_document = await adapter.search_similar(query, COLLECTION, filter_metadata={"document_id": "doc-y"})
+    assert [r.document_id for r in by_document] == ["doc-y"]
+
+    batch = await adapter.search_similar_batch([query], COLLECTION, filter_metadata={"category": "mail"})
+    assert [[r.document_id for r in results] for results in batch] == [["doc-y"]]
+
+
+async def test_nested_bulk_load_mode_toggles_indexing_once():
+    """Nested bulk_load_mode blocks pause indexing once and restore it when the outermost exits."""
+    adapter = _memory_adapter()
+    assert await adapter.create_collection(COLLECTION, 3)
+
+    threshold_updates = []
+    update_collection = adapter.client.update_collection
+
+    async def recording_update_collection(**kwargs):
+        threshold_updates.append(kwargs["optimizers_config"].indexing_threshold)
+        return await update_collection(**kwargs)
+
+    adapter.client.update_collection = recording_update_collection
+
+    async with adapter.bulk_load_mode(COLLECTION):
+        async with adapter.bulk_load_mode(COLLECTION):
+            assert threshold_updates == [0]
+        assert threshold_updates == [0]
+    assert threshold_updates == [0, QdrantVectorStoreAdapter.INDEXING_THRESHOLD]
+
+    try:
+        async with adapter.bulk_load_mode(COLLECTION):
+            raise RuntimeError("ingest failed")
+    except RuntimeError:
+        pass
+    assert threshold_updates[-2:] == [0, QdrantVectorStoreAdapter.INDEXING_THRESHOLD]
+    assert adapter._bulk_depth == {}
+
+
+async def _email_adapter_with(count: int) -> QdrantEmailVectorStoreAdapter:
+    adapter = _memory_adapter(QdrantEmailVectorStoreAdapter)
+    assert await adapter.add_embeddings([
+        _embedding(f"email-{i}", [1.0, float(i), 0.0], email_id=f"email-{i}") for i in range(count)
+    ], COLLECTION)
+    return adapter
+
+
+async def test_email_keyset_pages_cover_collection_once():
+    """Following next_page_offset visits every email embedding exactly once."""
+    adapter = await _email_adapter_with(25)
+
+    pages = []
+    page_token = None
+    while True:
+        page, page_token = await adapter.get_embeddings_page(COLLECTION, page_size=10, page_token=page_token)
+        pages.append(page)
+        if page_token is None:
+            break
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    document_ids = [embedding.document_id for page in pages for embedding in page]
+    assert sorted(document_ids) == sorted(f"email-{i}" for i in range(25))
+    assert pages[0][0].metadata["email_id"] == pages[0][0].document_id
+
+
+async def test_email_iter_embeddings_streams_prefetched_pages():
+    """iter_embeddings yields every embedding across prefetched pages, without vectors by default."""
+    adapter = await _email_adapter_with(25)
+
+    embeddings = [embedding async for embedding in adapter.iter_embeddings(COLLECTION, page_size=7)]
+
+    assert sorted(embedding.document_id for embedding in embeddings) == sorted(f"email-{i}" for i in range(25))
+    assert all(not embedding.vector for embedding in embeddings)
+    assert len(await adapter.get_all_embeddings(COLLECTION, limit=12)) == 12
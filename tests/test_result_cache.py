@@ -0,0 +1,68 @@
+"""
+Tests for the shared TTL-bounded LRU result cache.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.vector_store import result_cache
+from adapters.vector_store.result_cache import ResultCache, filter_key
+
+
+def test_lru_eviction_keeps_recently_used_entries():
+    """Overflow evicts the least recently used key, not the oldest inserted one."""
+    cache = ResultCache(max_size=2)
+    cache.put("a", [1])
+    cache.put("b", [2])
+    assert cache.get("a") == [1]
+
+    cache.put("c", [3])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1]
+    assert cache.get("c") == [3]
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    """Entries older than ttl_seconds are treated as misses and removed."""
+    now = [100.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+    cache = ResultCache(max_size=4, ttl_seconds=10)
+    cache.put("a", [1])
+
+    now[0] += 5
+    assert cache.get("a") == [1]
+    now[0] += 6
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cached_lists_are_copies():
+    """Mutating stored or returned lists does not change the cached entry."""
+    cache = ResultCache(max_size=4)
+    results = [1, 2]
+    cache.put("a", results)
+    results.append(3)
+    cache.get("a").append(4)
+
+    assert cache.get("a") == [1, 2]
+
+
+def test_zero_max_size_disables_cache():
+    """A cache with max_size 0 is falsy and stores nothing."""
+    cache = ResultCache(max_size=0)
+    cache.put("a", [1])
+
+    assert not cache
+    assert cache.get("a") is None
+
+
+def test_filter_key_ignores_key_order():
+    """Equal filters produce equal keys regardless of insertion order."""
+    assert filter_key({"a": 1, "b": 2}) == filter_key({"b": 2, "a": 1})
+    assert filter_key({"a": 1}) != filter_key({"a": 2})
+    assert filter_key(None) is None
+    assert filter_key({}) is None
@@ -0,0 +1,131 @@
+"""
+Tests for SimpleRetrieverAdapter document similarity and query embedding cache.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.vector_store.mock_vector_store import MockVectorStoreAdapter
+from adapters.vector_store.simple_retriever import SimpleRetrieverAdapter
+from core.entities.document import Embedding, Query
+
+
+COLLECTION = "simple_retriever_test"
+
+VECTORS = {
+    "ref-0": ("ref", [1.0, 0.0, 0.0]),
+    "ref-1": ("ref", [0.0, 1.0, 0.0]),
+    "solo-0": ("solo", [0.0, 0.0, 1.0]),
+    "a-0": ("a", [0.9, 0.1, 0.1]),
+    "b-0": ("b", [0.1, 0.9, 0.2]),
+    "c-0": ("c", [0.6, 0.6, 0.3]),
+}
+
+
+class MockEmbeddingModel:
+    """Embeds every text as the same vector and counts embedding calls."""
+
+    def __init__(self):
+        self.query_calls = []
+        self.batch_calls = []
+
+    def get_model_name(self):
+        return "mock-embedding"
+
+    def get_dimension(self):
+        return 3
+
+    def is_available(self):
+        return True
+
+    async def embed_query(self, text):
+        self.query_calls.append(text)
+        return [1.0, 0.0, 0.0]
+
+    async def embed_texts(self, texts):
+        self.batch_calls.append(list(texts))
+        return [[1.0, 0.0, 0.0] for _ in texts]
+
+
+async def _retriever() -> SimpleRetrieverAdapter:
+    vector_store = MockVectorStoreAdapter()
+    await vector_store.create_collection(COLLECTION, 3)
+    await vector_store.add_embeddings([
+        Embedding.create(document_id, vector, "mock-embedding", chunk_id=chunk_id)
+        for chunk_id, (document_id, vector) in VECTORS.items()
+    ], COLLECTION)
+    retriever = SimpleRetrieverAdapter(vector_store, MockEmbeddingModel())
+    retriever.set_collection_name(COLLECTION)
+    return retriever
+
+
+def _best_similarity(chunk_id: str, reference_chunks) -> float:
+    """Highest cosine similarity between a chunk and any reference chunk."""
+    vector = np.array(VECTORS[chunk_id][1])
+    return max(
+        float(vector @ np.array(VECTORS[ref][1]) / (np.linalg.norm(vector) * np.linalg.norm(VECTORS[ref][1])))
+        for ref in reference_chunks
+    )
+
+
+async def test_similar_documents_report_best_chunk_similarity():
+    """Multi-chunk references are ordered by RRF but scored by their best chunk similarity."""
+    retriever = await _retriever()
+
+    results = await retriever.retrieve_similar_documents("ref", top_k=3)
+
+    assert {result.document_id for result in results} == {"a", "b", "c"}
+    assert [result.rank for result in results] == [1, 2, 3]
+    for result in results:
+        assert np.isclose(result.score, _best_similarity(result.chunk_id, ["ref-0", "ref-1"]), atol=1e-5)
+
+
+async def test_single_chunk_reference_uses_the_same_score_scale():
+    """A one-chunk reference reports plain similarities, like the multi-chunk path."""
+    retriever = await _retriever()
+
+    results = await retriever.retrieve_similar_documents("solo", top_k=2)
+
+    assert all(result.document_id != "solo" for result in results)
+    for result in results:
+        assert np.isclose(result.score, _best_similarity(result.chunk_id, ["solo-0"]), atol=1e-5)
+
+
+async def test_batch_embeds_only_uncached_queries():
+    """retrieve_batch reuses cached query vectors and embeds the misses once, in one call."""
+    retriever = await _retriever()
+    model = retriever._embedding_model
+    await retriever.retrieve_by_text("cached", top_k=1)
+
+    results = await retriever.retrieve_batch(
+        [Query.create(text) for text in ["cached", "new", "new", "other"]], top_k=1
+    )
+
+    assert len(results) == 4
+    assert model.query_calls == ["cached"]
+    assert model.batch_calls == [["new", "other"]]
+
+    await retriever.retrieve_batch([Query.create("new"), Query.create("other")], top_k=1)
+    await retriever.retrieve_by_text("other", top_k=1)
+    assert model.batch_calls == [["new", "other"]]
+    assert model.query_calls == ["cached"]
+
+
+async def test_single_query_waits_for_a_batched_embedding_in_flight():
+    """A single lookup of a text already being embedded by a batch shares that request."""
+    retriever = await _retriever()
+    model = retriever._embedding_model
+
+    await asyncio.gather(
+        retriever.retrieve_batch([Query.create("shared"), Query.create("batch-only")], top_k=1),
+        retriever.retrieve_by_text("shared", top_k=1)
+    )
+
+    assert model.batch_calls == [["shared", "batch-only"]]
+    assert model.query_calls == []
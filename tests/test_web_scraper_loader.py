@@ -0,0 +1,66 @@
+"""
+Tests for the web scraper loader's HTTP session lifecycle and concurrent loading.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.pdf.web_scraper_loader import WebScraperLoaderAdapter
+
+
+def test_session_is_recreated_for_a_new_event_loop():
+    """A second asyncio.run gets a fresh session instead of one bound to the dead loop."""
+    loader = WebScraperLoaderAdapter()
+
+    async def get_session():
+        return loader._get_session()
+
+    first = asyncio.run(get_session())
+    second = asyncio.run(get_session())
+
+    assert second is not first
+    assert first.closed
+    assert not second.closed
+    asyncio.run(loader.close())
+    assert loader._session is None
+
+
+async def test_session_is_reused_and_closed_by_async_with():
+    """Within one loop the session is shared, and leaving async with closes it."""
+    async with WebScraperLoaderAdapter() as loader:
+        session = loader._get_session()
+        assert loader._get_session() is session
+
+    assert session.closed
+    assert loader._session is None
+
+
+async def test_stopping_iteration_cancels_pending_loads():
+    """Closing iter_multiple_files early cancels the loads that have not finished."""
+    loader = WebScraperLoaderAdapter()
+    started = []
+    cancelled = []
+
+    async def load_from_url(url, metadata=None):
+        started.append(url)
+        try:
+            await asyncio.sleep(0 if url.endswith("/fast") else 10)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return await loader.load_from_bytes(b"<html><body><p>loaded page body text</p></body></html>", url)
+
+    loader.load_from_url = load_from_url
+    urls = ["http://example.com/fast", "http://example.com/slow-1", "http://example.com/slow-2"]
+
+    documents = loader.iter_multiple_files(urls)
+    first = await asyncio.wait_for(documents.__anext__(), timeout=1)
+    await documents.aclose()
+    await asyncio.sleep(0)
+
+    assert first.metadata["filename"] == "http://example.com/fast"
+    assert sorted(cancelled) == ["http://example.com/slow-1", "http://example.com/slow-2"]